@@ -0,0 +1,94 @@
+"""
+Airspeed velocity benchmarks of the cube_browser hot paths.
+
+The benchmarks build synthetic cubes in memory and render with the Agg
+backend, so they run offline and headless.
+
+"""
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+import matplotlib
+matplotlib.use('Agg')
+
+from cf_units import Unit  # noqa: E402
+from iris.coords import DimCoord  # noqa: E402
+from iris.cube import Cube  # noqa: E402
+import numpy as np  # noqa: E402
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+
+def lazy(data):
+    """Wrap the array as a deferred array, for a cube with lazy data."""
+    try:
+        import biggus
+    except ImportError:
+        import dask.array as da
+        result = da.from_array(data, chunks=(1,) + data.shape[1:])
+    else:
+        result = biggus.NumpyArrayAdapter(data)
+    return result
+
+
+def synthetic_cube(shape=(10, 100, 200), dtype=np.float32, lazy_data=False):
+    """
+    Create a global latitude/longitude cube with a leading time dimension,
+    and any other leading dimensions as anonymous model levels.
+
+    Kwargs:
+
+    * shape
+        The cube shape, with latitude and longitude as the last two
+        dimensions and time as the dimension before them.
+
+    * dtype
+        The cube data type.
+
+    * lazy_data
+        Whether the cube data payload is deferred.
+
+    """
+    if len(shape) < 3:
+        emsg = 'Synthetic cube requires at least 3 dimensions, got {}.'
+        raise ValueError(emsg.format(len(shape)))
+    ndim = len(shape)
+    data = np.arange(np.prod(shape), dtype=dtype).reshape(shape)
+    data = lazy(data) if lazy_data else data
+    cube = Cube(data, standard_name='air_temperature', units='K')
+    ny, nx = shape[-2:]
+    lat = DimCoord(np.linspace(-89.5, 89.5, ny), standard_name='latitude',
+                   units='degrees')
+    lon = DimCoord(np.linspace(0.5, 359.5, nx), standard_name='longitude',
+                   units='degrees', circular=True)
+    unit = Unit('hours since 1970-01-01 00:00:00', calendar='gregorian')
+    time = DimCoord(np.arange(shape[-3], dtype=np.float64),
+                    standard_name='time', units=unit)
+    cube.add_dim_coord(lat, ndim - 2)
+    cube.add_dim_coord(lon, ndim - 1)
+    cube.add_dim_coord(time, ndim - 3)
+    for dim in range(ndim - 3):
+        level = DimCoord(np.arange(shape[dim]),
+                         long_name='level_{}'.format(dim))
+        cube.add_dim_coord(level, dim)
+    return cube
+
+
+def patch_widgets():
+    """
+    Patch the ipywidgets used by the Browser, as widgets cannot be created
+    without a running kernel.
+
+    Returns the list of started patchers.
+
+    """
+    names = ['ipywidgets.SelectionSlider', 'ipywidgets.IntSlider',
+             'ipywidgets.VBox', 'ipywidgets.HBox', 'ipywidgets.Label',
+             'IPython.display.display']
+    patchers = [mock.patch(name) for name in names]
+    for patcher in patchers:
+        patcher.start()
+    return patchers
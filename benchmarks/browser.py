@@ -0,0 +1,57 @@
+"""Benchmarks of cube_browser.Browser construction."""
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+from cube_browser import Browser, Contour
+
+from . import patch_widgets, synthetic_cube
+
+
+class Sliders(object):
+    """Browser.__init__ slider construction against axis length."""
+    params = [10, 1000, 100000]
+    param_names = ['axis_length']
+
+    def setup(self, axis_length):
+        self.patchers = patch_widgets()
+        cube = synthetic_cube((axis_length, 4, 8))
+        self.plot = Contour(cube, None)
+
+    def teardown(self, axis_length):
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def time_init(self, axis_length):
+        Browser(self.plot)
+
+    def time_init_selection(self, axis_length):
+        Browser(self.plot, max_options=axis_length)
+
+
+class BuildMappings(object):
+    """Browser._build_mappings with many plots."""
+    params = ([1, 10, 100], [False, True])
+    param_names = ['nplots', 'shared_cube']
+
+    def setup(self, nplots, shared_cube):
+        self.patchers = patch_widgets()
+        shape = (5, 10, 4, 8)
+        cube = synthetic_cube(shape)
+        plots = []
+        for _ in range(nplots):
+            if not shared_cube:
+                cube = synthetic_cube(shape)
+            plots.append(Contour(cube, None))
+        self.browser = Browser(plots)
+
+    def teardown(self, nplots, shared_cube):
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def time_build_mappings(self, nplots, shared_cube):
+        browser = self.browser
+        browser._axis_by_name = {}
+        browser._cache_by_cube_id = {}
+        browser._names_by_plot_id = {}
+        browser._plots_by_name = {}
+        browser._build_mappings()
@@ -0,0 +1,28 @@
+"""Benchmarks of cube_browser.explorer.Explorer."""
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+from cube_browser.explorer import Explorer
+
+from . import mock, synthetic_cube
+
+
+class UpdateCubesList(object):
+    """Explorer.update_cubes_list with many cubes."""
+    params = [10, 100, 1000]
+    param_names = ['ncubes']
+
+    def setup(self, ncubes):
+        cube = synthetic_cube((2, 4, 8))
+        cubes = []
+        for i in range(ncubes):
+            other = cube.copy()
+            other.rename('cube_{}'.format(i))
+            cubes.append(other)
+        # Widgets cannot be created without a running kernel, so
+        # exercise the method against stand-in plot controls.
+        self.explorer = mock.Mock(_cubes=cubes,
+                                  plot_controls=[mock.Mock(), mock.Mock()])
+
+    def time_update_cubes_list(self, ncubes):
+        Explorer.update_cubes_list(self.explorer)
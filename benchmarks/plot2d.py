@@ -0,0 +1,98 @@
+"""Benchmarks of cube_browser.Plot2D slicing and drawing."""
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from cube_browser import Contour, Contourf, Pcolormesh, Plot2D
+
+from . import synthetic_cube
+
+
+class _NoDraw(Plot2D):
+    def draw(self, cube):
+        return cube
+
+
+class Call(object):
+    """Plot2D.__call__ slicing, realisation and caching, without drawing."""
+    params = ([(24, 180, 360), (24, 721, 1440)],
+              [np.float32, np.float64],
+              [False, True])
+    param_names = ['shape', 'dtype', 'lazy']
+
+    def setup(self, shape, dtype, lazy):
+        self.cube = synthetic_cube(shape, dtype=dtype, lazy_data=lazy)
+
+    def time_call_miss(self, shape, dtype, lazy):
+        plot = _NoDraw(self.cube, None)
+        for index in range(shape[0]):
+            plot(time=index)
+
+    def time_call_hit(self, shape, dtype, lazy):
+        plot = _NoDraw(self.cube, None)
+        plot(time=0)
+        for _ in range(shape[0]):
+            plot(time=0)
+
+
+def _clear_caches(plot):
+    """Discard the cached slices and contour geometry of the plot."""
+    plot.cache.clear()
+    geometry_cache = getattr(plot, 'geometry_cache', None)
+    if geometry_cache is not None:
+        geometry_cache.clear()
+
+
+class Draw(object):
+    """
+    The uncached draw of each plot type, under the Agg backend.
+
+    Each sample draws every slice once, from empty slice and geometry
+    caches.
+
+    """
+    params = ([Pcolormesh, Contour, Contourf],
+              [(4, 180, 360), (4, 721, 1440)])
+    param_names = ['plot_type', 'shape']
+    number = 1
+
+    def setup(self, plot_type, shape):
+        self.cube = synthetic_cube(shape)
+        self.figure = plt.figure()
+        self.axes = self.figure.add_subplot(111)
+        self.plot = plot_type(self.cube, self.axes)
+        # Render the first slice, to fix the colour limits or levels.
+        self.plot(time=0)
+        self.plot.clear()
+        _clear_caches(self.plot)
+
+    def teardown(self, plot_type, shape):
+        plt.close(self.figure)
+
+    def time_draw(self, plot_type, shape):
+        for index in range(shape[0]):
+            self.plot(time=index)
+            self.plot.clear()
+
+    def time_draw_and_render(self, plot_type, shape):
+        for index in range(shape[0]):
+            self.plot(time=index)
+            self.figure.canvas.draw()
+            self.plot.clear()
+
+
+class CachedDraw(Draw):
+    """
+    The draw of each plot type from warm slice and geometry caches, as
+    when revisiting slices.
+
+    """
+    # Repeat draws within each sample, as the caches stay warm.
+    number = 0
+
+    def setup(self, plot_type, shape):
+        super(CachedDraw, self).setup(plot_type, shape)
+        # Visit every slice, to warm the caches.
+        self.time_draw(plot_type, shape)
@@ -3,8 +3,10 @@ from six.moves import (filter, input, map, range, zip)  # noqa
 import six
 
 from collections import Iterable, namedtuple, OrderedDict
+import functools
+import itertools
+import numbers
 import warnings
-from weakref import WeakValueDictionary
 
 import IPython
 from IPython.display import set_matplotlib_formats
@@ -13,7 +15,29 @@ import ipywidgets
 import iris
 from iris.coords import Coord, DimCoord
 import iris.plot as iplt
+from matplotlib.axes import Axes
 import matplotlib.pyplot as plt
+import numpy as np
+
+from cube_browser.blit import Blitter
+from cube_browser.cache import SliceCache
+from cube_browser.contour import (GEOMETRY_REUSE, CachedContourSet,
+                                  ContourGeometry, contour_geometry)
+from cube_browser.export import (figure_definition, render_frames,
+                                 write_frames)
+from cube_browser.grids import grid_data, grid_key, project_grid
+from cube_browser.limits import (DEFAULT_NLEVELS, MODES as LIMITS_MODES,
+                                 cube_limits, submit as submit_limits)
+from cube_browser.lod import (METHODS as LOD_METHODS, decimate, plot_dims,
+                              screen_factors)
+from cube_browser.pipeline import RenderPipeline
+from cube_browser.player import Player
+from cube_browser.prefetch import Prefetcher
+from cube_browser.scheduler import Scheduler, _call_soon
+from cube_browser.shared import mapped
+from cube_browser.slicing import LazySlicer, merge_indices
+from cube_browser.stats import Stats, span
+from cube_browser.workers import process_executor
 
 
 # Cube-browser version.
@@ -85,6 +109,12 @@ class Plot2D(object):
             The cube coordinates, coordinate names or dimension indices
             to plot in the order (x-axis, y-axis).
 
+        * lod
+            The level-of-detail block reduction, one of 'mean', 'max' or
+            'nearest', used to decimate each rendered slice to roughly
+            the display resolution of the axes. Defaults to None, which
+            always renders at full resolution.
+
         * kwargs
             Matplotlib kwargs for plot customization.
 
@@ -103,6 +133,24 @@ class Plot2D(object):
             coords = self._default_coords()
         #: Coordinates/dimensions to use for the plot x-axis and y-axis.
         self.coords = self._check_coords(coords)
+        lod = kwargs.pop('lod', None)
+        if lod is not None and lod not in LOD_METHODS:
+            emsg = '{} requires a level-of-detail method of {}, got {!r}.'
+            methods = ', '.join(map(repr, LOD_METHODS))
+            raise ValueError(emsg.format(type(self).__name__, methods, lod))
+        #: The level-of-detail block reduction method, if any.
+        self.lod = lod
+        # The decimation factors of the latest rendered slice.
+        self._lod_factors = (1, 1)
+        # The axes with connected view limit event handlers.
+        self._lod_axes = None
+        #: An additional integer decimation factor of both plot axes,
+        #: applied on top of any level-of-detail factors, which trades
+        #: quality for rendering cost during playback. Slices are
+        #: coarsened with the :attr:`lod` method, or 'nearest' by default.
+        self.coarsen = 1
+        # Whether the plot is rendering.
+        self._rendering = False
         self.kwargs = kwargs
         # Set of plot axis dimensions.
         self._plot_dims = {c if isinstance(c, int) else
@@ -111,8 +159,23 @@ class Plot2D(object):
         self._slider_dim_by_name = self._sliders_dim()
         # A mapping of dimension alias name to dimension.
         self._dim_by_alias = {}
-        # A weak reference value cache for plot sub-cube sharing.
+        # A least-recently-used cache for plot sub-cube sharing.
         self._cache = None
+        #: The :class:`~cube_browser.slicing.LazySlicer` that reads each
+        #: plot sub-cube from the lazy data payload of the plot cube.
+        self.slicer = LazySlicer(cube)
+        #: Whether to read whole on-disk chunks, caching all the sub-cubes
+        #: of a chunk when any one of them is fetched.
+        self.read_ahead = True
+        #: The :class:`~cube_browser.stats.Stats` that records the timing
+        #: of each rendering stage, if any.
+        self.stats = None
+        #: The prefix of the timing span names of the plot.
+        self.stats_name = type(self).__name__
+        # Mapping of grid key to the plot coordinate grid transformed to
+        # the projection of the axes, for the latest axes projection.
+        self._grids = {}
+        self._grids_projection = None
 
     def _default_coords(self):
         """
@@ -281,15 +344,20 @@ class Plot2D(object):
 
     @property
     def cache(self):
+        """
+        The :class:`~cube_browser.cache.SliceCache` of realised plot
+        sub-cubes, keyed on the slider name and index value pairs.
+
+        """
         if self._cache is None:
-            self._cache = WeakValueDictionary()
+            self._cache = SliceCache()
         return self._cache
 
     @cache.setter
     def cache(self, value):
-        if not isinstance(value, WeakValueDictionary):
+        if not isinstance(value, SliceCache):
             emsg = "Require cache to be a {!r}, got {!r}."
-            raise TypeError(emsg.format(WeakValueDictionary.__name__,
+            raise TypeError(emsg.format(SliceCache.__name__,
                                         type(value).__name__))
         self._cache = value
 
@@ -367,21 +435,11 @@ class Plot2D(object):
             result.append(axis)
         return result
 
-    # XXX: Issue #24
-    def __call__(self, **kwargs):
+    def _index(self, **kwargs):
         """
-        Renders the plot for the given named slider values.
+        Determine the cube index for the given named slider values.
 
-        Kwargs:
-
-            The slider name and associated dimension index value.
-            E.g. ::
-
-                plot(time=5, model_level_number=23)
-
-            The plot cube will be sliced on the associated 'time' and
-            'model_level_number' dimensions at the specified index values
-            before being rendered on its axes.
+        Returns a tuple of the cube index.
 
         """
         index = [slice(None)] * self.cube.ndim
@@ -402,17 +460,328 @@ class Plot2D(object):
                                                   alias_by_dim[dim], dim,
                                                   name))
             index[dim] = value
-        index = tuple(index)
-        key = tuple(sorted(kwargs.items()))
-        # A primative weak reference cache.
-        self.subcube = self.cache.setdefault(key, self.cube[index])
-        return self.draw(self.subcube)
+        return tuple(index)
+
+    @staticmethod
+    def _key(**kwargs):
+        """The cache key for the given named slider values."""
+        return tuple(sorted(kwargs.items()))
+
+    def fetch(self, **kwargs):
+        """
+        Returns the plot sub-cube for the given named slider values,
+        without rendering it.
+
+        The sub-cube is served from the plot :attr:`cache` when available,
+        otherwise the plot cube is lazily sliced by the plot :attr:`slicer`,
+        only the sub-cube data is realised, and the result is cached.
+
+        When :attr:`read_ahead` is enabled and the plot cube is chunked on
+        disk along the slider dimensions, the whole chunk is read instead,
+        and every sub-cube within it is cached.
+
+        Kwargs:
+
+            The slider name and associated dimension index value.
+
+        """
+        index = self._index(**kwargs)
+        key = self._key(**kwargs)
+        subcube = self.cache.get(key)
+        if subcube is None:
+            block = None
+            if self.read_ahead:
+                block = self.slicer.chunk_index(index)
+            if block is not None:
+                subcube = self._read_ahead(block, key, **kwargs)
+        if subcube is None:
+            with self._span('slice'):
+                subcube = self.slicer[index]
+            with self._span('realise'):
+                self.cache.realise(subcube)
+            self.cache[key] = subcube
+        return subcube
+
+    def _read_ahead(self, block, key, **kwargs):
+        """
+        Read the block of whole on-disk chunks containing the sub-cube of
+        the given named slider values, and cache every sub-cube within it.
+
+        Returns the sub-cube of the given named slider values, or None
+        when the block will not fit within the plot :attr:`cache`.
+
+        """
+        if self.slicer.read(block).nbytes > self.cache.max_bytes:
+            return None
+        cube = self._read_block(block)
+        self._cache_block(block, cube, sorted(kwargs))
+        shape = self.cube.shape
+        values = {name: value % shape[self._slider_dim(name)]
+                  for name, value in kwargs.items()}
+        result = self.cache.get(self._key(**values))
+        # Cache the requested sub-cube last, as the most recently used.
+        self.cache[key] = result
+        return result
+
+    def _slider_dim(self, name):
+        """The cube dimension of the named slider or alias."""
+        return self._dim_by_alias.get(name, self._slider_dim_by_name.get(name))
+
+    def _read_block(self, block):
+        """
+        Returns the sub-cube of the block index of the plot cube, with its
+        data realised.
+
+        """
+        with self._span('slice'):
+            cube = self.slicer[block]
+        with self._span('realise'):
+            self.cache.realise(cube)
+        return cube
+
+    def _cache_block(self, block, cube, names):
+        """
+        Cache every sub-cube within the block of the plot cube, for the
+        given slider names, from the realised sub-cube of the block.
+
+        """
+        data = cube.data
+        shared = mapped(data)
+        dims = [self._slider_dim(name) for name in names]
+        ranges = [range(block[dim].start, block[dim].stop) for dim in dims]
+        for values in itertools.product(*ranges):
+            key = self._key(**dict(zip(names, values)))
+            if key in self.cache:
+                continue
+            index = [slice(None)] * cube.ndim
+            full = list(block)
+            for dim, value in zip(dims, values):
+                index[dim] = value - block[dim].start
+                full[dim] = value
+            # Slice the lazy plot cube, and copy its data from a private
+            # block, so that the cached sub-cube doesn't keep the whole
+            # block alive beyond the bytes charged to the cache. A block
+            # mapped from a shared cache is viewed instead, as its pages
+            # are shared between processes rather than held privately.
+            subcube = self.cube[tuple(full)]
+            subdata = data[tuple(index)]
+            if not shared:
+                subdata = subdata.copy()
+            subcube.data = subdata
+            self.cache[key] = subcube
+
+    def _span(self, stage):
+        """The timing span context manager for the named rendering stage."""
+        return span(self.stats, '{}.{}'.format(self.stats_name, stage))
+
+    # XXX: Issue #24
+    def __call__(self, **kwargs):
+        """
+        Renders the plot for the given named slider values.
+
+        Kwargs:
+
+            The slider name and associated dimension index value.
+            E.g. ::
+
+                plot(time=5, model_level_number=23)
+
+            The plot cube will be sliced on the associated 'time' and
+            'model_level_number' dimensions at the specified index values
+            before being rendered on its axes.
+
+        """
+        return self._render(self.fetch(**kwargs), **kwargs)
+
+    def _render(self, subcube, **kwargs):
+        """
+        Renders the plot sub-cube of the given named slider values, as
+        returned by :meth:`fetch`.
+
+        """
+        self.subcube = subcube
+        self._rendering = True
+        try:
+            with self._span('draw'):
+                return self.draw(self.subcube)
+        finally:
+            self._rendering = False
+
+    def _screen_factors(self, cube):
+        """
+        The decimation factors that bring the 2d cube to roughly the
+        display resolution of the plot axes.
+
+        """
+        dims = plot_dims(cube, self.coords)
+        shape = [cube.shape[dim] for dim in dims]
+        return screen_factors(self.axes, shape)
+
+    def _factors(self, cube):
+        """
+        The decimation factors of the 2d cube, of its level-of-detail
+        factors, if any, further coarsened by :attr:`coarsen`.
+
+        """
+        factors = (1, 1)
+        if self.lod is not None:
+            factors = self._screen_factors(cube)
+        if self.coarsen > 1:
+            factors = tuple(factor * self.coarsen for factor in factors)
+        return factors
+
+    def _decimate(self, cube):
+        """
+        Decimate the 2d cube to roughly the display resolution of the plot
+        axes, when level-of-detail rendering is enabled, and by any
+        further :attr:`coarsen` factor.
+
+        Returns the cube to render.
+
+        """
+        if self.lod is not None and self._lod_axes is not self.axes:
+            callbacks = self.axes.callbacks
+            callbacks.connect('xlim_changed', self._handle_view)
+            callbacks.connect('ylim_changed', self._handle_view)
+            self._lod_axes = self.axes
+        factors = self._factors(cube)
+        self._lod_factors = factors
+        if factors != (1, 1):
+            with self._span('decimate'):
+                cube = decimate(cube, self.coords, factors,
+                                method=self._lod_method)
+        return cube
+
+    @property
+    def _lod_method(self):
+        """The block reduction method of decimated slices."""
+        return 'nearest' if self.lod is None else self.lod
+
+    def _handle_view(self, axes):
+        """
+        Axes view limit event handler that re-renders the latest slice
+        when zooming changes its level-of-detail.
+
+        """
+        if self._rendering or self.subcube is None or self.element is None:
+            return
+        if self._factors(self.subcube) != self._lod_factors:
+            self._rendering = True
+            try:
+                self.clear()
+                self.draw(self.subcube)
+            finally:
+                self._rendering = False
+            self.axes.figure.canvas.draw_idle()
+
+    def _projected_grid(self, cube, corners=False):
+        """
+        The plot coordinate grid of the 2d cube transformed to the
+        projection of the plot axes, see
+        :func:`~cube_browser.grids.project_grid`.
+
+        The grid is transformed once and reused for every slice, until the
+        projection of the axes changes.
+
+        """
+        projection = getattr(self.axes, 'projection', None)
+        if projection is None:
+            return None
+        key = grid_key(cube, self.coords, projection, corners)
+        if key[0] != self._grids_projection:
+            self._grids = {}
+            self._grids_projection = key[0]
+        if key not in self._grids:
+            with self._span('project'):
+                self._grids[key] = project_grid(cube, self.coords,
+                                                projection, corners=corners)
+        return self._grids[key]
+
+    @property
+    def artists(self):
+        """The matplotlib artists of the latest rendered element."""
+        return [] if self.element is None else [self.element]
 
     def draw(self, cube):
         """Abstract method."""
         emsg = '{!r} requires a draw method for rendering.'
         raise NotImplementedError(emsg.format(type(self).__name__))
 
+    def autoscale(self, mode='robust', percentiles=None, nlevels=None,
+                  background=True, call_soon=None):
+        """
+        Set the colour limits or contour levels of the plot from all the
+        data of the plot cube, rather than from the first rendered slice.
+
+        The data is reduced in a single streaming pass that realises a
+        bounded block at a time, see :func:`cube_browser.limits.reduce_cube`,
+        and the result is cached for each cube.
+
+        Kwargs:
+
+        * mode
+            One of 'minmax', 'robust' or 'histogram', see
+            :meth:`cube_browser.limits.Limits.levels`. Defaults to 'robust'.
+
+        * percentiles
+            The lower and upper percentiles of a robust data range.
+
+        * nlevels
+            The number of contour levels. Defaults to the number of
+            existing contour levels.
+
+        * background
+            Whether to reduce the data in the background, and apply the
+            result to the plot on the event loop when done. Defaults to
+            True.
+
+        * call_soon
+            Callable, safe to call from any thread, that schedules a
+            callback with the given arguments on the event loop. Defaults
+            to the tornado IOLoop of the kernel.
+
+        Returns the :class:`~cube_browser.limits.Limits`, or a
+        :class:`concurrent.futures.Future` of them when in the background.
+
+        """
+        if mode not in LIMITS_MODES:
+            emsg = '{} requires a limits mode of {}, got {!r}.'
+            modes = ', '.join(map(repr, LIMITS_MODES))
+            raise ValueError(emsg.format(type(self).__name__, modes, mode))
+        dims = sorted(self._plot_dims)
+        chunks = self.slicer.chunks
+        if background:
+            if call_soon is None:
+                call_soon = _call_soon()
+            result = submit_limits(self.cube, dims, chunks=chunks)
+            result.add_done_callback(
+                lambda future: call_soon(self._autoscaled, future, mode,
+                                         percentiles, nlevels))
+        else:
+            with self._span('autoscale'):
+                result = cube_limits(self.cube, dims, chunks=chunks)
+            self.apply_limits(result, mode, percentiles, nlevels)
+        return result
+
+    def _autoscaled(self, future, mode, percentiles, nlevels):
+        """Apply the limits of a completed background reduction."""
+        try:
+            limits = future.result()
+        except Exception as exception:
+            wmsg = '{!r} failed to autoscale cube {!r}: {}'
+            warnings.warn(wmsg.format(type(self).__name__, self.cube.name(),
+                                      exception))
+        else:
+            self.apply_limits(limits, mode, percentiles, nlevels)
+            if self.element is not None:
+                self.axes.figure.canvas.draw_idle()
+
+    def apply_limits(self, limits, mode='robust', percentiles=None,
+                     nlevels=None):
+        """Abstract method."""
+        emsg = '{!r} requires an apply_limits method for autoscaling.'
+        raise NotImplementedError(emsg.format(type(self).__name__))
+
     def legend(self, mappable):
 
         fig = plt.gcf()
@@ -453,24 +822,184 @@ class Plot2D(object):
         plt.draw()
 
 
-class Contourf(Plot2D):
+class _ContourPlot(Plot2D):
     """
-    Constructs a filled contour plot instance of a cube.
+    Common behaviour of the line and filled contour plots.
 
-    An :func:`iris.plot.contourf` instance is created using coordinates
-    specified in the input arguments as axes coordinates.
-
-    See :func:`matplotlib.pyplot.contourf` and :func:`iris.plot.contourf`
-    for details of other valid keyword arguments
+    The contour geometry of each rendered slice is cached, so that
+    revisiting a slice re-renders the cached geometry rather than
+    contouring the slice data again.
 
     """
+    #: Whether the plot renders filled contours.
+    filled = False
+
+    def __init__(self, cube, axes, **kwargs):
+        super(_ContourPlot, self).__init__(cube, axes, **kwargs)
+        #: The :class:`~cube_browser.contour.ContourGeometry` of each
+        #: rendered slice, keyed on the slider name and index value pairs
+        #: and the contour levels.
+        self.geometry_cache = SliceCache()
+        # The cache key of the latest fetched plot sub-cube.
+        self._subcube_key = None
+        # The transform of the rendered contours, once known.
+        self._transform = None
+
+    def _geometry_key(self, key):
+        """The geometry cache key for the given sub-cube cache key."""
+        levels = np.asarray(self.kwargs['levels']).tolist()
+        result = (key, tuple(levels))
+        if self._lod_factors != (1, 1):
+            result += (self._lod_factors,)
+        return result
+
+    def _contour_kwargs(self):
+        kwargs = dict(self.kwargs, extend='both')
+        if self.filled:
+            # Consistent with iris.plot.contourf.
+            kwargs.setdefault('antialiased', True)
+        return kwargs
+
+    def _render(self, subcube, **kwargs):
+        self._subcube_key = self._key(**kwargs)
+        return super(_ContourPlot, self)._render(subcube, **kwargs)
+
     def draw(self, cube):
-        self.element = iplt.contourf(cube, axes=self.axes, coords=self.coords,
-                                     extend='both', **self.kwargs)
-        if 'levels' not in self.kwargs:
-            self.kwargs['levels'] = self.element.levels
+        subcube = cube is self.subcube
+        cube = self._decimate(cube)
+        # Whether to cache and reuse the contour geometry of the slice.
+        reuse = subcube and GEOMETRY_REUSE
+        key = None
+        if reuse and 'levels' in self.kwargs:
+            key = self._geometry_key(self._subcube_key)
+        geometry = None
+        if key is not None and self._transform is not None:
+            geometry = self.geometry_cache.get(key)
+        if geometry is None:
+            grid = self._projected_grid(cube)
+            if grid is None:
+                func = iplt.contourf if self.filled else iplt.contour
+                self.element = func(cube, axes=self.axes,
+                                    coords=self.coords, extend='both',
+                                    **self.kwargs)
+            else:
+                # Contour directly on the pre-transformed grid.
+                func = Axes.contourf if self.filled else Axes.contour
+                self.element = func(self.axes, grid.x, grid.y,
+                                    grid_data(cube, self.coords),
+                                    **self._contour_kwargs())
+            if 'levels' not in self.kwargs:
+                self.kwargs['levels'] = self.element.levels
+            self._transform = self.element.get_transform()
+            if reuse:
+                key = self._geometry_key(self._subcube_key)
+                geometry = ContourGeometry.from_contour_set(self.element)
+                self.geometry_cache[key] = geometry
+        else:
+            kwargs = self._contour_kwargs()
+            kwargs.pop('levels')
+            self.element = CachedContourSet(self.axes, geometry,
+                                            filled=self.filled,
+                                            transform=self._transform,
+                                            **kwargs)
         return self.element
 
+    def precompute(self, processes=None, **kwargs):
+        """
+        Calculate the contour geometry of a range of slices in worker
+        processes, ready for rendering.
+
+        The contour levels must be known, either from the plot keyword
+        arguments or from a previous render of the plot.
+
+        Kwargs:
+
+        * processes
+            The number of worker processes. Defaults to the number of
+            processors on the machine. See
+            :func:`~cube_browser.workers.process_executor`.
+
+        * kwargs
+            The slider name and associated dimension index value or
+            iterable of index values. Every combination of the given
+            values is precomputed.
+            E.g. ::
+
+                plot.precompute(time=range(24), model_level_number=3)
+
+        Returns the number of slices that were precomputed, which is
+        always zero when cached geometry cannot be reused with the
+        installed matplotlib, see
+        :data:`~cube_browser.contour.GEOMETRY_REUSE`.
+
+        """
+        if 'levels' not in self.kwargs:
+            emsg = ('{!r} requires contour levels to precompute, either '
+                    'render the plot first or provide the levels.')
+            raise ValueError(emsg.format(type(self).__name__))
+        if not GEOMETRY_REUSE:
+            return 0
+        names = sorted(kwargs)
+        values = []
+        for name in names:
+            value = kwargs[name]
+            values.append(value if isinstance(value, Iterable) else [value])
+        tasks = []
+        for combination in itertools.product(*values):
+            slider = dict(zip(names, combination))
+            key = self._geometry_key(self._key(**slider))
+            if key not in self.geometry_cache:
+                subcube = self.cube[self._index(**slider)]
+                if self._lod_factors != (1, 1):
+                    # Consistent with the level-of-detail of the plot.
+                    subcube = decimate(subcube, self.coords,
+                                       self._lod_factors,
+                                       method=self._lod_method)
+                tasks.append((key, subcube,
+                              self._projected_grid(subcube)))
+        projection = getattr(self.axes, 'projection', None)
+        contour_kwargs = self._contour_kwargs()
+        if tasks:
+            with process_executor(processes) as executor:
+                futures = [(key, executor.submit(contour_geometry, subcube,
+                                                 self.coords, self.filled,
+                                                 projection, contour_kwargs,
+                                                 grid))
+                           for key, subcube, grid in tasks]
+                for key, future in futures:
+                    self.geometry_cache[key] = future.result()
+        return len(tasks)
+
+    def apply_limits(self, limits, mode='robust', percentiles=None,
+                     nlevels=None):
+        """
+        Set the contour levels from the given
+        :class:`~cube_browser.limits.Limits`, re-rendering the latest slice.
+        See :meth:`Plot2D.autoscale`.
+
+        """
+        if nlevels is None:
+            levels = self.kwargs.get('levels')
+            if levels is None:
+                nlevels = DEFAULT_NLEVELS
+            elif isinstance(levels, int):
+                nlevels = levels
+            else:
+                nlevels = len(levels)
+        self.kwargs['levels'] = limits.levels(nlevels, mode, percentiles)
+        if self.subcube is not None and self.element is not None:
+            self._rendering = True
+            try:
+                self.clear()
+                self.draw(self.subcube)
+            finally:
+                self._rendering = False
+
+    @property
+    def artists(self):
+        """The matplotlib artists of the latest rendered element."""
+        return [] if self.element is None else list(self.element.collections)
+
     # XXX: Not sure this should live here!
     #      Need test coverage!
     def clear(self):
@@ -479,7 +1008,21 @@ class Contourf(Plot2D):
                 collection.remove()
 
 
-class Contour(Plot2D):
+class Contourf(_ContourPlot):
+    """
+    Constructs a filled contour plot instance of a cube.
+
+    An :func:`iris.plot.contourf` instance is created using coordinates
+    specified in the input arguments as axes coordinates.
+
+    See :func:`matplotlib.pyplot.contourf` and :func:`iris.plot.contourf`
+    for details of other valid keyword arguments
+
+    """
+    filled = True
+
+
+class Contour(_ContourPlot):
     """
     Constructs a line contour plot instance of a cube.
 
@@ -490,17 +1033,7 @@ class Contour(Plot2D):
     for details of other valid keyword arguments.
 
     """
-    def draw(self, cube):
-        self.element = iplt.contour(cube, axes=self.axes, coords=self.coords,
-                                    extend='both', **self.kwargs)
-        if 'levels' not in self.kwargs:
-            self.kwargs['levels'] = self.element.levels
-        return self.element
-
-    def clear(self):
-        if self.element is not None:
-            for collection in self.element.collections:
-                collection.remove()
+    filled = False
 
 
 class Pcolormesh(Plot2D):
@@ -514,22 +1047,131 @@ class Pcolormesh(Plot2D):
     for details of other valid keyword arguments.
 
     """
-    def draw(self, cube):
+    def __init__(self, cube, axes, **kwargs):
+        super(Pcolormesh, self).__init__(cube, axes, **kwargs)
+        # The plot coordinates of the rendered mesh, used to determine
+        # whether the mesh may be updated in-place.
+        self._grid = None
+        # The cell bounds of each plot coordinate, computed once from the
+        # plot cube and shared by every slice.
+        self._cell_bounds = None
+
+    @property
+    def cell_bounds(self):
+        """
+        Returns a tuple of the cell bounds array of each plot coordinate, in
+        (x-axis, y-axis) order, or None for an anonymous plot dimension.
+
+        Existing coordinate bounds are used as-is, otherwise the bounds are
+        guessed from the coordinate points. The result is calculated on
+        first use only.
+
+        """
+        if self._cell_bounds is None:
+            result = []
+            for name in self.coords:
+                bounds = None
+                if not isinstance(name, int):
+                    coord = self.cube.coord(name)
+                    if not coord.has_bounds():
+                        coord = coord.copy()
+                        coord.guess_bounds()
+                    bounds = coord.bounds
+                result.append(bounds)
+            self._cell_bounds = tuple(result)
+        return self._cell_bounds
+
+    def _grid_of(self, cube):
+        """
+        Returns the plot coordinates of the cube, or the dimension length
+        for an anonymous plot dimension, in (x-axis, y-axis) order.
+
+        """
+        result = []
         for name in self.coords:
+            if isinstance(name, int):
+                result.append(cube.shape[name])
+            else:
+                result.append(cube.coord(name))
+        return tuple(result)
+
+    def _can_update(self, grid):
+        """
+        Determine whether the rendered mesh may be updated in-place with
+        data on the given grid.
+
+        """
+        result = False
+        if self.element is not None and self.element.axes is self.axes:
+            # Cartopy splits meshes that wrap around the globe over two
+            # artists, which cannot be updated independently.
+            wrapped = hasattr(self.element, '_wrapped_collection_fix')
+            result = not wrapped and self._grid == grid
+        return result
+
+    def draw(self, cube):
+        for name, bounds in zip(self.coords, self.cell_bounds):
             if not isinstance(name, int):
                 coord = cube.coord(name)
                 if not coord.has_bounds():
-                    coord.guess_bounds()
-
-        self.element = iplt.pcolormesh(cube, axes=self.axes,
-                                       coords=self.coords, **self.kwargs)
+                    if bounds.shape[:-1] == coord.shape:
+                        coord.bounds = bounds
+                    else:
+                        # Not a slice of the plot cube, so fall back.
+                        coord.guess_bounds()
+
+        cube = self._decimate(cube)
+        grid = self._grid_of(cube)
+        if self._can_update(grid):
+            # Only the data has changed, so reuse the existing mesh.
+            data = cube.data
+            xdim = self.coords[0]
+            if not isinstance(xdim, int):
+                xdim = cube.coord_dims(xdim)[0]
+            if xdim == 0:
+                data = data.T
+            self.element.set_array(data.ravel())
+            self.element.set_visible(True)
+        else:
+            self._remove()
+            mesh = self._projected_grid(cube, corners=True)
+            if mesh is None:
+                self.element = iplt.pcolormesh(cube, axes=self.axes,
+                                               coords=self.coords,
+                                               **self.kwargs)
+            else:
+                # Render directly on the pre-transformed mesh.
+                self.element = Axes.pcolormesh(self.axes, mesh.x, mesh.y,
+                                               grid_data(cube, self.coords),
+                                               **self.kwargs)
+            self._grid = grid
         if 'clim' not in self.kwargs:
             self.kwargs['clim'] = self.element.get_clim()
         return self.element
 
-    def clear(self):
+    def apply_limits(self, limits, mode='robust', percentiles=None,
+                     nlevels=None):
+        """
+        Set the colour limits from the given
+        :class:`~cube_browser.limits.Limits`. See :meth:`Plot2D.autoscale`.
+
+        """
+        clim = limits.range(mode, percentiles)
+        self.kwargs['clim'] = clim
         if self.element is not None:
+            self.element.set_clim(*clim)
+
+    def _remove(self):
+        if self.element is not None and self.element.axes is not None:
             self.element.remove()
+        self.element = None
+        self._grid = None
+
+    def clear(self):
+        # Hide rather than remove the mesh, so that the following draw
+        # may update it in-place when only the data has changed.
+        if self.element is not None:
+            self.element.set_visible(False)
 
 
 class Browser(object):
@@ -541,7 +1183,9 @@ class Browser(object):
     displayed in a Jupyter notebook.
 
     """
-    def __init__(self, plots):
+    def __init__(self, plots, prefetch=0, max_options=1000, max_fps=None,
+                 blit=False, autoscale=None, play_fps=None,
+                 background=False):
         """
         Compiles non-axis coordinates into sliders, the values from which are
         used to reconstruct plots upon movement of slider.
@@ -551,10 +1195,93 @@ class Browser(object):
         * plot
             cube_browser plot instance to display with slider.
 
+        Kwargs:
+
+        * prefetch
+            The number of neighbouring positions either side of each slider
+            to read into the plot caches in the background, after each
+            render. Defaults to 0, which disables prefetching.
+
+        * max_options
+            The maximum length of a slider axis for which every position
+            label is sent to the front end. A longer axis is given an integer
+            indexed slider that only labels its current position.
+            Defaults to 1000.
+
+        * max_fps
+            The maximum rate at which slider changes are rendered. Changes
+            received while a render is pending are coalesced to the latest
+            slider state. Defaults to None, which renders every change as
+            it is received.
+
+        * blit
+            Whether to redraw only the plot data artists over a cached
+            static background of each axes when a slider changes, rather
+            than redrawing the whole figure. Defaults to False.
+
+        * autoscale
+            The mode, one of 'minmax', 'robust' or 'histogram', in which to
+            set the colour limits or contour levels of every plot from all
+            the data of its cube, in the background after the initial
+            render. See :meth:`Plot2D.autoscale`. Defaults to None, which
+            scales each plot from its first rendered slice.
+
+        * play_fps
+            The target frame rate at which to play a slider axis. When
+            given, each slider has a play toggle button, see :meth:`play`.
+            Defaults to None, which provides no play controls.
+
+        * background
+            Whether to slice and realise the plot sub-cubes of each slider
+            change on a worker thread, leaving the kernel event loop free,
+            and draw them on the event loop once they are ready. A slider
+            change supersedes the pending renders of its plots, so only
+            the newest frame of each plot is drawn. Defaults to False.
+
         """
         if not isinstance(plots, Iterable):
             plots = [plots]
         self.plots = plots
+        if prefetch < 0:
+            emsg = '{} requires a non-negative prefetch, got {}.'
+            raise ValueError(emsg.format(type(self).__name__, prefetch))
+        self._prefetch = prefetch
+        if autoscale is not None and autoscale not in LIMITS_MODES:
+            emsg = '{} requires an autoscale mode of {}, got {!r}.'
+            modes = ', '.join(map(repr, LIMITS_MODES))
+            raise ValueError(emsg.format(type(self).__name__, modes,
+                                         autoscale))
+        self._autoscale = autoscale
+        #: The background prefetch engine, when prefetching is enabled.
+        self.prefetcher = Prefetcher() if prefetch else None
+        #: The slider event scheduler, when rate limiting is enabled.
+        self.scheduler = None
+        if max_fps is not None:
+            self.scheduler = Scheduler(self._refresh, max_fps=max_fps)
+        #: The background render pipeline, when background rendering is
+        #: enabled.
+        self.pipeline = RenderPipeline() if background else None
+        #: The slider playback controller, when play controls are enabled.
+        self.player = None
+        if play_fps is not None:
+            self.player = Player(self._play_step, fps=play_fps,
+                                 on_error=self._release_play)
+        # The name of the playing slider, if any.
+        self._playing = None
+        # Whether playback is changing the value of a slider.
+        self._stepping = False
+        #: The plot data artist redraw manager, when blitting is enabled.
+        self.blitter = Blitter(self.plots) if blit else None
+        #: The :class:`~cube_browser.stats.Stats` timing of each slider
+        #: event, and of the slicing, realisation and drawing of each plot.
+        self.stats = Stats()
+        for i, plot in enumerate(self.plots):
+            plot.stats = self.stats
+            plot.stats_name = '{}[{}]'.format(type(plot).__name__, i)
+        # Mapping of canvas-id to the time its plots last changed, used to
+        # record the latency until the canvas is next drawn.
+        self._changed_by_canvas_id = {}
+        self._canvas_ids = set()
 
         # Mapping of coordinate/alias name to axis.
         self._axis_by_name = {}
@@ -568,19 +1295,34 @@ class Browser(object):
 
         self._slider_by_name = {}
         self._name_by_slider_id = {}
+        # Mapping of coordinate/alias name to current position label, for
+        # those sliders that are integer indexed.
+        self._readout_by_name = {}
+        # Mapping of coordinate/alias name to play toggle button.
+        self._play_button_by_name = {}
+        self._name_by_button_id = {}
         if self._axis_by_name:
             name_len = max([len(name) for name in self._axis_by_name])
         children = []
         for axis in self._axis_by_name.values():
-            if hasattr(axis, 'coord') and axis.coord.units.is_time_reference():
-                pairs = [(axis.coord.units.num2date(axis.coord.points[i]), i)
-                         for i in range(axis.size)]
-            elif hasattr(axis, 'coord'):
-                pairs = [(axis.coord.points[i], i) for i in range(axis.size)]
+            readout = None
+            if axis.size > max_options:
+                # Only the label of the current position is formatted.
+                slider = ipywidgets.IntSlider(min=0, max=axis.size - 1,
+                                              readout=False)
+                value = self._axis_label(axis, slider.value)
+                readout = ipywidgets.Label(u'{}'.format(value))
+                self._readout_by_name[axis.name] = readout
+                slider.observe(self._handle_readout, names='value')
             else:
-                pairs = [(i, i) for i in range(axis.size)]
-            options = OrderedDict(pairs)
-            slider = ipywidgets.SelectionSlider(options=options)
+                if hasattr(axis, 'coord'):
+                    labels = axis.coord.points
+                    if axis.coord.units.is_time_reference():
+                        labels = axis.coord.units.num2date(labels)
+                else:
+                    labels = range(axis.size)
+                options = OrderedDict(zip(labels, range(axis.size)))
+                slider = ipywidgets.SelectionSlider(options=options)
             slider.observe(self.on_change, names='value')
             self._slider_by_name[axis.name] = slider
             self._name_by_slider_id[id(slider)] = axis.name
@@ -590,7 +1332,17 @@ class Browser(object):
             scale_factor = .65
             width = u'{}em'.format(int(name_len * scale_factor))
             label = ipywidgets.Label(axis.name, padding=u'0.3em', width=width)
-            hbox = ipywidgets.HBox(children=[label, slider])
+            hbox_children = [label, slider]
+            if readout is not None:
+                hbox_children.append(readout)
+            if self.player is not None:
+                button = ipywidgets.ToggleButton(description=u'Play',
+                                                 value=False)
+                button.observe(self._handle_play, names='value')
+                self._play_button_by_name[axis.name] = button
+                self._name_by_button_id[id(button)] = axis.name
+                hbox_children.append(button)
+            hbox = ipywidgets.HBox(children=hbox_children)
             children.append(hbox)
 
         # Layout the sliders in a consitent order.
@@ -598,11 +1350,47 @@ class Browser(object):
         key = lambda hbox: hbox.children[0].value
         self.form.children = sorted(children, key=key)
 
+    @staticmethod
+    def _axis_label(axis, index):
+        """
+        Returns the label of the slider axis position at the given index.
+
+        """
+        result = index
+        if hasattr(axis, 'coord'):
+            result = axis.coord.points[index]
+            if axis.coord.units.is_time_reference():
+                result = axis.coord.units.num2date(result)
+        return result
+
+    def _handle_readout(self, change):
+        """
+        Integer indexed slider traitlet event handler that labels the
+        current slider position.
+
+        """
+        name = self._name_by_slider_id[id(change['owner'])]
+        value = self._axis_label(self._axis_by_name[name], change['new'])
+        self._readout_by_name[name].value = u'{}'.format(value)
+
     def display(self):
         # XXX: Ideally, we might want to register an IPython display hook.
         self.on_change(None)
         IPython.display.display(self.form)
 
+    def close(self):
+        """
+        Stop any playback, and release the worker threads of the
+        background render pipeline and prefetch engine, without waiting
+        for work in progress.
+
+        """
+        self.pause()
+        if self.pipeline is not None:
+            self.pipeline.shutdown(wait=False)
+        if self.prefetcher is not None:
+            self.prefetcher.shutdown(wait=False)
+
     def _build_mappings(self):
         """
         Create the cross-reference dictionaries required to manage the
@@ -613,7 +1401,7 @@ class Browser(object):
                 The mapping with the meta-data required to define each
                 slider dimension.
             * _cache_by_cube_id
-                The mapping used to share the weak reference cache between
+                The mapping used to share the slice cache between
                 plots that reference the same cube.
             * _names_by_plot_id
                 The mapping that specifies the exact slider dimensions
@@ -661,30 +1449,404 @@ class Browser(object):
         Common slider widget traitlet event handler that refreshes
         all appropriate plots given a slider state change.
 
-        """
-        def _update(plots, force=False, legend=False):
-            for plot in plots:
-                plot.clear()
-            for plot in plots:
-                names = self._names_by_plot_id.get(id(plot))
-                # Check whether we need to force an invariant plot
-                # to render itself.
-                if force and names is None:
-                    names = []
-                if names is not None:
-                    kwargs = {name: slider_by_name[name].value
-                              for name in names}
-                    mappable = plot(**kwargs)
-                    if legend:
-                        plot.legend(mappable)
+        When the browser has a :attr:`scheduler`, the refresh is deferred
+        and coalesced with any other slider state changes.
 
-        slider_by_name = self._slider_by_name
+        """
         if change is None:
             # Initial render of all the plots.
-            _update(self.plots, force=True, legend=True)
-        else:
+            with self.stats.span('initial'):
+                self._update(self.plots, force=True, legend=True)
+                if self.blitter is not None:
+                    self.blitter.update(self.plots)
+            if self.prefetcher is not None:
+                self.prefetcher.schedule(self._prefetch_requests())
+            if self._autoscale is not None:
+                for plot in self.plots:
+                    plot.autoscale(mode=self._autoscale)
+        elif not self._stepping:
             # A widget slider state has changed, so only refresh
             # the appropriate plots.
             slider_id = id(change['owner'])
             name = self._name_by_slider_id[slider_id]
-            _update(self._plots_by_name[name])
+            if self.scheduler is None:
+                self._refresh([name])
+            else:
+                self.scheduler.submit(name)
+
+    def _refresh(self, names):
+        """
+        Refresh all the plots associated with the named sliders, given
+        the latest slider state.
+
+        """
+        plots = []
+        seen = set()
+        for name in names:
+            for plot in self._plots_by_name[name]:
+                if id(plot) not in seen:
+                    seen.add(id(plot))
+                    plots.append(plot)
+        if self.pipeline is None:
+            self._redraw(plots, names[-1])
+        else:
+            fetch = functools.partial(self._fetch_frames,
+                                      self._requests(plots))
+            commit = functools.partial(self._commit_frames, names[-1])
+            # Should the background fetch fail, redraw the plots directly.
+            fallback = functools.partial(self._redraw, first=names[-1])
+            self.pipeline.submit(plots, fetch, commit, fallback=fallback)
+
+    def _redraw(self, plots, first, frames=None):
+        """
+        Redraw the plots, then prefetch around the slider state, starting
+        with the named slider.
+
+        Kwargs:
+
+        * frames
+            Mapping of plot-id to the (kwargs, sub-cube) of each plot to
+            draw, as fetched in the background. Defaults to None, which
+            fetches the sub-cubes of the latest slider state.
+
+        """
+        with self.stats.span('event'):
+            self._update(plots, frames=frames)
+            if self.blitter is None:
+                self._canvas_changed(plots)
+            else:
+                with self.stats.span('canvas'):
+                    self.blitter.update(plots)
+        if self.prefetcher is not None:
+            self.prefetcher.schedule(self._prefetch_requests(first=first))
+
+    def _requests(self, plots):
+        """
+        Returns the (plot, kwargs) pairs of the named slider values that
+        each slider plot requires for the latest slider state.
+
+        """
+        result = []
+        for plot in plots:
+            names = self._names_by_plot_id.get(id(plot))
+            if names is not None:
+                kwargs = {name: self._slider_by_name[name].value
+                          for name in names}
+                result.append((plot, kwargs))
+        return result
+
+    def _fetch_frames(self, requests, plots):
+        """
+        Fetch the sub-cubes of the requests of the given plots, on a
+        worker thread of the :attr:`pipeline`.
+
+        Returns a mapping of plot-id to the (kwargs, sub-cube) of each
+        plot.
+
+        """
+        plot_ids = set(id(plot) for plot in plots)
+        requests = [(plot, kwargs) for plot, kwargs in requests
+                    if id(plot) in plot_ids]
+        with self.stats.span('fetch'):
+            self._batch_fetch(requests)
+            return {id(plot): (kwargs, plot.fetch(**kwargs))
+                    for plot, kwargs in requests}
+
+    def _commit_frames(self, first, plots, frames):
+        """
+        Draw the sub-cubes fetched in the background by the
+        :attr:`pipeline`, on the event loop.
+
+        """
+        self._redraw(plots, first, frames=frames)
+
+    def play(self, name):
+        """
+        Start advancing the named slider at the target frame rate of the
+        :attr:`player`, wrapping around at the end of its axis. Any other
+        playing slider is paused.
+
+        The plots of the slider are coarsened as required to hold the
+        frame rate, and are rendered at full quality when paused.
+
+        Args:
+
+        * name
+            The coordinate or alias name of the slider.
+
+        """
+        if self.player is None:
+            emsg = '{} requires a play_fps to play a slider.'
+            raise ValueError(emsg.format(type(self).__name__))
+        if name not in self._slider_by_name:
+            emsg = '{} has no slider {!r}.'
+            raise ValueError(emsg.format(type(self).__name__, name))
+        if self._playing is not None and self._playing != name:
+            self.pause()
+        self._playing = name
+        for other, button in self._play_button_by_name.items():
+            button.value = other == name
+        self.player.play()
+
+    def pause(self):
+        """
+        Stop advancing the playing slider, if any, and render its plots at
+        full quality.
+
+        """
+        if self._playing is not None:
+            self.player.pause()
+            self._release_play()
+
+    def _release_play(self):
+        """
+        Release the playing slider, if any, and reset its play toggle
+        button, once the :attr:`player` has paused.
+
+        """
+        if self._playing is not None:
+            name, self._playing = self._playing, None
+            self._play_button_by_name[name].value = False
+
+    def _handle_play(self, change):
+        """Play toggle button traitlet event handler."""
+        name = self._name_by_button_id[id(change['owner'])]
+        if change['new']:
+            if name != self._playing:
+                self.play(name)
+        elif name == self._playing:
+            self.pause()
+
+    def _play_step(self, step, coarsen):
+        """
+        Advance the playing slider by the given number of positions, and
+        render its plots with the given coarsening factor, see
+        :class:`~cube_browser.player.Player`.
+
+        """
+        name = self._playing
+        plots = self._plots_by_name[name]
+        for plot in plots:
+            plot.coarsen = coarsen
+        if step:
+            slider = self._slider_by_name[name]
+            size = self._axis_by_name[name].size
+            self._stepping = True
+            try:
+                slider.value = (slider.value + step) % size
+            finally:
+                self._stepping = False
+        if self.pipeline is not None:
+            self.pipeline.supersede(plots)
+        self._redraw(plots, name)
+        if self.blitter is None:
+            # Draw each changed canvas now, so that the measured cost of
+            # the frame includes rendering the figure.
+            canvases = OrderedDict()
+            for plot in plots:
+                figure = getattr(plot.axes, 'figure', None)
+                if figure is not None:
+                    canvases[id(figure.canvas)] = figure.canvas
+            for canvas in canvases.values():
+                canvas.draw()
+
+    def _canvas_changed(self, plots):
+        """
+        Note the time at which the plots changed, in order to record the
+        latency until their figure canvas is next drawn.
+
+        """
+        now = self.stats.clock()
+        for plot in plots:
+            figure = getattr(plot.axes, 'figure', None)
+            if figure is None:
+                continue
+            canvas = figure.canvas
+            if id(canvas) not in self._canvas_ids:
+                canvas.mpl_connect('draw_event', self._handle_draw)
+                self._canvas_ids.add(id(canvas))
+            self._changed_by_canvas_id.setdefault(id(canvas), now)
+
+    def _handle_draw(self, event):
+        """Canvas draw event handler that records the canvas latency."""
+        start = self._changed_by_canvas_id.pop(id(event.canvas), None)
+        if start is not None:
+            self.stats.record('canvas', self.stats.clock() - start)
+
+    def _batch_fetch(self, requests):
+        """
+        Read the uncached sub-cubes of the (plot, kwargs) requests, of the
+        named slider values of each plot, such that plots sharing a cube
+        read them together.
+
+        The sub-cube indices of each shared cube are de-duplicated and
+        contiguous indices are merged into blocks, each of which is read
+        and realised at once, then cached for every plot of the cube.
+        Cubes with slider values other than integers are left for their
+        plots to fetch.
+
+        """
+        requests_by_cube_id = OrderedDict()
+        for plot, kwargs in requests:
+            if plot._key(**kwargs) in plot.cache:
+                continue
+            group = requests_by_cube_id.setdefault(id(plot.cube), [])
+            group.append((plot, kwargs))
+        for group in requests_by_cube_id.values():
+            if len(group) < 2:
+                # Nothing to combine, so the plot fetches its own.
+                continue
+            reader = group[0][0]
+            indices = [plot._index(**kwargs) for plot, kwargs in group]
+            if not all(isinstance(key, (numbers.Integral, slice))
+                       for index in indices for key in index):
+                # Not sub-cube indices, so the plots fetch their own.
+                continue
+            for block, members in merge_indices(reader.cube.shape,
+                                                indices):
+                sizes = [key.stop - key.start for dim, key in enumerate(block)
+                         if dim not in reader._plot_dims]
+                if np.prod(sizes) < 2:
+                    # A single sub-cube, so the plots fetch it as usual.
+                    continue
+                if reader.slicer.read(block).nbytes > reader.cache.max_bytes:
+                    continue
+                with self.stats.span('batch'):
+                    cube = reader._read_block(block)
+                    seen = set()
+                    for member in members:
+                        plot, kwargs = group[member]
+                        names = tuple(sorted(kwargs))
+                        if names not in seen:
+                            seen.add(names)
+                            plot._cache_block(block, cube, names)
+
+    def _update(self, plots, force=False, legend=False, frames=None):
+        slider_by_name = self._slider_by_name
+        for plot in plots:
+            plot.clear()
+        if frames is None:
+            self._batch_fetch(self._requests(plots))
+        for plot in plots:
+            names = self._names_by_plot_id.get(id(plot))
+            # Check whether we need to force an invariant plot
+            # to render itself.
+            if force and names is None:
+                names = []
+            if names is None:
+                continue
+            if frames is None:
+                kwargs = {name: slider_by_name[name].value
+                          for name in names}
+                mappable = plot(**kwargs)
+            else:
+                kwargs, subcube = frames[id(plot)]
+                mappable = plot._render(subcube, **kwargs)
+            if legend:
+                plot.legend(mappable)
+
+    def export_frames(self, filename, frames=None, name=None, processes=None,
+                      dpi=None, fps=10):
+        """
+        Render a sequence of slider states as animation frames, and write
+        them to disk in order.
+
+        The frames are rendered in parallel worker processes with the Agg
+        backend, each of which builds its own copy of the figure from the
+        plot definitions, and slices its own plot cubes. The colour limits
+        and contour levels of each plot are those of the current plots, so
+        the browser should have been displayed or autoscaled beforehand.
+
+        Args:
+
+        * filename
+            Either a format string of the PNG filename of each frame, given
+            the frame number, e.g. 'frames/{:04d}.png', or the filename of
+            an MP4 video to encode with ffmpeg.
+
+        Kwargs:
+
+        * frames
+            Iterable of dictionaries of the slider name and index value of
+            each frame. Sliders not specified retain their current value.
+
+        * name
+            The name of a slider to step through every position of, with
+            the other sliders at their current value. Ignored when frames
+            are given.
+
+        * processes
+            The number of worker processes. Defaults to the number of
+            processors on the machine.
+
+        * dpi
+            The resolution of each frame. Defaults to that of the figure.
+
+        * fps
+            The frame rate of a video. Defaults to 10.
+
+        Returns the number of frames written.
+
+        """
+        if frames is None:
+            if name not in self._axis_by_name:
+                emsg = '{} requires frames, or the name of a slider, got {!r}.'
+                raise ValueError(emsg.format(type(self).__name__, name))
+            frames = [{name: value}
+                      for value in range(self._axis_by_name[name].size)]
+        current = {name: slider.value
+                   for name, slider in self._slider_by_name.items()}
+
+        def states():
+            for frame in frames:
+                unknown = set(frame) - set(current)
+                if unknown:
+                    emsg = '{} frame has unknown slider names {!r}.'
+                    raise ValueError(emsg.format(type(self).__name__,
+                                                 sorted(unknown)))
+                state = dict(current)
+                state.update(frame)
+                yield state
+
+        names = [self._names_by_plot_id.get(id(plot), [])
+                 for plot in self.plots]
+        definition = figure_definition(self.plots, names, dpi=dpi)
+        images = render_frames(definition, states(), processes=processes)
+        return write_frames(images, filename, fps=fps)
+
+    def _prefetch_requests(self, first=None):
+        """
+        Determine the plot sub-cubes to prefetch for the neighbouring
+        positions of each slider, given the current slider state.
+
+        Kwargs:
+
+        * first
+            The name of the slider to prioritise, typically the slider
+            that most recently changed.
+
+        Returns a list of (plot, kwargs) pairs, nearest neighbours first.
+
+        """
+        value_by_name = {name: slider.value
+                         for name, slider in self._slider_by_name.items()}
+
+        def key(name):
+            # The first slider, then the remainder by name.
+            return name != first, name
+
+        names = sorted(value_by_name, key=key)
+        requests = []
+        for offset in range(1, self._prefetch + 1):
+            # Favour stepping forwards over stepping backwards.
+            for step in (offset, -offset):
+                for name in names:
+                    value = value_by_name[name] + step
+                    if value < 0 or value >= self._axis_by_name[name].size:
+                        continue
+                    for plot in self._plots_by_name[name]:
+                        kwargs = {other: value_by_name[other] for other in
+                                  self._names_by_plot_id[id(plot)]}
+                        kwargs[name] = value
+                        requests.append((plot, kwargs))
+        return requests
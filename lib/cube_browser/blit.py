@@ -0,0 +1,120 @@
+"""Blitting of plot data artists over a cached static axes background."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+from collections import OrderedDict
+
+
+class Blitter(object):
+    """
+    Redraws only the data artists of plots, over a cached copy of the
+    static background of each axes, such as coastlines, gridlines and
+    titles.
+
+    The data artists are marked as animated, so that they are excluded
+    from a full draw of the figure. After every full draw the background
+    of each axes is captured and the data artists are rendered over it.
+    The cached backgrounds are invalidated when the figure is resized.
+
+    """
+    def __init__(self, plots):
+        """
+        Args:
+
+        * plots
+            The cube_browser plot instances to manage.
+
+        """
+        self.plots = plots
+        # Mapping of axes-id to cached axes background.
+        self._background_by_axes_id = {}
+        # The identity of the canvases with connected event handlers.
+        self._canvas_ids = set()
+
+    def _plots_by_axes(self, plots):
+        """
+        Group all the managed plots that share an axes with any of the
+        given plots.
+
+        Returns a dictionary of (axes, plots) by axes-id.
+
+        """
+        axes_ids = set(id(plot.axes) for plot in plots)
+        result = OrderedDict()
+        for plot in self.plots:
+            if id(plot.axes) in axes_ids:
+                _, members = result.setdefault(id(plot.axes),
+                                               (plot.axes, []))
+                members.append(plot)
+        return result
+
+    def _connect(self, canvas):
+        if id(canvas) not in self._canvas_ids:
+            canvas.mpl_connect('draw_event', self._on_draw)
+            canvas.mpl_connect('resize_event', self.invalidate)
+            self._canvas_ids.add(id(canvas))
+
+    @staticmethod
+    def _animate(plots, animated=True):
+        for plot in plots:
+            for artist in plot.artists:
+                artist.set_animated(animated)
+
+    @staticmethod
+    def _supports_blit(canvas):
+        """Whether the canvas can capture and restore axes regions."""
+        return (getattr(canvas, 'supports_blit', True) and
+                hasattr(canvas, 'copy_from_bbox'))
+
+    @staticmethod
+    def _draw_artists(axes, plots):
+        for plot in plots:
+            for artist in plot.artists:
+                axes.draw_artist(artist)
+
+    def invalidate(self, event=None):
+        """Discard the cached axes backgrounds."""
+        self._background_by_axes_id.clear()
+
+    def _on_draw(self, event):
+        """
+        Canvas draw event handler that captures the static background of
+        each axes, then renders the animated data artists over it.
+
+        """
+        canvas = event.canvas
+        if not self._supports_blit(canvas):
+            return
+        for axes, plots in self._plots_by_axes(self.plots).values():
+            if axes.figure.canvas is canvas:
+                background = canvas.copy_from_bbox(axes.bbox)
+                self._background_by_axes_id[id(axes)] = background
+                self._animate(plots)
+                self._draw_artists(axes, plots)
+
+    def update(self, plots):
+        """
+        Redraw the data artists of the given plots, along with those of
+        any other plots on the same axes.
+
+        """
+        for axes, members in self._plots_by_axes(plots).values():
+            canvas = axes.figure.canvas
+            if not self._supports_blit(canvas):
+                # Fall back to a full draw, which only includes the data
+                # artists when they are not animated.
+                self._animate(members, animated=False)
+                canvas.draw_idle()
+                continue
+            self._connect(canvas)
+            self._animate(members)
+            background = self._background_by_axes_id.get(id(axes))
+            if background is None:
+                # A full draw captures the background of every axes on
+                # the canvas, and renders the data artists over it.
+                canvas.draw()
+            else:
+                canvas.restore_region(background)
+                self._draw_artists(axes, members)
+                canvas.blit(axes.bbox)
@@ -0,0 +1,185 @@
+"""Caching of realised cube slices for cube_browser plots."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+from collections import OrderedDict
+import threading
+
+import iris.cube
+import numpy as np
+
+
+#: The default byte budget of a :class:`SliceCache`.
+DEFAULT_MAX_BYTES = 512 * 1024 ** 2
+
+# Serialises the realisation of cube data, as the underlying file format
+# libraries are not guaranteed to be thread-safe.
+_IO_LOCK = threading.Lock()
+
+
+def realise(cube):
+    """
+    Realise the data payload of the cube, serialised across threads.
+
+    Returns the realised data.
+
+    """
+    with _IO_LOCK:
+        return cube.data
+
+
+def _nbytes(value):
+    """
+    Determine the number of bytes of payload held by the value.
+
+    A cube will have its data realised, as the cache is only of use if
+    revisiting a slice avoids going back to disk.
+
+    """
+    if isinstance(value, iris.cube.Cube):
+        value = realise(value)
+    elif isinstance(value, bytes):
+        return len(value)
+    nbytes = getattr(value, 'nbytes', 0)
+    mask = np.ma.getmask(value)
+    if mask is not np.ma.nomask:
+        nbytes += mask.nbytes
+    return nbytes
+
+
+class SliceCache(object):
+    """
+    A least-recently-used cache of realised cube slices, bounded by the
+    total number of bytes of data payload that it holds.
+
+    The cache may be shared between plots that reference the same cube,
+    see :meth:`cube_browser.Browser._build_mappings`.
+
+    """
+    def __init__(self, max_bytes=None):
+        """
+        Kwargs:
+
+        * max_bytes
+            The maximum number of bytes of realised data payload to hold.
+            Defaults to :data:`DEFAULT_MAX_BYTES`.
+
+        """
+        if max_bytes is None:
+            max_bytes = DEFAULT_MAX_BYTES
+        if max_bytes < 0:
+            emsg = '{} requires a non-negative byte budget, got {}.'
+            raise ValueError(emsg.format(type(self).__name__, max_bytes))
+        #: The byte budget of the cache.
+        self.max_bytes = max_bytes
+        #: The number of bytes currently held by the cache.
+        self.nbytes = 0
+        #: The number of successful lookups.
+        self.hits = 0
+        #: The number of unsuccessful lookups.
+        self.misses = 0
+        #: The number of entries discarded to honour the byte budget.
+        self.evictions = 0
+        # Mapping of key to (value, nbytes) in least to most recently
+        # used order.
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __repr__(self):
+        fmt = '{}(entries={}, nbytes={}, max_bytes={})'
+        return fmt.format(type(self).__name__, len(self), self.nbytes,
+                          self.max_bytes)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __getitem__(self, key):
+        with self._lock:
+            try:
+                value, nbytes = self._entries.pop(key)
+            except KeyError:
+                self.misses += 1
+                raise
+            self._entries[key] = (value, nbytes)
+            self.hits += 1
+        return value
+
+    def __setitem__(self, key, value):
+        nbytes = _nbytes(value)
+        with self._lock:
+            if key in self._entries:
+                _, previous = self._entries.pop(key)
+                self.nbytes -= previous
+            if nbytes > self.max_bytes:
+                # Never hold a value that alone exceeds the budget.
+                self.evictions += 1
+                return
+            self._entries[key] = (value, nbytes)
+            self.nbytes += nbytes
+            self._evict()
+
+    def __delitem__(self, key):
+        with self._lock:
+            _, nbytes = self._entries.pop(key)
+            self.nbytes -= nbytes
+
+    def _evict(self):
+        """Discard least recently used entries until within budget."""
+        while self.nbytes > self.max_bytes:
+            _, (_, nbytes) = self._entries.popitem(last=False)
+            self.nbytes -= nbytes
+            self.evictions += 1
+
+    def realise(self, cube):
+        """
+        Realise the data payload of the cube, ready for caching.
+
+        Returns the realised data.
+
+        """
+        return realise(cube)
+
+    def get(self, key, default=None):
+        """
+        Return the cached value for the key, otherwise the default.
+
+        A successful lookup marks the entry as most recently used.
+
+        """
+        try:
+            result = self[key]
+        except KeyError:
+            result = default
+        return result
+
+    def keys(self):
+        """The cache keys, in least to most recently used order."""
+        with self._lock:
+            return list(self._entries.keys())
+
+    def clear(self):
+        """Discard all entries, retaining the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def resize(self, max_bytes):
+        """Change the byte budget, evicting entries as required."""
+        if max_bytes < 0:
+            emsg = '{} requires a non-negative byte budget, got {}.'
+            raise ValueError(emsg.format(type(self).__name__, max_bytes))
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    @property
+    def stats(self):
+        """A dictionary summary of the cache counters and occupancy."""
+        with self._lock:
+            return dict(entries=len(self._entries), nbytes=self.nbytes,
+                        max_bytes=self.max_bytes, hits=self.hits,
+                        misses=self.misses, evictions=self.evictions)
@@ -0,0 +1,188 @@
+"""A persistent on-disk catalogue of the cubes of files."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+from contextlib import closing
+import os
+import sqlite3
+import sys
+import threading
+import warnings
+
+from six.moves import cPickle as pickle
+
+
+#: The default directory of the catalogue database.
+DEFAULT_DIRNAME = os.path.join(os.path.expanduser('~'), '.cache',
+                               'cube_browser')
+
+# The catalogue database schema.
+_SCHEMA = """CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    cubes BLOB NOT NULL
+)"""
+
+
+def _identity(path):
+    """The (absolute path, size, mtime) of the file."""
+    stat = os.stat(path)
+    return os.path.abspath(path), stat.st_size, stat.st_mtime
+
+
+class Catalogue(object):
+    """
+    A catalogue of the raw cubes of each file, persisted in an SQLite
+    database, so that the headers of a file are only parsed again when it
+    changes.
+
+    Each entry is keyed on the path, size and modification time of the
+    file, and holds the raw cubes of the file with lazy data payloads.
+    The cubes carry their full metadata, so cube summaries, shapes and
+    coordinates are available without reading the file, and the data is
+    only read from the file when plotted.
+
+    The database is opened on first use. Should the database file be
+    unavailable, such as in a read-only home directory, the catalogue
+    falls back to an in-memory database, with a warning.
+
+    """
+    def __init__(self, filename=None):
+        """
+        Kwargs:
+
+        * filename
+            The catalogue database file. Defaults to a file in
+            :data:`DEFAULT_DIRNAME`, specific to the major version of
+            Python, as the cubes are pickled.
+
+        """
+        # Whether to create the default directory on first use.
+        self._makedirs = filename is None
+        if filename is None:
+            basename = 'catalogue-py{}.sqlite'.format(sys.version_info[0])
+            filename = os.path.join(DEFAULT_DIRNAME, basename)
+        #: The catalogue database file, or ':memory:' for an in-memory
+        #: database.
+        self.filename = filename
+        #: The number of files found in the catalogue.
+        self.hits = 0
+        #: The number of files not found, or changed, in the catalogue.
+        self.misses = 0
+        self._lock = threading.Lock()
+        # The database connection, opened on first use.
+        self._connection = None
+
+    def __repr__(self):
+        fmt = '{}(filename={!r}, entries={})'
+        return fmt.format(type(self).__name__, self.filename, len(self))
+
+    def _open(self, filename):
+        """Returns a connection to the database, creating its schema."""
+        dirname = os.path.dirname(filename)
+        if self._makedirs and not os.path.isdir(dirname):
+            os.makedirs(dirname)
+        connection = sqlite3.connect(filename, timeout=30,
+                                     check_same_thread=False)
+        try:
+            with connection:
+                connection.execute(_SCHEMA)
+        except sqlite3.Error:
+            connection.close()
+            raise
+        return connection
+
+    def _connect(self):
+        """
+        Returns the database connection, opening the database on first
+        use, or an in-memory database should the file be unavailable.
+
+        The caller must hold the lock.
+
+        """
+        if self._connection is None:
+            try:
+                self._connection = self._open(self.filename)
+            except (OSError, sqlite3.Error) as exception:
+                wmsg = ('{} is unable to open {!r}, and is falling back to '
+                        'an in-memory database: {}')
+                warnings.warn(wmsg.format(type(self).__name__,
+                                          self.filename, exception))
+                self.filename = ':memory:'
+                self._connection = self._open(self.filename)
+        return self._connection
+
+    def __len__(self):
+        with self._lock:
+            with closing(self._connect().cursor()) as cursor:
+                cursor.execute('SELECT COUNT(*) FROM files')
+                count, = cursor.fetchone()
+        return count
+
+    def get(self, path):
+        """
+        Returns the list of raw cubes of the file, or None if the file is
+        not in the catalogue or has changed since it was catalogued.
+
+        """
+        try:
+            key, size, mtime = _identity(path)
+        except OSError:
+            return None
+        with self._lock:
+            with closing(self._connect().cursor()) as cursor:
+                cursor.execute('SELECT size, mtime, cubes FROM files '
+                               'WHERE path = ?', (key,))
+                row = cursor.fetchone()
+        result = None
+        if row is not None and row[:2] == (size, mtime):
+            try:
+                result = pickle.loads(bytes(row[2]))
+            except Exception:
+                # Treat an entry that no longer unpickles, say after an
+                # upgrade of iris, as changed.
+                result = None
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return result
+
+    def put(self, path, cubes):
+        """Add or replace the list of raw cubes of the file."""
+        key, size, mtime = _identity(path)
+        blob = pickle.dumps(list(cubes), pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute(
+                    'INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)',
+                    (key, size, mtime, sqlite3.Binary(blob)))
+
+    def prune(self):
+        """
+        Discard the entries of files that no longer exist.
+
+        Returns the number of entries discarded.
+
+        """
+        with self._lock:
+            connection = self._connect()
+            with closing(connection.cursor()) as cursor:
+                cursor.execute('SELECT path FROM files')
+                paths = [path for path, in cursor.fetchall()
+                         if not os.path.exists(path)]
+            with connection:
+                connection.executemany(
+                    'DELETE FROM files WHERE path = ?',
+                    [(path,) for path in paths])
+        return len(paths)
+
+    def close(self):
+        """Close the catalogue database, if it has been opened."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
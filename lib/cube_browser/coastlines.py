@@ -0,0 +1,255 @@
+"""Cached, projected and extent clipped coastline geometry."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+from collections import OrderedDict
+import threading
+import weakref
+
+from matplotlib.collections import PathCollection
+from matplotlib.path import Path
+import numpy as np
+
+
+#: The fractional padding of an extent, within which coastlines are kept.
+EXTENT_PADDING = 0.1
+
+#: The maximum number of projected coastline paths that are cached.
+MAX_PATHS = 32
+
+#: The number of points sampled along each axis of an extent, to find its
+#: geographic bounds.
+_GRID_POINTS = 32
+
+# Mapping of (projection, extent, resolution) key to the projected path,
+# in least to most recently used order.
+_PATHS = OrderedDict()
+
+# Mapping of (cube id, projection) key to (cube weak reference, extent).
+_EXTENTS = {}
+
+_LOCK = threading.Lock()
+
+
+def projection_key(projection):
+    """A hashable identity of the cartopy projection."""
+    return type(projection).__name__, projection.proj4_init
+
+
+def cube_extent(cube, projection):
+    """
+    Returns the (x0, x1, y0, y1) extent of the cube in the projection,
+    see :func:`iris.plot.default_projection_extent`.
+
+    The extent is cached for the lifetime of the cube.
+
+    """
+    import iris.plot as iplt
+
+    key = (id(cube), projection_key(projection))
+    with _LOCK:
+        ref, result = _EXTENTS.get(key, (None, None))
+    if ref is None or ref() is not cube:
+        result = tuple(iplt.default_projection_extent(cube))
+        with _LOCK:
+            # Discard the entries of cubes that no longer exist.
+            for other in [other for other, (ref, _) in _EXTENTS.items()
+                          if ref() is None]:
+                del _EXTENTS[other]
+            _EXTENTS[key] = (weakref.ref(cube), result)
+    return result
+
+
+def extent_resolution(extent, projection):
+    """
+    Returns the Natural Earth resolution of the coastlines of an extent
+    in the projection: '10m' for a small extent, '50m' for a regional
+    extent and '110m' otherwise.
+
+    """
+    import cartopy.crs as ccrs
+
+    x0, y0 = ccrs.PlateCarree().transform_point(extent[0], extent[2],
+                                                projection)
+    x1, y1 = ccrs.PlateCarree().transform_point(extent[1], extent[3],
+                                                projection)
+    if x1 - x0 < 20 and y1 - y0 < 20:
+        result = '10m'
+    elif x1 - x0 < 180 and y1 - y0 < 90:
+        result = '50m'
+    else:
+        result = '110m'
+    return result
+
+
+def _pad(extent):
+    """The extent, padded by :data:`EXTENT_PADDING` on all sides."""
+    x0, x1, y0, y1 = extent
+    dx = (x1 - x0) * EXTENT_PADDING
+    dy = (y1 - y0) * EXTENT_PADDING
+    return x0 - dx, x1 + dx, y0 - dy, y1 + dy
+
+
+def _contains(outer, inner):
+    """Whether the outer (x0, x1, y0, y1) extent contains the inner one."""
+    return (outer[0] <= inner[0] and inner[1] <= outer[1] and
+            outer[2] <= inner[2] and inner[3] <= outer[3])
+
+
+def _geographic_extent(extent, projection):
+    """
+    The (lon0, lon1, lat0, lat1) bounds of the extent in the projection,
+    from a grid of points sampled over it, extended to include any pole
+    within it.
+
+    """
+    import cartopy.crs as ccrs
+
+    geodetic = ccrs.PlateCarree()
+    x0, x1, y0, y1 = extent
+    x, y = np.meshgrid(np.linspace(x0, x1, _GRID_POINTS),
+                       np.linspace(y0, y1, _GRID_POINTS))
+    points = geodetic.transform_points(projection, x.ravel(), y.ravel())
+    lons, lats = points[:, 0], points[:, 1]
+    valid = np.isfinite(lons) & np.isfinite(lats)
+    if not valid.any():
+        return -180, 180, -90, 90
+    lon0, lon1 = lons[valid].min(), lons[valid].max()
+    lat0, lat1 = lats[valid].min(), lats[valid].max()
+    # A pole within the extent is surrounded by every longitude.
+    poles = projection.transform_points(geodetic, np.zeros(2),
+                                        np.array([-90., 90.]))
+    for (x, y), lat in zip(poles[:, :2], [-90, 90]):
+        if x0 <= x <= x1 and y0 <= y <= y1:
+            lon0, lon1 = -180, 180
+            lat0, lat1 = min(lat0, lat), max(lat1, lat)
+    return lon0, lon1, lat0, lat1
+
+
+def coastline_path(projection, extent, resolution='110m'):
+    """
+    Returns the compound :class:`matplotlib.path.Path` of the Natural Earth
+    coastlines within the extent, projected to the projection.
+
+    The most recently used :data:`MAX_PATHS` paths are cached, so figures
+    and panels of the same projection and extent share the prepared path,
+    rather than each reading, clipping and projecting the coastlines.
+
+    Args:
+
+    * projection
+        The cartopy projection of the path.
+
+    * extent
+        The (x0, x1, y0, y1) extent in the projection. Coastlines are
+        clipped to the extent, padded by :data:`EXTENT_PADDING`.
+
+    Kwargs:
+
+    * resolution
+        The Natural Earth resolution, one of '10m', '50m' or '110m'.
+        Defaults to '110m'.
+
+    """
+    import cartopy.crs as ccrs
+    import cartopy.feature
+    from cartopy.mpl.patch import geos_to_path
+    import shapely.geometry as sgeom
+
+    extent = _pad(tuple(float(value) for value in extent))
+    key = (projection_key(projection), extent, resolution)
+    with _LOCK:
+        cached = key in _PATHS
+        if cached:
+            result = _PATHS.pop(key)
+            _PATHS[key] = result
+    if not cached:
+        feature = cartopy.feature.NaturalEarthFeature('physical',
+                                                      'coastline',
+                                                      resolution)
+        bounds = _geographic_extent(extent, projection)
+        clip = sgeom.box(extent[0], extent[2], extent[1], extent[3])
+        paths = []
+        for geometry in feature.intersecting_geometries(bounds):
+            projected = projection.project_geometry(geometry,
+                                                    ccrs.PlateCarree())
+            clipped = projected.intersection(clip)
+            if not clipped.is_empty:
+                paths.extend(geos_to_path(clipped))
+        result = Path.make_compound_path(*paths) if paths else None
+        with _LOCK:
+            _PATHS[key] = result
+            while len(_PATHS) > MAX_PATHS:
+                _PATHS.popitem(last=False)
+    return result
+
+
+class CoastlineCollection(PathCollection):
+    """
+    The cached coastlines of an axes, see :func:`add_coastlines`.
+
+    The coastlines are clipped to a padded extent, so they are replaced by
+    those of the view limits of the axes when it is drawn with a view that
+    extends beyond the padded extent, such as after a pan or zoom out.
+
+    """
+    def __init__(self, path, resolution, extent, transform, **kwargs):
+        paths = [] if path is None else [path]
+        super(CoastlineCollection, self).__init__(paths, transform=transform,
+                                                  **kwargs)
+        #: The Natural Earth resolution of the coastlines.
+        self.resolution = resolution
+        #: The extent of the coastlines, in the projection of the axes.
+        self.extent = extent
+        #: The matplotlib collection keyword arguments.
+        self.kwargs = kwargs
+
+    def draw(self, renderer):
+        axes = self.axes
+        if axes is not None:
+            view = tuple(axes.get_xlim()) + tuple(axes.get_ylim())
+            if not _contains(_pad(self.extent), view):
+                path = coastline_path(axes.projection, view, self.resolution)
+                self.set_paths([] if path is None else [path])
+                self.extent = view
+        super(CoastlineCollection, self).draw(renderer)
+
+
+def add_coastlines(axes, resolution='110m', extent=None, **kwargs):
+    """
+    Add the cached coastlines of the extent to the cartopy GeoAxes, see
+    :func:`coastline_path`.
+
+    Args:
+
+    * axes
+        The cartopy GeoAxes.
+
+    Kwargs:
+
+    * resolution
+        The Natural Earth resolution, one of '10m', '50m' or '110m'.
+        Defaults to '110m'.
+
+    * extent
+        The initial (x0, x1, y0, y1) extent in the projection of the axes.
+        Defaults to the current view limits of the axes.
+
+    * kwargs
+        Matplotlib collection keyword arguments. Defaults to a black
+        outline, with no fill.
+
+    Returns the :class:`CoastlineCollection`.
+
+    """
+    if extent is None:
+        extent = tuple(axes.get_xlim()) + tuple(axes.get_ylim())
+    path = coastline_path(axes.projection, extent, resolution)
+    kwargs.setdefault('edgecolor', 'black')
+    kwargs.setdefault('facecolor', 'none')
+    kwargs.setdefault('zorder', 2)
+    collection = CoastlineCollection(path, resolution, extent,
+                                     axes.transData, **kwargs)
+    axes.add_collection(collection, autolim=False)
+    return collection
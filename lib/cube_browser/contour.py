@@ -0,0 +1,127 @@
+"""Caching and reuse of the contour geometry of rendered cube slices."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+from collections import namedtuple
+import re
+
+import iris.plot as iplt
+import matplotlib
+from matplotlib.axes import Axes
+from matplotlib.contour import ContourSet
+import numpy as np
+
+from cube_browser.grids import grid_data
+
+
+def _version(version):
+    """The (major, minor) integers of a version string."""
+    return tuple(int(part) for part in re.findall(r'\d+', version)[:2])
+
+
+#: Whether cached contour geometry can be rendered as a
+#: :class:`CachedContourSet`, which builds on private matplotlib contour
+#: internals that were reworked in matplotlib 3.8. Otherwise, plots
+#: contour every slice they render.
+GEOMETRY_REUSE = (_version(matplotlib.__version__) < (3, 8) and
+                  hasattr(ContourSet, '_process_args'))
+
+
+class ContourGeometry(namedtuple('ContourGeometry',
+                                 'levels, zmin, zmax, allsegs, allkinds')):
+    """
+    The contour levels, data range and line or polygon geometry of a
+    contoured cube slice, as calculated by matplotlib.
+
+    """
+    @classmethod
+    def from_contour_set(cls, contour_set):
+        """Capture the geometry of a :class:`matplotlib.contour.ContourSet`."""
+        return cls(np.array(contour_set.levels), contour_set.zmin,
+                   contour_set.zmax, contour_set.allsegs,
+                   contour_set.allkinds)
+
+    @property
+    def nbytes(self):
+        """The number of bytes held by the geometry arrays."""
+        result = sum(seg.nbytes for segs in self.allsegs for seg in segs)
+        for kinds in self.allkinds or []:
+            if kinds is not None:
+                result += sum(kind.nbytes for kind in kinds
+                              if kind is not None)
+        return result
+
+
+class CachedContourSet(ContourSet):
+    """
+    A :class:`matplotlib.contour.ContourSet` rendered from previously
+    calculated :class:`ContourGeometry`, rather than by contouring data.
+
+    The axes is expected to have already rendered the contours of a slice
+    on the same grid, and so its data limits are left unchanged.
+
+    Requires :data:`GEOMETRY_REUSE`.
+
+    """
+    def __init__(self, ax, geometry, **kwargs):
+        super(CachedContourSet, self).__init__(ax, geometry, **kwargs)
+
+    def _process_args(self, geometry, **kwargs):
+        self.levels = geometry.levels
+        self.zmin = geometry.zmin
+        self.zmax = geometry.zmax
+        self.allsegs = geometry.allsegs
+        self.allkinds = geometry.allkinds
+        self._auto = False
+        self._mins = self.ax.dataLim.min
+        self._maxs = self.ax.dataLim.max
+        return kwargs
+
+
+def contour_geometry(cube, coords, filled, projection, kwargs, grid=None):
+    """
+    Contour the 2d cube on an off-screen axes of the given projection, and
+    return the resulting :class:`ContourGeometry`.
+
+    This is suitable for calculating contour geometry in a worker process.
+
+    Args:
+
+    * cube
+        The 2d :class:`~iris.cube.Cube` to contour.
+
+    * coords
+        The cube coordinates or dimensions to contour over, in
+        (x-axis, y-axis) order.
+
+    * filled
+        Whether to calculate filled contours.
+
+    * projection
+        The cartopy projection of the target axes, or None.
+
+    * kwargs
+        The contour keyword arguments, including the contour levels.
+
+    Kwargs:
+
+    * grid
+        The :class:`~cube_browser.grids.Grid` of the plot coordinates,
+        pre-transformed to the projection, if any.
+
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figure = Figure()
+    FigureCanvasAgg(figure)
+    axes = figure.add_subplot(111, projection=projection)
+    if grid is None:
+        func = iplt.contourf if filled else iplt.contour
+        contour_set = func(cube, axes=axes, coords=coords, **kwargs)
+    else:
+        func = Axes.contourf if filled else Axes.contour
+        contour_set = func(axes, grid.x, grid.y, grid_data(cube, coords),
+                           **kwargs)
+    return ContourGeometry.from_contour_set(contour_set)
@@ -1,5 +1,4 @@
 from collections import OrderedDict
-import glob
 import os
 try:
     # Python 3
@@ -17,6 +16,13 @@ import matplotlib.pyplot as plt
 import traitlets
 
 import cube_browser
+from cube_browser.catalogue import Catalogue
+from cube_browser.coastlines import (add_coastlines, cube_extent,
+                                     extent_resolution)
+from cube_browser.listing import (filter_paths, npages, page,
+                                  submit as submit_listing)
+from cube_browser.loading import load_files
+from cube_browser.scheduler import Debouncer, _call_soon
 
 # Clear output, such as autosave disable notification.
 IPython.display.clear_output()
@@ -25,60 +31,155 @@ IPython.display.clear_output()
 class FilePicker(object):
     """
     File picker widgets.
+
+    The directory listing is cached, and refreshed in the background once
+    typing in the path box settles. The files may be filtered by a glob
+    pattern, or by a regular expression prefixed with 're:', applied once
+    typing in the filter box settles, and only a page of files at a time
+    is sent to the browser.
+
     """
-    def __init__(self, initial_value='', default=''):
+    def __init__(self, initial_value='', default='', page_size=1000):
         if initial_value == '':
             try:
                 initial_value = iris.sample_data_path('')
             except ValueError:
                 initial_value = ''
+        self.page_size = page_size
         # Define the file system path for input files.
         self._path = ipywidgets.Text(
             description='Path:',
             value=initial_value,
             width="100%")
-        # Observe the path.
+        # Observe the path, handling only the last of a burst of edits.
+        self._path_debouncer = Debouncer(self._handle_path_settled)
         self._path.observe(self._handle_path, names='value')
-        # Use default path value to initialise file options.
-        options = []
-        if os.path.exists(self._path.value):
-            options = glob.glob('{}/*'.format(self._path.value))
-            options.sort()
-        default_list = []
-        for default_value in default.split(','):
-            if default_value in options:
-                default_list.append(default_value)
-        default_tuple = tuple(default_list)
+        # Define the filter of the file names, handling only the last of a
+        # burst of edits.
+        self._filter = ipywidgets.Text(description='Filter:')
+        self._filter_debouncer = Debouncer(self._handle_filter_settled)
+        self._filter.observe(self._handle_filter, names='value')
+        self._page = ipywidgets.BoundedIntText(description='Page:', value=0,
+                                               min=0, max=0)
+        # The paths of the directory, and those that match the filter.
+        self._paths = []
+        self._matches = []
+        # The default files to select once the directory is listed.
+        self._default = [value for value in default.split(',') if value]
+        # Whether the options are being updated, as clamping the page
+        # number to the number of pages notifies the page observer.
+        self._updating = False
 
         # Defines the files selected to be loaded.
         self._files = ipywidgets.SelectMultiple(
             description='Files:',
-            options=OrderedDict([(os.path.basename(f), f)
-                                 for f in options]),
-            value=default_tuple,
+            options=OrderedDict(),
             width="100%"
         )
+        self._page.observe(self._handle_page, names='value')
         self.deleter = ipywidgets.Button(description='delete tab',
                                          height='32px', width='75px')
         hbox = ipywidgets.HBox(children=[self._files, self.deleter])
-        self._box = ipywidgets.Box(children=[self._path, hbox], width="100%")
+        filter_box = ipywidgets.HBox(children=[self._filter, self._page])
+        self._box = ipywidgets.Box(children=[self._path, filter_box, hbox],
+                                   width="100%")
+        # List the initial directory in the background.
+        self._handle_path_settled(self._path.value)
 
     @property
     def files(self):
         """The files from the FilePicker."""
         return self._files.value
 
+    def _options(self):
+        """The file options of the current page."""
+        paths = page(self._matches, self._page.value, self.page_size)
+        return OrderedDict([(os.path.basename(f), f) for f in paths])
+
+    def _update_options(self):
+        """Apply the filter and page to the directory listing."""
+        if self._updating:
+            return
+        self._updating = True
+        try:
+            try:
+                self._matches = filter_paths(self._paths, self._filter.value)
+                self._filter.description = 'Filter:'
+            except ValueError:
+                self._matches = []
+                self._filter.description = 'bad filter'
+            self._page.max = npages(self._matches, self.page_size) - 1
+            options = self._options()
+            # Retain the selected files that remain on offer.
+            value = tuple(f for f in self._files.value
+                          if f in options.values())
+            self._files.value = ()
+            self._files.options = options
+            self._files.value = value
+            self._files.width = "100%"
+        finally:
+            self._updating = False
+
     def _handle_path(self, sender):
         """Path box action."""
-        if os.path.exists(self._path.value):
-            options = glob.glob('{}/*'.format(self._path.value))
-            options.sort()
-            self._files.value = ()
-            self._files.options = OrderedDict([(os.path.basename(f), f)
-                                               for f in options])
+        self._path_debouncer.submit(self._path.value)
+
+    def _handle_path_settled(self, path):
+        """List the directory of the settled path in the background."""
+        if os.path.isdir(path):
+            call_soon = _call_soon()
+            future = submit_listing(path)
+
+            def done(future):
+                call_soon(self._handle_listing, path, future)
+
+            future.add_done_callback(done)
         else:
-            self._files.options = OrderedDict()
-        self._files.width = "100%"
+            self._handle_listing(path, None)
+
+    def _handle_listing(self, path, future):
+        """Show the directory listing, unless the path has since changed."""
+        if path != self._path.value:
+            return
+        paths = []
+        if future is not None and future.exception() is None:
+            paths = future.result()
+        self._paths = paths
+        self._files.value = ()
+        self._first_page()
+        # Select the default files of the initial directory, starting on
+        # the page of the first of them.
+        default = [f for f in self._default if f in self._matches]
+        self._default = []
+        if default:
+            index = self._matches.index(default[0])
+            self._show_page(index // self.page_size)
+            options = self._options().values()
+            self._files.value = tuple(f for f in default if f in options)
+
+    def _first_page(self):
+        """Show the first page of the filtered directory listing."""
+        self._show_page(0)
+
+    def _show_page(self, number):
+        """Show the numbered page of the filtered directory listing."""
+        if self._page.value != number:
+            # The page observer updates the options.
+            self._page.value = number
+        else:
+            self._update_options()
+
+    def _handle_filter(self, sender):
+        """Filter box action."""
+        self._filter_debouncer.submit()
+
+    def _handle_filter_settled(self):
+        """Filter the directory listing once the filter has settled."""
+        self._first_page()
+
+    def _handle_page(self, sender):
+        """Page box action."""
+        self._update_options()
 
     @property
     def box(self):
@@ -177,7 +278,12 @@ class Explorer(traitlets.HasTraits):
     """
     _cubes = traitlets.List()
 
-    def __init__(self, url=''):
+    def __init__(self, url='', catalogue=None):
+        # The catalogue of the cubes of each file, so that the headers of
+        # unchanged files are not parsed again on load.
+        if catalogue is None:
+            catalogue = Catalogue()
+        self.catalogue = catalogue
         self.file_pickers = []
         if url:
             o = urlparse(url)
@@ -281,11 +387,15 @@ class Explorer(traitlets.HasTraits):
         """Load button action."""
         IPython.display.clear_output()
         sender.description = 'loading......'
-        fpfs = [fp.files for fp in self.file_pickers]
-        selected_files = reduce(list.__add__, (list(files) for files in fpfs))
+        selected_files = [fname for fp in self.file_pickers
+                          for fname in fp.files]
+
+        def progress(count, total):
+            sender.description = 'loading {}/{}'.format(count, total)
+
         # Reassigning into self._cubes updates the cube_pickers.
-        self._cubes = iris.load(selected_files)
-        self._cubes = self._cubes.concatenate()
+        self._cubes = load_files(selected_files, progress=progress,
+                                 catalogue=self.catalogue)
         sender.description = 'files loaded, reload'
         IPython.display.clear_output()
 
@@ -349,20 +459,11 @@ class Explorer(traitlets.HasTraits):
                 if x_name == pc_x_name and y_name == pc_y_name:
                     proj = iplt.default_projection(cube) or ccrs.PlateCarree()
                     ax = fig.add_subplot(sub_plots + spl, projection=proj)
-                    # If the spatial extent is small, use high-res coastlines
-                    extent = iplt.default_projection_extent(cube)
-                    x0, y0 = ccrs.PlateCarree().transform_point(extent[0],
-                                                                extent[2],
-                                                                proj)
-                    x1, y1 = ccrs.PlateCarree().transform_point(extent[1],
-                                                                extent[3],
-                                                                proj)
-                    if x1-x0 < 20 and y1-y0 < 20:
-                        ax.coastlines(resolution='10m')
-                    elif x1-x0 < 180 and y1-y0 < 90:
-                        ax.coastlines(resolution='50m')
-                    else:
-                        ax.coastlines()
+                    # If the spatial extent is small, use high-res
+                    # coastlines. The projected coastlines are cached.
+                    extent = cube_extent(cube, proj)
+                    add_coastlines(ax, extent_resolution(extent, proj),
+                                   extent)
                 else:
                     ax = plt.gca()
                     ax = fig.add_subplot(sub_plots+spl)
@@ -0,0 +1,293 @@
+"""Parallel rendering and export of Browser animation frames."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+from collections import deque, namedtuple
+import io
+import multiprocessing
+import subprocess
+import uuid
+
+import matplotlib
+
+from cube_browser.coastlines import CoastlineCollection, add_coastlines
+from cube_browser.workers import process_context
+
+
+# The definition of a figure, in terms of its size, resolution, axes and
+# plots, that may be sent to a worker process.
+_FigureDefn = namedtuple('_FigureDefn', 'token, size, dpi, axes, plots')
+
+# The definition of an axes, in terms of its position within the figure,
+# its projection, view limits, title, cartopy features and cached
+# coastlines.
+_AxesDefn = namedtuple('_AxesDefn',
+                       'bounds, projection, xlim, ylim, title, features, '
+                       'coastlines')
+
+# The definition of a plot, and the index of its axes within the figure.
+_PlotDefn = namedtuple('_PlotDefn',
+                       'plot_type, cube, coords, kwargs, aliases, lod, '
+                       'names, axes, legend')
+
+# Mapping of figure definition token to the (figure, plots) rendered by
+# a worker process.
+_FIGURES = {}
+
+# The figure definition of the frames rendered by a worker process.
+_DEFINITION = None
+
+
+def _features(axes):
+    """The (feature, kwargs) of each cartopy feature artist of the axes."""
+    try:
+        from cartopy.mpl.feature_artist import FeatureArtist
+    except ImportError:
+        return []
+    return [(artist._feature, artist._kwargs) for artist in axes.artists
+            if isinstance(artist, FeatureArtist)]
+
+
+def _coastlines(axes):
+    """
+    The (resolution, extent, kwargs) of each cached coastline collection
+    of the axes.
+
+    """
+    return [(collection.resolution, collection.extent, collection.kwargs)
+            for collection in axes.collections
+            if isinstance(collection, CoastlineCollection)]
+
+
+def figure_definition(plots, names, legend=True, dpi=None):
+    """
+    Returns a picklable definition of the figure of the plots, from which a
+    worker process may build its own copy of the figure.
+
+    Args:
+
+    * plots
+        The cube_browser plot instances of the figure.
+
+    * names
+        The slider names of each plot, as a list of lists of names.
+
+    Kwargs:
+
+    * legend
+        Whether each plot has a colour bar legend. Defaults to True.
+
+    * dpi
+        The resolution of the figure. Defaults to that of the figure.
+
+    """
+    figures = set(id(plot.axes.figure) for plot in plots)
+    if len(figures) != 1:
+        emsg = 'Require plots on exactly one figure, got {}.'
+        raise ValueError(emsg.format(len(figures)))
+    figure = plots[0].axes.figure
+    axes_defns = []
+    index_by_axes_id = {}
+    plot_defns = []
+    for plot, plot_names in zip(plots, names):
+        axes = plot.axes
+        if id(axes) not in index_by_axes_id:
+            index_by_axes_id[id(axes)] = len(axes_defns)
+            defn = _AxesDefn(bounds=axes.get_position().bounds,
+                             projection=getattr(axes, 'projection', None),
+                             xlim=axes.get_xlim(), ylim=axes.get_ylim(),
+                             title=axes.get_title(),
+                             features=_features(axes),
+                             coastlines=_coastlines(axes))
+            axes_defns.append(defn)
+        defn = _PlotDefn(plot_type=type(plot), cube=plot.cube,
+                         coords=plot.coords, kwargs=dict(plot.kwargs),
+                         aliases=plot.aliases, lod=plot.lod,
+                         names=list(plot_names),
+                         axes=index_by_axes_id[id(axes)], legend=legend)
+        plot_defns.append(defn)
+    if dpi is None:
+        dpi = figure.dpi
+    return _FigureDefn(token=uuid.uuid4().hex,
+                       size=tuple(figure.get_size_inches()), dpi=dpi,
+                       axes=axes_defns, plots=plot_defns)
+
+
+def _build(definition):
+    """Build the figure and plots of the definition, on the Agg backend."""
+    import matplotlib.pyplot as plt
+
+    plt.switch_backend('agg')
+    figure = plt.figure(figsize=definition.size, dpi=definition.dpi)
+    axes_list = []
+    for defn in definition.axes:
+        kwargs = {}
+        if defn.projection is not None:
+            kwargs['projection'] = defn.projection
+        axes = figure.add_axes(defn.bounds, **kwargs)
+        for feature, feature_kwargs in defn.features:
+            axes.add_feature(feature, **feature_kwargs)
+        for resolution, extent, coastline_kwargs in defn.coastlines:
+            add_coastlines(axes, resolution, extent, **coastline_kwargs)
+        axes.set_title(defn.title)
+        axes_list.append(axes)
+    plots = []
+    for defn in definition.plots:
+        plot = defn.plot_type(defn.cube, axes_list[defn.axes],
+                              coords=defn.coords, lod=defn.lod,
+                              **defn.kwargs)
+        if defn.aliases:
+            plot.alias(**defn.aliases)
+        plots.append(plot)
+    return figure, axes_list, plots
+
+
+def render_frame(definition, frame, format='png'):
+    """
+    Render a frame of the figure definition with the Agg backend.
+
+    The figure is built on the first frame rendered by the calling process,
+    and reused for later frames of the same definition.
+
+    Args:
+
+    * definition
+        The figure definition, see :func:`figure_definition`.
+
+    * frame
+        Dictionary of the slider name and index value of the frame.
+
+    Kwargs:
+
+    * format
+        The image file format. Defaults to 'png'.
+
+    Returns the encoded image bytes.
+
+    """
+    first = definition.token not in _FIGURES
+    if first:
+        _FIGURES.clear()
+        _FIGURES[definition.token] = _build(definition)
+    figure, axes_list, plots = _FIGURES[definition.token]
+    for plot, defn in zip(plots, definition.plots):
+        if first or defn.names:
+            if not first:
+                plot.clear()
+            mappable = plot(**{name: frame[name] for name in defn.names})
+            if first and defn.legend:
+                plot.legend(mappable)
+    if first:
+        # Restore the view of each axes, after the plots have autoscaled.
+        for axes, defn in zip(axes_list, definition.axes):
+            axes.set_xlim(defn.xlim)
+            axes.set_ylim(defn.ylim)
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format=format, dpi=definition.dpi)
+    return buffer.getvalue()
+
+
+def _initialise(definition):
+    """Receive the figure definition, once per worker process."""
+    global _DEFINITION
+    _DEFINITION = definition
+
+
+def _render(frame, format):
+    """Render a frame of the figure definition of the worker process."""
+    return render_frame(_DEFINITION, frame, format=format)
+
+
+def render_frames(definition, frames, processes=None, format='png'):
+    """
+    Render the frames of the figure definition in parallel worker
+    processes, see :func:`render_frame`.
+
+    The definition, including the plot cubes, is sent once to each worker
+    process as it starts, and each frame sends only its slider values.
+    Workers are started in the
+    :func:`~cube_browser.workers.process_context`. Only a bounded number
+    of frames are rendered ahead of the frame that is next to be consumed.
+
+    Args:
+
+    * definition
+        The figure definition, see :func:`figure_definition`.
+
+    * frames
+        Iterable of dictionaries of the slider name and index value of
+        each frame.
+
+    Kwargs:
+
+    * processes
+        The number of worker processes. Defaults to the number of
+        processors on the machine.
+
+    * format
+        The image file format. Defaults to 'png'.
+
+    Generates the encoded image bytes of each frame, in frame order.
+
+    """
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+    pool = process_context().Pool(processes, initializer=_initialise,
+                                  initargs=(definition,))
+    try:
+        pending = deque()
+        for frame in frames:
+            pending.append(pool.apply_async(_render, (frame, format)))
+            if len(pending) >= 2 * processes:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def write_frames(images, filename, fps=10):
+    """
+    Write the encoded images to disk, in order, as they become available.
+
+    Args:
+
+    * images
+        Iterable of encoded image bytes.
+
+    * filename
+        Either a format string of the filename of each image, given the
+        frame number, e.g. 'frames/{:04d}.png', or the filename of a
+        video to encode with ffmpeg.
+
+    Kwargs:
+
+    * fps
+        The frame rate of a video. Defaults to 10.
+
+    Returns the number of frames written.
+
+    """
+    count = 0
+    if '{' in filename:
+        for count, image in enumerate(images, 1):
+            with open(filename.format(count - 1), 'wb') as fh:
+                fh.write(image)
+    else:
+        command = [matplotlib.rcParams['animation.ffmpeg_path'], '-y',
+                   '-loglevel', 'error', '-f', 'image2pipe',
+                   '-framerate', str(fps), '-i', '-',
+                   '-pix_fmt', 'yuv420p', filename]
+        process = subprocess.Popen(command, stdin=subprocess.PIPE)
+        try:
+            for count, image in enumerate(images, 1):
+                process.stdin.write(image)
+        finally:
+            process.stdin.close()
+            returncode = process.wait()
+        if returncode:
+            emsg = 'Failed to encode {!r}, ffmpeg exited with status {}.'
+            raise RuntimeError(emsg.format(filename, returncode))
+    return count
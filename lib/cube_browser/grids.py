@@ -0,0 +1,129 @@
+"""Plot coordinate grids transformed once to a target projection."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+from collections import namedtuple
+import hashlib
+
+import numpy as np
+
+from cube_browser.coastlines import projection_key
+from cube_browser.lod import plot_dims
+
+
+#: The x and y coordinate arrays of a plot grid, in the target projection.
+Grid = namedtuple('Grid', 'x, y')
+
+
+def source_crs(cube, coords):
+    """
+    Returns the cartopy CRS of the plot coordinates of the cube, or None
+    when a plot dimension is anonymous or the plot coordinates do not
+    share a coordinate system.
+
+    """
+    systems = []
+    for name in coords:
+        if isinstance(name, int):
+            return None
+        systems.append(cube.coord(name).coord_system)
+    if systems[0] is None or systems[0] != systems[1]:
+        return None
+    return systems[0].as_cartopy_crs()
+
+
+def _edges(coord):
+    """The contiguous cell edges of the 1d coordinate."""
+    if not coord.has_bounds():
+        coord = coord.copy()
+        coord.guess_bounds()
+    bounds = coord.bounds
+    return np.append(bounds[:, 0], bounds[-1, 1])
+
+
+def _digest(coord):
+    """A digest of the points and any bounds of the coordinate."""
+    result = hashlib.sha1()
+    for values in (coord.points, coord.bounds):
+        if values is not None:
+            values = np.ascontiguousarray(values)
+            result.update(repr((values.dtype.str, values.shape)).encode())
+            result.update(values.tobytes())
+    return result.hexdigest()
+
+
+def grid_key(cube, coords, projection, corners):
+    """
+    The cache key of the plot coordinate grid of the 2d cube in the
+    target projection, of either cell corners or points.
+
+    The key identifies the grid by a digest of the points and bounds of
+    each plot coordinate, so slices of the same cube, at the same
+    level-of-detail, share a grid.
+
+    """
+    coord_keys = []
+    for name in coords:
+        if isinstance(name, int):
+            coord_keys.append(cube.shape[name])
+        else:
+            coord_keys.append(_digest(cube.coord(name)))
+    return (projection_key(projection), tuple(coord_keys), corners)
+
+
+def project_grid(cube, coords, projection, corners=False):
+    """
+    Transform the plot coordinate grid of the 2d cube to the target
+    projection.
+
+    Args:
+
+    * cube
+        The 2d :class:`~iris.cube.Cube` of the grid.
+
+    * coords
+        The cube plot coordinates, in (x-axis, y-axis) order.
+
+    * projection
+        The cartopy projection of the target axes.
+
+    Kwargs:
+
+    * corners
+        Whether to transform the cell corners, as for a pseudocolour mesh,
+        rather than the points, as for contouring. Defaults to False.
+
+    Returns the :class:`Grid` of 2d (y, x) arrays, or None when the grid
+    is already in the target projection, has no coordinate system, or
+    wraps around the target projection, where the grid must be
+    transformed by iris and cartopy as usual.
+
+    """
+    crs = source_crs(cube, coords)
+    if crs is None or crs == projection:
+        return None
+    xcoord, ycoord = [cube.coord(name) for name in coords]
+    if corners:
+        x, y = _edges(xcoord), _edges(ycoord)
+    else:
+        x, y = xcoord.points, ycoord.points
+    x, y = np.meshgrid(x, y)
+    points = projection.transform_points(crs, x, y)
+    x, y = points[..., 0], points[..., 1]
+    if not (np.isfinite(x).all() and np.isfinite(y).all()):
+        return None
+    # Cells that span more than half the projection have wrapped around
+    # it, and must be split by cartopy.
+    span = abs(projection.x_limits[1] - projection.x_limits[0])
+    if x.shape[1] > 1 and (np.abs(np.diff(x, axis=1)) > span / 2).any():
+        return None
+    return Grid(x, y)
+
+
+def grid_data(cube, coords):
+    """The data of the 2d cube, oriented (y, x) to match its grid."""
+    data = cube.data
+    if plot_dims(cube, coords)[0] == 0:
+        data = data.T
+    return data
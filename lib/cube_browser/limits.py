@@ -0,0 +1,312 @@
+"""Colour limits and contour levels from a streaming reduction of a cube."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+import itertools
+import threading
+import weakref
+
+import numpy as np
+
+from cube_browser.cache import realise
+from cube_browser.workers import SerialExecutor
+
+
+#: The supported modes of :meth:`Limits.range` and :meth:`Limits.levels`.
+MODES = ('minmax', 'robust', 'histogram')
+
+#: The default lower and upper percentiles of a robust data range.
+DEFAULT_PERCENTILES = (2, 98)
+
+#: The default number of contour levels.
+DEFAULT_NLEVELS = 10
+
+#: The default number of histogram bins of a streaming reduction.
+DEFAULT_BINS = 4096
+
+#: The default maximum number of bytes of data realised at once by a
+#: streaming reduction.
+DEFAULT_BLOCK_BYTES = 64 * 1024 ** 2
+
+# Mapping of reduction key to (cube weak reference, limits).
+_LIMITS_BY_KEY = {}
+_LIMITS_LOCK = threading.Lock()
+
+# The executor of background reductions.
+_EXECUTOR = SerialExecutor()
+
+
+class Limits(object):
+    """
+    The data range and histogram of the data payload of a cube, from which
+    colour limits and contour levels may be derived.
+
+    """
+    def __init__(self, vmin, vmax, counts, edges):
+        """
+        Args:
+
+        * vmin
+            The minimum data value.
+
+        * vmax
+            The maximum data value.
+
+        * counts
+            The number of data values within each histogram bin.
+
+        * edges
+            The histogram bin edges.
+
+        """
+        self.vmin = vmin
+        self.vmax = vmax
+        self.counts = counts
+        self.edges = edges
+
+    def __repr__(self):
+        fmt = '{}(vmin={!r}, vmax={!r}, bins={})'
+        return fmt.format(type(self).__name__, self.vmin, self.vmax,
+                          self.counts.size)
+
+    def percentile(self, q):
+        """
+        Returns the approximate percentile, or array of percentiles, of the
+        data, interpolated from the histogram.
+
+        """
+        cdf = np.concatenate([[0], np.cumsum(self.counts)])
+        cdf = cdf / cdf[-1]
+        result = np.interp(np.asarray(q) / 100., cdf, self.edges)
+        return np.clip(result, self.vmin, self.vmax)
+
+    def range(self, mode='minmax', percentiles=None):
+        """
+        Returns the (lower, upper) data range.
+
+        Kwargs:
+
+        * mode
+            Either 'minmax' for the full data range, or 'robust' or
+            'histogram' for the range between the lower and upper
+            percentiles. Defaults to 'minmax'.
+
+        * percentiles
+            The lower and upper percentiles of a robust range. Defaults to
+            :data:`DEFAULT_PERCENTILES`.
+
+        """
+        _check_mode(mode)
+        if mode == 'minmax':
+            result = (self.vmin, self.vmax)
+        else:
+            if percentiles is None:
+                percentiles = DEFAULT_PERCENTILES
+            result = tuple(float(value) for value in
+                           self.percentile(percentiles))
+        return result
+
+    def levels(self, nlevels, mode='minmax', percentiles=None):
+        """
+        Returns an array of contour levels.
+
+        Args:
+
+        * nlevels
+            The number of levels.
+
+        Kwargs:
+
+        * mode
+            Either 'minmax' or 'robust' for levels equally spaced over the
+            data range, see :meth:`range`, or 'histogram' for levels at
+            equally spaced percentiles of the data within the robust range,
+            such that each band holds roughly the same number of values.
+            Defaults to 'minmax'.
+
+        * percentiles
+            The lower and upper percentiles of a robust range. Defaults to
+            :data:`DEFAULT_PERCENTILES`.
+
+        """
+        _check_mode(mode)
+        if mode == 'histogram':
+            if percentiles is None:
+                percentiles = DEFAULT_PERCENTILES
+            lower, upper = percentiles
+            result = np.unique(self.percentile(np.linspace(lower, upper,
+                                                           nlevels)))
+        else:
+            lower, upper = self.range(mode, percentiles)
+            result = np.linspace(lower, upper, nlevels)
+        return result
+
+
+def _check_mode(mode):
+    if mode not in MODES:
+        emsg = 'Require a limits mode of {}, got {!r}.'
+        raise ValueError(emsg.format(', '.join(map(repr, MODES)), mode))
+
+
+class _Histogram(object):
+    """
+    A fixed number of equal width bins that stretch to cover the range of
+    the values seen so far, re-binning the existing counts as required.
+
+    """
+    def __init__(self, bins):
+        self.bins = bins
+        self.vmin = None
+        self.vmax = None
+        self.counts = None
+        self.edges = None
+
+    def _rebin(self, lower, upper):
+        if lower == upper:
+            lower, upper = lower - 0.5, upper + 0.5
+        edges = np.linspace(lower, upper, self.bins + 1)
+        counts = np.zeros(self.bins, dtype=np.int64)
+        if self.counts is not None:
+            # Assign the count of each existing bin to the new bin that
+            # contains its centre.
+            centres = 0.5 * (self.edges[:-1] + self.edges[1:])
+            index = np.searchsorted(edges, centres, side='right') - 1
+            np.add.at(counts, np.clip(index, 0, self.bins - 1), self.counts)
+        self.edges = edges
+        self.counts = counts
+
+    def update(self, data):
+        """Add the valid, finite values of the data to the histogram."""
+        values = np.ma.compressed(data)
+        if values.dtype.kind in 'biu':
+            # Reduce boolean and integer data as floating point, for which
+            # the range and bin arithmetic is defined without overflow.
+            values = values.astype(np.float64)
+        values = values[np.isfinite(values)]
+        if values.size == 0:
+            return
+        vmin, vmax = values.min().item(), values.max().item()
+        if self.counts is None:
+            self.vmin, self.vmax = vmin, vmax
+            self._rebin(vmin, vmax)
+        else:
+            lower, upper = self.edges[0], self.edges[-1]
+            if vmin < lower or vmax > upper:
+                # Stretch generously, to limit the number of re-binnings.
+                span = upper - lower
+                if vmin < lower:
+                    lower = min(vmin, lower - 0.5 * span)
+                if vmax > upper:
+                    upper = max(vmax, upper + 0.5 * span)
+                self._rebin(lower, upper)
+            self.vmin, self.vmax = min(self.vmin, vmin), max(self.vmax, vmax)
+        counts, _ = np.histogram(values, bins=self.edges)
+        self.counts += counts
+
+
+def _blocks(shape, plot_dims, chunks, itemsize, max_bytes):
+    """
+    Generate the index of each block of the cube to realise, spanning the
+    plot dimensions and whole on-disk chunks of the first slider dimension
+    where possible, within the byte budget.
+
+    """
+    slider_dims = [dim for dim in range(len(shape)) if dim not in plot_dims]
+    if not slider_dims:
+        yield (slice(None),) * len(shape)
+        return
+    nbytes = itemsize
+    for dim in plot_dims:
+        nbytes *= shape[dim]
+    first = slider_dims[0]
+    step = chunks[first] if chunks is not None else 1
+    step = max(1, min(step, max_bytes // max(nbytes, 1)))
+    ranges = [range(0, shape[first], step)]
+    ranges.extend(range(shape[dim]) for dim in slider_dims[1:])
+    for values in itertools.product(*ranges):
+        index = [slice(None)] * len(shape)
+        index[first] = slice(values[0], min(values[0] + step, shape[first]))
+        for dim, value in zip(slider_dims[1:], values[1:]):
+            index[dim] = value
+        yield tuple(index)
+
+
+def reduce_cube(cube, plot_dims, bins=None, chunks=None, max_bytes=None):
+    """
+    Calculate the :class:`Limits` of the data payload of the cube in a
+    single streaming pass, realising a bounded block of data at a time.
+
+    Args:
+
+    * cube
+        The :class:`~iris.cube.Cube` to reduce.
+
+    * plot_dims
+        The cube dimensions of the plot axes, which each block spans.
+
+    Kwargs:
+
+    * bins
+        The number of histogram bins. Defaults to :data:`DEFAULT_BINS`.
+
+    * chunks
+        The on-disk chunk shape of the cube, used to align the blocks with
+        whole chunks, if known.
+
+    * max_bytes
+        The maximum number of bytes of data to realise at once. Defaults
+        to :data:`DEFAULT_BLOCK_BYTES`.
+
+    """
+    if bins is None:
+        bins = DEFAULT_BINS
+    if max_bytes is None:
+        max_bytes = DEFAULT_BLOCK_BYTES
+    histogram = _Histogram(bins)
+    itemsize = cube.lazy_data().dtype.itemsize
+    for index in _blocks(cube.shape, set(plot_dims), chunks, itemsize,
+                         max_bytes):
+        histogram.update(realise(cube[index]))
+    if histogram.counts is None:
+        emsg = 'Cube {!r} has no valid data values.'
+        raise ValueError(emsg.format(cube.name()))
+    return Limits(histogram.vmin, histogram.vmax, histogram.counts,
+                  histogram.edges)
+
+
+def cube_limits(cube, plot_dims, bins=None, chunks=None, max_bytes=None):
+    """
+    Returns the :class:`Limits` of the data payload of the cube, see
+    :func:`reduce_cube`.
+
+    The result is cached for the lifetime of the cube, so plots that
+    share a cube reduce its data only once.
+
+    """
+    if bins is None:
+        bins = DEFAULT_BINS
+    key = (id(cube), tuple(sorted(plot_dims)), bins)
+    with _LIMITS_LOCK:
+        ref, result = _LIMITS_BY_KEY.get(key, (None, None))
+    if ref is None or ref() is not cube:
+        result = reduce_cube(cube, plot_dims, bins=bins, chunks=chunks,
+                             max_bytes=max_bytes)
+        with _LIMITS_LOCK:
+            # Discard the entries of cubes that no longer exist.
+            for other in [other for other, (ref, _) in _LIMITS_BY_KEY.items()
+                          if ref() is None]:
+                del _LIMITS_BY_KEY[other]
+            _LIMITS_BY_KEY[key] = (weakref.ref(cube), result)
+    return result
+
+
+def submit(*args, **kwargs):
+    """
+    Calculate the :func:`cube_limits` in the background, one reduction at
+    a time.
+
+    Returns a :class:`concurrent.futures.Future` of the :class:`Limits`.
+
+    """
+    return _EXECUTOR.submit(cube_limits, *args, **kwargs)
@@ -0,0 +1,121 @@
+"""Cached, filtered and paged listings of large directories."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+import fnmatch
+import os
+import re
+import threading
+
+try:
+    from os import scandir
+except ImportError:
+    try:
+        # The backport of os.scandir, for Python 2.
+        from scandir import scandir
+    except ImportError:
+        scandir = None
+
+from cube_browser.workers import SerialExecutor
+
+
+#: The prefix of a filter pattern that is a regular expression, rather
+#: than a glob pattern.
+REGEX_PREFIX = 're:'
+
+# Mapping of (absolute directory path, directory path as given) to
+# (mtime, sorted list of entry paths).
+_LISTINGS = {}
+_LISTINGS_LOCK = threading.Lock()
+
+# The executor of background directory scans.
+_EXECUTOR = SerialExecutor()
+
+
+def _scan(dirname):
+    """The unsorted names of the visible entries of the directory."""
+    if scandir is not None:
+        names = [entry.name for entry in scandir(dirname)]
+    else:
+        names = os.listdir(dirname)
+    # Hidden entries are excluded, as by glob.
+    return [name for name in names if not name.startswith('.')]
+
+
+def list_directory(dirname):
+    """
+    Returns the sorted list of paths of the visible entries of the
+    directory, equivalent to a sorted glob of 'dirname/*'. The paths are
+    prefixed by the directory as given, so are relative for a relative
+    directory.
+
+    Listings are cached per directory, and a directory is only scanned
+    again when its modification time changes, which it does when entries
+    are added, removed or renamed.
+
+    """
+    key = (os.path.abspath(dirname), dirname)
+    mtime = os.stat(dirname).st_mtime
+    with _LISTINGS_LOCK:
+        cached_mtime, result = _LISTINGS.get(key, (None, None))
+    if cached_mtime != mtime:
+        result = [os.path.join(dirname, name)
+                  for name in sorted(_scan(dirname))]
+        with _LISTINGS_LOCK:
+            _LISTINGS[key] = (mtime, result)
+    return result
+
+
+def filter_paths(paths, pattern):
+    """
+    Returns the paths with a base name that matches the pattern.
+
+    Args:
+
+    * paths
+        The list of paths to filter.
+
+    * pattern
+        Either a glob pattern, such as '*.nc', or a regular expression
+        prefixed by :data:`REGEX_PREFIX` to search for, such as
+        're:_20[0-9]{2}'. An empty pattern matches all paths.
+
+    """
+    if not pattern:
+        return paths
+    if pattern.startswith(REGEX_PREFIX):
+        try:
+            match = re.compile(pattern[len(REGEX_PREFIX):]).search
+        except re.error as exception:
+            emsg = 'Invalid filter pattern {!r}: {}.'
+            raise ValueError(emsg.format(pattern, exception))
+    else:
+        match = re.compile(fnmatch.translate(pattern)).match
+    return [path for path in paths if match(os.path.basename(path))]
+
+
+def page(paths, number, size):
+    """
+    Returns the paths of the given page number, counting from zero, with
+    the given number of paths per page.
+
+    """
+    start = number * size
+    return paths[start:start + size]
+
+
+def npages(paths, size):
+    """Returns the number of pages of the paths, of at least one."""
+    return max(1, (len(paths) + size - 1) // size)
+
+
+def submit(dirname):
+    """
+    Calculate the :func:`list_directory` of the directory in the
+    background, one directory at a time.
+
+    Returns a :class:`concurrent.futures.Future` of the listing.
+
+    """
+    return _EXECUTOR.submit(list_directory, dirname)
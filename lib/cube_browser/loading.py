@@ -0,0 +1,104 @@
+"""Parallel loading of cubes from many files."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+from concurrent.futures import as_completed
+import multiprocessing
+
+import iris
+import iris.cube
+
+from cube_browser.workers import process_executor
+
+
+def _load_file(filename):
+    """
+    Returns the list of raw cubes of the file, without merging. The cube
+    data payloads remain lazy, so are cheap to return from a worker
+    process.
+
+    """
+    return list(iris.load_raw(filename))
+
+
+def _load_pending(filenames, pending, processes):
+    """
+    Generate the (index, raw cubes) of each pending file index, in order
+    of completion.
+
+    """
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+    processes = max(1, min(processes, len(pending)))
+    if processes == 1:
+        for index in pending:
+            yield index, _load_file(filenames[index])
+    else:
+        with process_executor(processes) as executor:
+            index_by_future = {executor.submit(_load_file,
+                                               filenames[index]): index
+                               for index in pending}
+            for future in as_completed(index_by_future):
+                yield index_by_future[future], future.result()
+
+
+def load_files(filenames, processes=None, progress=None, catalogue=None):
+    """
+    Load the cubes of the files, reading the metadata of each file in a
+    separate worker process.
+
+    The raw cubes of each file are combined in the order of the files,
+    whatever the order in which the workers complete, before they are
+    merged and concatenated. The result is therefore the same as that of a
+    serial :func:`iris.load` of the files followed by a concatenate.
+
+    Args:
+
+    * filenames
+        The iterable of files to load.
+
+    Kwargs:
+
+    * processes
+        The number of worker processes. Defaults to the number of
+        processors on the machine, but no more than the number of files.
+        One loads the files serially, in the calling process. See
+        :func:`~cube_browser.workers.process_executor`.
+
+    * progress
+        Callable to report progress, which is called with the number of
+        files loaded and the total number of files, as each file is
+        loaded.
+
+    * catalogue
+        The :class:`~cube_browser.catalogue.Catalogue` of the raw cubes of
+        each file. Files that are catalogued and unchanged are not read,
+        and the other files are catalogued once read.
+
+    Returns the :class:`iris.cube.CubeList` of the cubes.
+
+    """
+    filenames = list(filenames)
+    total = len(filenames)
+    cubes_by_index = [None] * total
+    if catalogue is not None:
+        for index, filename in enumerate(filenames):
+            cubes_by_index[index] = catalogue.get(filename)
+    pending = [index for index, cubes in enumerate(cubes_by_index)
+               if cubes is None]
+    count = total - len(pending)
+    if progress is not None and count:
+        progress(count, total)
+    for index, cubes in _load_pending(filenames, pending, processes):
+        cubes_by_index[index] = cubes
+        if catalogue is not None:
+            catalogue.put(filenames[index], cubes)
+        count += 1
+        if progress is not None:
+            progress(count, total)
+    cubes = iris.cube.CubeList()
+    for file_cubes in cubes_by_index:
+        cubes.extend(file_cubes)
+    # Duplicate cubes are retained, rather than rejected, as by iris.load.
+    return cubes.merge(unique=False).concatenate()
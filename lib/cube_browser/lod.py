@@ -0,0 +1,163 @@
+"""Level-of-detail decimation of cube slices to display resolution."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+import numpy as np
+
+
+#: The supported block reduction methods of :func:`decimate`.
+METHODS = ('mean', 'max', 'nearest')
+
+
+def plot_dims(cube, coords):
+    """
+    Returns the cube dimension of each plot coordinate or dimension, in
+    (x-axis, y-axis) order.
+
+    """
+    return tuple(coord if isinstance(coord, int) else
+                 cube.coord_dims(coord)[0] for coord in coords)
+
+
+def screen_factors(axes, shape, oversample=1):
+    """
+    Determine the decimation factor of each plot axis that brings the
+    number of visible cells down to roughly the number of pixels of the
+    axes.
+
+    The visible fraction of the data is taken from the view limits of the
+    axes, so zooming in reduces the factors, down to full resolution.
+
+    Args:
+
+    * axes
+        The matplotlib axes.
+
+    * shape
+        The number of cells along each plot axis, in (x-axis, y-axis)
+        order.
+
+    Kwargs:
+
+    * oversample
+        The number of cells to retain per pixel. Defaults to 1.
+
+    Returns a tuple of the integer factor of each plot axis.
+
+    """
+    bbox = axes.get_window_extent()
+    pixels = (bbox.width, bbox.height)
+    view, data = axes.viewLim, axes.dataLim
+    fractions = []
+    for visible, total in ((view.width, data.width),
+                           (view.height, data.height)):
+        fraction = 1.
+        if np.isfinite(total) and total > 0 and np.isfinite(visible):
+            fraction = min(1., abs(visible) / total)
+        fractions.append(fraction)
+    result = []
+    for size, npixels, fraction in zip(shape, pixels, fractions):
+        cells = max(1., npixels * oversample)
+        result.append(max(1, int(size * fraction // cells)))
+    return tuple(result)
+
+
+def _blocks(size, factor):
+    """Returns the start and stop index of each block along a dimension."""
+    starts = np.arange(0, size, factor)
+    stops = np.minimum(starts + factor, size)
+    return starts, stops
+
+
+def _reduce(data, dim, starts, stops, method):
+    """Reduce each block of the data along the dimension."""
+    if method == 'nearest':
+        return data.take((starts + stops - 1) // 2, axis=dim)
+    if data.dtype.kind == 'b':
+        # Reduce boolean data as floating point, which has a fill value
+        # below every valid value.
+        data = data.astype(np.float64)
+    mask = np.ma.getmaskarray(data)
+    counts = np.add.reduceat(~mask, starts, axis=dim, dtype=np.intp)
+    if method == 'mean':
+        dtype = data.dtype if data.dtype.kind == 'f' else np.float64
+        filled = np.ma.filled(data, 0).astype(dtype, copy=False)
+        result = np.add.reduceat(filled, starts, axis=dim)
+        result /= np.maximum(counts, 1)
+    else:
+        if data.dtype.kind == 'f':
+            fill = -np.inf
+        else:
+            fill = np.iinfo(data.dtype).min
+        filled = np.ma.filled(data, fill)
+        result = np.maximum.reduceat(filled, starts, axis=dim)
+    if mask.any():
+        result = np.ma.masked_array(result, mask=counts == 0)
+    return result
+
+
+def _coarsen(coord, starts, stops, method):
+    """Returns the coordinate of each block along its dimension."""
+    bounds = coord.bounds
+    if bounds is None:
+        guessed = coord.copy()
+        guessed.guess_bounds()
+        bounds = guessed.bounds
+    bounds = np.column_stack([bounds[starts, 0], bounds[stops - 1, 1]])
+    if method == 'nearest':
+        points = coord.points[(starts + stops - 1) // 2]
+    else:
+        points = np.add.reduceat(coord.points, starts) / (stops - starts)
+    return coord.copy(points=points, bounds=bounds)
+
+
+def decimate(cube, coords, factors, method='mean'):
+    """
+    Decimate the plot dimensions of the 2d cube, by reducing each block
+    of cells to a single cell.
+
+    Args:
+
+    * cube
+        The 2d :class:`~iris.cube.Cube` to decimate.
+
+    * coords
+        The cube coordinates or dimensions to decimate, in
+        (x-axis, y-axis) order.
+
+    * factors
+        The integer number of cells per block of each plot axis, in
+        (x-axis, y-axis) order.
+
+    Kwargs:
+
+    * method
+        The block reduction, one of 'mean', 'max' or 'nearest'. The
+        decimated dimension coordinates span the bounds of each block.
+        Defaults to 'mean'.
+
+    Returns the decimated :class:`~iris.cube.Cube`.
+
+    """
+    if method not in METHODS:
+        emsg = 'Require a decimation method of {}, got {!r}.'
+        raise ValueError(emsg.format(', '.join(map(repr, METHODS)), method))
+    result = cube
+    for dim, factor in zip(plot_dims(cube, coords), factors):
+        size = result.shape[dim]
+        if factor <= 1 or size < 2:
+            continue
+        starts, stops = _blocks(size, factor)
+        data = _reduce(result.data, dim, starts, stops, method)
+        index = [slice(None)] * result.ndim
+        index[dim] = (starts + stops - 1) // 2
+        # Auxiliary coordinates of the dimension take the nearest value.
+        decimated = result[tuple(index)]
+        decimated.data = data
+        dim_coords = result.coords(dimensions=dim, dim_coords=True)
+        if dim_coords:
+            coord = _coarsen(dim_coords[0], starts, stops, method)
+            decimated.replace_coord(coord)
+        result = decimated
+    return result
@@ -0,0 +1,209 @@
+"""Background rendering of plots, superseded by newer renders."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import warnings
+
+from cube_browser.scheduler import _call_soon
+
+
+class RenderPipeline(object):
+    """
+    Fetches the data of each render of a group of plots on a pool of
+    worker threads, and commits the render on the event loop once its
+    data is ready, leaving the event loop free in the meantime.
+
+    A render supersedes every earlier render of the same plots. Superseded
+    renders that have not started are cancelled, a render that starts
+    only fetches the data of the plots it has not been superseded for,
+    and a render is only committed for the plots it has not been
+    superseded for by the time its data is ready. So only the newest
+    frame of each plot is committed, and the plots always converge on the
+    latest render.
+
+    """
+    def __init__(self, workers=1, call_soon=None):
+        """
+        Kwargs:
+
+        * workers
+            The number of worker threads that fetch the data of renders.
+            Defaults to 1.
+
+        * call_soon
+            Callable, safe to call from any thread, that schedules a
+            callback with the given arguments on the event loop. Defaults
+            to the tornado IOLoop of the kernel.
+
+        """
+        if workers < 1:
+            emsg = '{} requires at least 1 worker, got {}.'
+            raise ValueError(emsg.format(type(self).__name__, workers))
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._call_soon = call_soon
+        self._lock = threading.Lock()
+        # The number of the latest render.
+        self._generation = 0
+        # Mapping of plot-id to the number of its newest render.
+        self._generation_by_plot_id = {}
+        # Mapping of render number to the (future, plots) of each render
+        # that has not been committed.
+        self._pending = OrderedDict()
+        #: The number of renders submitted.
+        self.submitted = 0
+        #: The number of superseded renders cancelled before starting.
+        self.cancelled = 0
+        #: The number of renders committed, for at least one plot.
+        self.committed = 0
+        #: The number of plot frames fetched, but discarded as superseded.
+        self.discarded = 0
+        #: The number of failed renders rendered directly instead.
+        self.fallbacks = 0
+
+    @property
+    def pending(self):
+        """The number of renders that have not been committed."""
+        with self._lock:
+            return len(self._pending)
+
+    def _current(self, generation, plots):
+        """The plots for which the numbered render is the newest."""
+        generation_by_plot_id = self._generation_by_plot_id
+        return [plot for plot in plots
+                if generation_by_plot_id.get(id(plot)) == generation]
+
+    def _cancel_superseded(self):
+        """Cancel the superseded renders that have not started."""
+        for generation, (future, plots) in list(self._pending.items()):
+            if not self._current(generation, plots) and future.cancel():
+                del self._pending[generation]
+                self.cancelled += 1
+
+    def supersede(self, plots):
+        """
+        Supersede any pending render of the plots, such as when the plots
+        are rendered directly on the event loop.
+
+        """
+        with self._lock:
+            self._generation += 1
+            for plot in plots:
+                self._generation_by_plot_id[id(plot)] = self._generation
+            self._cancel_superseded()
+
+    def submit(self, plots, fetch, commit, fallback=None):
+        """
+        Render the plots in the background, superseding any pending render
+        of them.
+
+        Args:
+
+        * plots
+            The plots of the render.
+
+        * fetch
+            Callable with signature fetch(plots) that is called on a worker
+            thread with the plots of the render yet to be superseded, and
+            returns their data.
+
+        * commit
+            Callable with signature commit(plots, result) that is called on
+            the event loop with the plots of the render yet to be
+            superseded, and the result of the fetch.
+
+        Kwargs:
+
+        * fallback
+            Callable with signature fallback(plots) that is called on the
+            event loop with the plots of the render yet to be superseded,
+            when the fetch fails, to render them directly instead. Defaults
+            to None, which only warns of the failure.
+
+        Returns the :class:`concurrent.futures.Future` of the fetch.
+
+        """
+        call_soon = self._call_soon
+        if call_soon is None:
+            call_soon = _call_soon()
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            for plot in plots:
+                self._generation_by_plot_id[id(plot)] = generation
+            self._cancel_superseded()
+            future = self._executor.submit(self._fetch, generation, plots,
+                                           fetch)
+            self._pending[generation] = (future, plots)
+            self.submitted += 1
+        future.add_done_callback(
+            lambda future: call_soon(self._commit, generation, future,
+                                     commit, fallback))
+        return future
+
+    def _fetch(self, generation, plots, fetch):
+        """
+        Fetch the data of the plots of the render yet to be superseded, on
+        a worker thread.
+
+        Returns the (plots, result) of the fetch, or None when the render
+        has been superseded for every plot.
+
+        """
+        with self._lock:
+            plots = self._current(generation, plots)
+        result = None
+        if plots:
+            result = (plots, fetch(plots))
+        return result
+
+    def _commit(self, generation, future, commit, fallback=None):
+        """
+        Commit the fetched data of the render on the event loop, for the
+        plots it has not been superseded for, or fall back to rendering
+        them directly when the fetch failed.
+
+        """
+        with self._lock:
+            _, plots = self._pending.pop(generation, (None, []))
+        if future.cancelled():
+            return
+        exception = future.exception()
+        if exception is not None:
+            wmsg = '{} failed to render: {}'
+            warnings.warn(wmsg.format(type(self).__name__, exception))
+            if fallback is not None:
+                with self._lock:
+                    current = self._current(generation, plots)
+                if current:
+                    self.fallbacks += 1
+                    fallback(current)
+            return
+        outcome = future.result()
+        if outcome is None:
+            return
+        plots, result = outcome
+        with self._lock:
+            current = self._current(generation, plots)
+        self.discarded += len(plots) - len(current)
+        if current:
+            self.committed += 1
+            commit(current, result)
+
+    def cancel(self):
+        """
+        Supersede all pending renders, cancelling those that have not
+        started.
+
+        """
+        with self._lock:
+            self._generation_by_plot_id.clear()
+            self._cancel_superseded()
+
+    def shutdown(self, wait=True):
+        """Cancel pending renders and release the worker threads."""
+        self.cancel()
+        self._executor.shutdown(wait=wait)
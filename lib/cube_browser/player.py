@@ -0,0 +1,175 @@
+"""Playback of a slider axis at a target frame rate, with adaptive quality."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+import math
+import time
+
+from cube_browser.scheduler import _call_later
+
+
+#: The exponential smoothing factor of the measured frame cost.
+SMOOTHING = 0.3
+
+#: The fraction of the frame interval that a finer quality of frame is
+#: expected to fit within, before playback refines its quality.
+HEADROOM = 0.8
+
+#: The relative cost of a frame at the next finer quality. Halving the
+#: coarsening factor of both plot axes quadruples the rendered cells.
+REFINE_COST = 4
+
+
+class Player(object):
+    """
+    Advances a slider axis at a target frame rate, adapting the quality of
+    each frame to hold the rate.
+
+    The cost of each frame is measured, and smoothed over recent frames.
+    When frames exceed the frame interval, the plot slices are coarsened
+    by successive factors of two, up to a maximum factor, after which
+    frames are skipped so that the slider still advances at the target
+    rate. When frames are cheap enough, the quality is refined again.
+    Pausing renders the current frame at full quality, as does a frame
+    that fails to render, which stops playback.
+
+    """
+    def __init__(self, render, fps=10, max_coarsen=8, call_later=None,
+                 clock=None, on_error=None):
+        """
+        Args:
+
+        * render
+            Callable with signature render(step, coarsen), that advances
+            the slider by the given number of positions, and renders the
+            plots with the given integer coarsening factor of both plot
+            axes, where 1 is full quality.
+
+        Kwargs:
+
+        * fps
+            The target number of frames per second. Defaults to 10.
+
+        * max_coarsen
+            The maximum coarsening factor, beyond which frames are skipped
+            instead. Defaults to 8.
+
+        * call_later
+            Callable that schedules a callback on the event loop, with
+            signature call_later(delay, callback). Defaults to the tornado
+            IOLoop of the kernel.
+
+        * clock
+            Callable returning the current time in seconds. Defaults to
+            :func:`time.time`.
+
+        * on_error
+            Callable with no arguments, called when a frame fails to
+            render, after playback is paused. Defaults to None.
+
+        """
+        if fps <= 0:
+            emsg = '{} requires a positive frame rate, got {}.'
+            raise ValueError(emsg.format(type(self).__name__, fps))
+        if max_coarsen < 1:
+            emsg = '{} requires a maximum coarsening of at least 1, got {}.'
+            raise ValueError(emsg.format(type(self).__name__, max_coarsen))
+        self._render = render
+        #: The target interval in seconds between frames.
+        self.interval = 1. / fps
+        #: The maximum coarsening factor of the plot axes.
+        self.max_coarsen = max_coarsen
+        self._call_later = _call_later if call_later is None else call_later
+        self._clock = time.time if clock is None else clock
+        self._on_error = on_error
+        #: The coarsening factor of the plot axes of each frame.
+        self.coarsen = 1
+        #: The number of slider positions advanced by each frame.
+        self.stride = 1
+        #: The smoothed cost in seconds of a frame at the current quality,
+        #: or None when not yet measured.
+        self.cost = None
+        self._playing = False
+        # The number of the latest play or pause, to identify frames
+        # scheduled before it.
+        self._generation = 0
+        #: The number of frames rendered.
+        self.rendered = 0
+        #: The number of slider positions skipped.
+        self.skipped = 0
+
+    @property
+    def playing(self):
+        """Whether playback is in progress."""
+        return self._playing
+
+    def play(self):
+        """Start advancing the slider, from the next position."""
+        if not self._playing:
+            self._playing = True
+            self._generation += 1
+            self._schedule(0)
+
+    def pause(self):
+        """
+        Stop advancing the slider, and render the current frame at full
+        quality.
+
+        The adapted quality is retained for when playback resumes.
+
+        """
+        if self._playing:
+            self._playing = False
+            self._generation += 1
+            if self.coarsen > 1:
+                self._render(0, 1)
+
+    def _schedule(self, delay):
+        generation = self._generation
+
+        def tick():
+            if generation == self._generation:
+                self._tick()
+
+        self._call_later(delay, tick)
+
+    def _tick(self):
+        """Render the next frame, and schedule the one after it."""
+        start = self._clock()
+        step = self.stride
+        try:
+            self._render(step, self.coarsen)
+        except Exception:
+            try:
+                self.pause()
+            finally:
+                if self._on_error is not None:
+                    self._on_error()
+            raise
+        cost = self._clock() - start
+        self.rendered += 1
+        self.skipped += step - 1
+        self._adapt(cost)
+        if self._playing:
+            self._schedule(max(0, self.interval - cost))
+
+    def _adapt(self, cost):
+        """Adjust the quality and stride of frames, given a frame cost."""
+        if self.cost is None:
+            self.cost = cost
+        else:
+            self.cost += SMOOTHING * (cost - self.cost)
+        load = self.cost / self.interval
+        if load > 1 and self.coarsen < self.max_coarsen:
+            self.coarsen = min(2 * self.coarsen, self.max_coarsen)
+            self.stride = 1
+            self.cost = None
+        elif load * REFINE_COST < HEADROOM and self.coarsen > 1:
+            self.coarsen //= 2
+            self.stride = 1
+            self.cost = None
+        else:
+            # Skip positions when even the coarsest frames exceed the
+            # interval, to advance the slider at the target rate.
+            self.stride = max(1, int(math.ceil(load)))
@@ -0,0 +1,84 @@
+"""Background prefetching of plot sub-cubes into the plot cache."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import warnings
+
+
+class Prefetcher(object):
+    """
+    Loads plot sub-cubes into their plot cache on a pool of worker threads,
+    ahead of them being requested for rendering.
+
+    """
+    def __init__(self, workers=1):
+        """
+        Kwargs:
+
+        * workers
+            The number of worker threads used to read sub-cubes.
+            Defaults to 1.
+
+        """
+        if workers < 1:
+            emsg = '{} requires at least 1 worker, got {}.'
+            raise ValueError(emsg.format(type(self).__name__, workers))
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        # The outstanding futures from the latest call to schedule.
+        self._futures = []
+        self._lock = threading.RLock()
+
+    def schedule(self, requests):
+        """
+        Replace any pending work with the given prefetch requests.
+
+        Requests that have not yet started are cancelled, as they relate
+        to a slider state that is no longer current.
+
+        Args:
+
+        * requests
+            An iterable of (plot, kwargs) pairs, in priority order, where
+            kwargs are the named slider values to fetch for the plot.
+
+        Returns the list of futures for the requests that were submitted.
+
+        """
+        with self._lock:
+            self.cancel()
+            futures = []
+            seen = set()
+            for plot, kwargs in requests:
+                key = plot._key(**kwargs)
+                # Plots may share a cache, so only fetch each key once.
+                cache_key = (id(plot.cache), key)
+                if cache_key in seen or key in plot.cache:
+                    continue
+                seen.add(cache_key)
+                futures.append(self._executor.submit(self._fetch, plot,
+                                                     kwargs))
+            self._futures = futures
+        return futures
+
+    @staticmethod
+    def _fetch(plot, kwargs):
+        try:
+            plot.fetch(**kwargs)
+        except Exception as exc:
+            wmsg = '{!r} failed to prefetch {!r}: {}'
+            warnings.warn(wmsg.format(type(plot).__name__, kwargs, exc))
+
+    def cancel(self):
+        """Cancel all pending prefetch requests that have not started."""
+        with self._lock:
+            for future in self._futures:
+                future.cancel()
+            self._futures = []
+
+    def shutdown(self, wait=True):
+        """Cancel pending requests and release the worker threads."""
+        self.cancel()
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,162 @@
+"""Coalescing and rate limiting of widget events."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+from collections import OrderedDict
+import time
+
+
+def _call_later(delay, callback):
+    """
+    Schedule the callback on the kernel event loop after the delay in
+    seconds.
+
+    """
+    from tornado.ioloop import IOLoop
+    return IOLoop.current().call_later(delay, callback)
+
+
+def _call_soon():
+    """
+    Returns a callable, safe to call from any thread, that schedules a
+    callback with the given arguments on the kernel event loop of the
+    calling thread.
+
+    """
+    from tornado.ioloop import IOLoop
+    return IOLoop.current().add_callback
+
+
+class Scheduler(object):
+    """
+    Coalesces slider change events to the latest state of each changed
+    slider, and renders them at no more than a maximum frame rate.
+
+    Rendering is deferred to the event loop, so that a burst of queued
+    slider events results in a single render of the latest slider state.
+    The final slider state is always rendered.
+
+    """
+    def __init__(self, render, max_fps=10, call_later=None, clock=None):
+        """
+        Args:
+
+        * render
+            Callable that renders the latest state of the given list of
+            changed slider names.
+
+        Kwargs:
+
+        * max_fps
+            The maximum number of renders per second. Defaults to 10.
+
+        * call_later
+            Callable that schedules a callback on the event loop, with
+            signature call_later(delay, callback). Defaults to the tornado
+            IOLoop of the kernel.
+
+        * clock
+            Callable returning the current time in seconds. Defaults to
+            :func:`time.time`.
+
+        """
+        if max_fps <= 0:
+            emsg = '{} requires a positive maximum frame rate, got {}.'
+            raise ValueError(emsg.format(type(self).__name__, max_fps))
+        self._render = render
+        #: The minimum interval in seconds between renders.
+        self.interval = 1. / max_fps
+        self._call_later = _call_later if call_later is None else call_later
+        self._clock = time.time if clock is None else clock
+        # The slider names changed since the last render, in order.
+        self._pending = OrderedDict()
+        # Whether a render is scheduled on the event loop.
+        self._scheduled = False
+        # The time of the start of the last render.
+        self._last = None
+        #: The number of slider events received.
+        self.received = 0
+        #: The number of renders performed.
+        self.rendered = 0
+
+    @property
+    def pending(self):
+        """The slider names awaiting render, in order of change."""
+        return list(self._pending.keys())
+
+    def submit(self, name):
+        """
+        Register a change of the named slider, scheduling a render when
+        one is not already scheduled.
+
+        """
+        self.received += 1
+        # Move the name to the end, as the most recently changed.
+        self._pending.pop(name, None)
+        self._pending[name] = None
+        if not self._scheduled:
+            delay = 0
+            if self._last is not None:
+                elapsed = self._clock() - self._last
+                delay = max(0, self.interval - elapsed)
+            self._scheduled = True
+            self._call_later(delay, self._flush)
+
+    def _flush(self):
+        """Render the latest state of all pending slider changes."""
+        self._scheduled = False
+        names = self.pending
+        self._pending.clear()
+        if names:
+            self._last = self._clock()
+            self.rendered += 1
+            self._render(names)
+
+
+class Debouncer(object):
+    """
+    Defers a callback until a burst of events has settled, such that only
+    the last event of the burst is handled.
+
+    """
+    def __init__(self, callback, delay=0.3, call_later=None):
+        """
+        Args:
+
+        * callback
+            Callable that handles the arguments of the last event of a
+            burst.
+
+        Kwargs:
+
+        * delay
+            The quiet period in seconds after the last event of a burst,
+            before it is handled. Defaults to 0.3.
+
+        * call_later
+            Callable that schedules a callback on the event loop, with
+            signature call_later(delay, callback). Defaults to the tornado
+            IOLoop of the kernel.
+
+        """
+        if delay < 0:
+            emsg = '{} requires a non-negative delay, got {}.'
+            raise ValueError(emsg.format(type(self).__name__, delay))
+        self._callback = callback
+        #: The quiet period in seconds before an event is handled.
+        self.delay = delay
+        self._call_later = _call_later if call_later is None else call_later
+        # The number of the latest event, to identify superseded events.
+        self._generation = 0
+
+    def submit(self, *args, **kwargs):
+        """Register an event, superseding any event not yet handled."""
+        self._generation += 1
+        generation = self._generation
+
+        def fire():
+            if generation == self._generation:
+                self._callback(*args, **kwargs)
+
+        self._call_later(self.delay, fire)
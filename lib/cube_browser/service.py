@@ -0,0 +1,295 @@
+"""Headless rendering of cube_browser plots, served over HTTP."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+import io
+import json
+import threading
+
+from six.moves.BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+from six.moves.socketserver import ThreadingMixIn
+from six.moves.urllib.parse import parse_qs, urlparse
+
+from cube_browser.cache import SliceCache
+
+
+#: The supported image formats, and their content types.
+CONTENT_TYPES = {'png': 'image/png', 'webp': 'image/webp'}
+
+#: The default byte budget of the rendered image cache of a
+#: :class:`Renderer`.
+DEFAULT_IMAGE_BYTES = 64 * 1024 ** 2
+
+#: The default maximum width and height, in pixels, of a rendered image.
+DEFAULT_MAX_SIZE = 4096
+
+
+class Renderer(object):
+    """
+    Renders the plots of a figure, for given slider values, to encoded
+    images without any widgets or interactive backend.
+
+    The plots should share a figure with an Agg canvas, for example a
+    :class:`matplotlib.figure.Figure` attached to a
+    :class:`matplotlib.backends.backend_agg.FigureCanvasAgg`. Plots that
+    reference the same cube share a slice cache, and the rendered images
+    are cached on the plot slices and figure size. Images default to the
+    size of the figure when the renderer is created.
+
+    """
+    def __init__(self, plots, max_bytes=None, max_size=None):
+        """
+        Args:
+
+        * plots
+            The cube_browser plot instances to render.
+
+        Kwargs:
+
+        * max_bytes
+            The byte budget of the rendered image cache. Defaults to
+            :data:`DEFAULT_IMAGE_BYTES`.
+
+        * max_size
+            The maximum width and height, in pixels, of a rendered image.
+            Defaults to :data:`DEFAULT_MAX_SIZE`.
+
+        """
+        self.plots = plots
+        figures = set(id(plot.axes.figure) for plot in plots)
+        if len(figures) != 1:
+            emsg = '{} requires plots on exactly one figure, got {}.'
+            raise ValueError(emsg.format(type(self).__name__, len(figures)))
+        self.figure = plots[0].axes.figure
+        # The default image size, in pixels.
+        self._size = tuple(self.figure.get_size_inches() * self.figure.dpi)
+        if max_bytes is None:
+            max_bytes = DEFAULT_IMAGE_BYTES
+        #: The :class:`~cube_browser.cache.SliceCache` of encoded images.
+        self.cache = SliceCache(max_bytes=max_bytes)
+        if max_size is None:
+            max_size = DEFAULT_MAX_SIZE
+        #: The maximum width and height, in pixels, of a rendered image.
+        self.max_size = max_size
+        # Mapping of slider name to slider size.
+        self._size_by_name = {}
+        # The slider names of each plot.
+        self._names = []
+        cache_by_cube_id = {}
+        for plot in plots:
+            names = []
+            for axis in plot.sliders_axis:
+                size = self._size_by_name.setdefault(axis.name, axis.size)
+                if size != axis.size:
+                    emsg = ('{!r} cube {!r} has an incompatible axis {!r} '
+                            'on dimension {}.')
+                    raise ValueError(emsg.format(type(plot).__name__,
+                                                 plot.cube.name(),
+                                                 axis.name, axis.dim))
+                names.append(axis.name)
+            self._names.append(names)
+            plot.cache = cache_by_cube_id.setdefault(id(plot.cube),
+                                                     plot.cache)
+        # Serialises drawing, as matplotlib is not thread-safe. Cached
+        # images are served without it.
+        self._lock = threading.Lock()
+
+    @property
+    def sliders(self):
+        """A dictionary of the size of each slider, by name."""
+        return dict(self._size_by_name)
+
+    def _state(self, kwargs):
+        """The validated value of every slider, defaulting to zero."""
+        unknown = set(kwargs) - set(self._size_by_name)
+        if unknown:
+            emsg = '{} got unknown slider names {!r}.'
+            raise ValueError(emsg.format(type(self).__name__,
+                                         sorted(unknown)))
+        result = {}
+        for name, size in self._size_by_name.items():
+            value = int(kwargs.get(name, 0))
+            if not 0 <= value < size:
+                emsg = '{} slider {!r} value out of range [0, {}), got {}.'
+                raise ValueError(emsg.format(type(self).__name__, name,
+                                             size, value))
+            result[name] = value
+        return result
+
+    def _encode(self, format):
+        buffer = io.BytesIO()
+        if format == 'png':
+            self.figure.savefig(buffer, format='png', dpi=self.figure.dpi)
+        else:
+            try:
+                from PIL import Image
+            except ImportError:
+                emsg = 'Encoding {!r} images requires Pillow.'
+                raise ValueError(emsg.format(format))
+            canvas = self.figure.canvas
+            canvas.draw()
+            image = Image.frombuffer('RGBA', canvas.get_width_height(),
+                                     canvas.buffer_rgba(), 'raw', 'RGBA',
+                                     0, 1)
+            image.save(buffer, format='WEBP')
+        return buffer.getvalue()
+
+    def render(self, format='png', width=None, height=None, **kwargs):
+        """
+        Returns the encoded image of the plots for the given slider values.
+
+        Kwargs:
+
+        * format
+            The image format, either 'png' or 'webp'. Defaults to 'png'.
+
+        * width
+            The image width in pixels, of at most :attr:`max_size`.
+            Defaults to the figure width.
+
+        * height
+            The image height in pixels, of at most :attr:`max_size`.
+            Defaults to the figure height.
+
+        * kwargs
+            The slider name and associated index value. Sliders not
+            specified are at position zero.
+
+        """
+        if format not in CONTENT_TYPES:
+            emsg = '{} requires an image format of {}, got {!r}.'
+            raise ValueError(emsg.format(type(self).__name__,
+                                         ', '.join(sorted(CONTENT_TYPES)),
+                                         format))
+        state = self._state(kwargs)
+        slices = []
+        for plot, names in zip(self.plots, self._names):
+            slices.append(plot._key(**{name: state[name] for name in names}))
+        size = list(self._size)
+        if width is not None:
+            size[0] = int(width)
+        if height is not None:
+            size[1] = int(height)
+        size = tuple(int(round(value)) for value in size)
+        for name, value in zip(('width', 'height'), size):
+            if not 0 < value <= self.max_size:
+                emsg = '{} image {} out of range [1, {}], got {}.'
+                raise ValueError(emsg.format(type(self).__name__, name,
+                                             self.max_size, value))
+        key = (format, size, tuple(slices))
+        result = self.cache.get(key)
+        if result is None:
+            with self._lock:
+                # Another request may have rendered the image meanwhile.
+                result = self.cache.get(key)
+                if result is None:
+                    result = self._render(format, size, state)
+                    self.cache[key] = result
+        return result
+
+    def _render(self, format, size, state):
+        """
+        Draw and encode the plots at the given pixel size and slider state,
+        then restore the figure size.
+
+        """
+        dpi = self.figure.dpi
+        original = self.figure.get_size_inches().copy()
+        self.figure.set_size_inches(size[0] / dpi, size[1] / dpi)
+        try:
+            for plot in self.plots:
+                plot.clear()
+            for plot, names in zip(self.plots, self._names):
+                plot(**{name: state[name] for name in names})
+            return self._encode(format)
+        finally:
+            self.figure.set_size_inches(original)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+    Serves the rendered images, slider sizes and cache statistics of the
+    :class:`Renderer` of the server.
+
+    """
+    def _send(self, status, content_type, body, cache=False):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        if cache:
+            self.send_header('Cache-Control', 'public, max-age=3600')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, value, status=200):
+        body = json.dumps(value).encode('utf-8')
+        self._send(status, 'application/json', body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {name: values[-1]
+                 for name, values in parse_qs(url.query).items()}
+        renderer = self.server.renderer
+        if url.path == '/sliders':
+            self._send_json(renderer.sliders)
+        elif url.path == '/stats':
+            self._send_json(renderer.cache.stats)
+        elif url.path.startswith('/render.'):
+            format = url.path[len('/render.'):]
+            try:
+                image = renderer.render(format=format, **query)
+            except (TypeError, ValueError) as exception:
+                self._send_json(dict(error=str(exception)), status=400)
+            except Exception:
+                self._send_json(dict(error='Failed to render.'), status=500)
+            else:
+                self._send(200, CONTENT_TYPES[format], image, cache=True)
+        else:
+            self._send_json(dict(error='Not found.'), status=404)
+
+    def log_message(self, format, *args):
+        # Silence the per-request logging to stderr.
+        pass
+
+
+class _Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+def make_server(renderer, host='localhost', port=8000):
+    """
+    Create an HTTP server of the images of the renderer, which responds to
+    the following GET requests:
+
+        * /render.png?time=3&width=800 or /render.webp?time=3
+            The encoded image for the given slider values and size.
+        * /sliders
+            A JSON object of the size of each slider, by name.
+        * /stats
+            A JSON object of the rendered image cache statistics.
+
+    Invalid render requests, such as of an unknown slider or an image
+    larger than the :attr:`Renderer.max_size`, are answered with status
+    400, and failed renders with status 500, with a JSON object of the
+    error.
+
+    Args:
+
+    * renderer
+        The :class:`Renderer` of the images.
+
+    Kwargs:
+
+    * host
+        The host name to bind to. Defaults to 'localhost'.
+
+    * port
+        The port to bind to, or 0 for any free port. Defaults to 8000.
+
+    Returns the server, see :meth:`socketserver.BaseServer.serve_forever`.
+
+    """
+    server = _Server((host, port), _Handler)
+    server.renderer = renderer
+    return server
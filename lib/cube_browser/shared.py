@@ -0,0 +1,299 @@
+"""Sharing of realised cube slices between processes."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+from contextlib import contextmanager
+import glob
+import hashlib
+import mmap
+import numbers
+import os
+import tempfile
+
+import numpy as np
+
+from cube_browser.cache import SliceCache, realise
+from cube_browser.slicing import _sources
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+
+#: The default byte budget of the slice files of a shared directory.
+DEFAULT_SHARED_BYTES = 2 * 1024 ** 3
+
+
+def _default_dirname():
+    """
+    The default shared directory, in memory backed storage where
+    available.
+
+    """
+    root = '/dev/shm'
+    if not os.path.isdir(root):
+        root = tempfile.gettempdir()
+    return os.path.join(root, 'cube_browser')
+
+
+def _normalise(key):
+    """A hashable, reproducible representation of a biggus index key."""
+    if isinstance(key, slice):
+        result = ('slice', key.start, key.stop, key.step)
+    elif isinstance(key, (tuple, list)):
+        result = tuple(_normalise(item) for item in key)
+    elif isinstance(key, np.ndarray):
+        result = ('array',) + tuple(key.tolist())
+    elif isinstance(key, numbers.Integral):
+        result = int(key)
+    else:
+        result = repr(key)
+    return result
+
+
+def mapped(array):
+    """
+    Whether the data of the array, or masked array, is a view of a memory
+    mapped file, such as a slice shared by a :class:`SharedSliceCache`.
+
+    """
+    base = np.ma.getdata(array)
+    while isinstance(base, np.ndarray):
+        base = base.base
+    return isinstance(base, mmap.mmap)
+
+
+class SharedSliceCache(SliceCache):
+    """
+    A :class:`~cube_browser.cache.SliceCache` that shares the realised
+    data of each slice between processes, through memory mapped files in
+    a shared directory.
+
+    Each slice is identified by its source file, file variable and index
+    into the variable, so plots of the same file in different processes,
+    such as several notebook kernels or render workers, read and hold each
+    slice once. The data pages of the files are mapped rather than copied
+    into each process. The files in the directory are evicted in least
+    recently used order to honour a global byte budget, under a file lock.
+
+    Slices that are not read from a single netCDF file variable are
+    realised and cached locally only. Slices are identified through the
+    biggus array graph of the lazy cube data, see :meth:`name`, so only
+    cubes loaded with biggus lazy data are shared. Under dask, every slice
+    is cached locally only.
+
+    """
+    def __init__(self, max_bytes=None, dirname=None, max_shared_bytes=None):
+        """
+        Kwargs:
+
+        * max_bytes
+            The byte budget of the local cache of sub-cubes. See
+            :class:`~cube_browser.cache.SliceCache`.
+
+        * dirname
+            The shared directory of the slice files. Defaults to a
+            'cube_browser' directory in '/dev/shm' where available,
+            otherwise in the system temporary directory.
+
+        * max_shared_bytes
+            The byte budget of the slice files of the shared directory.
+            Defaults to :data:`DEFAULT_SHARED_BYTES`.
+
+        """
+        super(SharedSliceCache, self).__init__(max_bytes=max_bytes)
+        if dirname is None:
+            dirname = _default_dirname()
+        if max_shared_bytes is None:
+            max_shared_bytes = DEFAULT_SHARED_BYTES
+        if max_shared_bytes < 0:
+            emsg = '{} requires a non-negative shared byte budget, got {}.'
+            raise ValueError(emsg.format(type(self).__name__,
+                                         max_shared_bytes))
+        #: The shared directory of the slice files.
+        self.dirname = dirname
+        #: The byte budget of the slice files of the shared directory.
+        self.max_shared_bytes = max_shared_bytes
+        #: The number of slices mapped from the shared directory.
+        self.shared_hits = 0
+        #: The number of slices published to the shared directory.
+        self.shared_stores = 0
+        if not os.path.isdir(dirname):
+            try:
+                os.makedirs(dirname)
+            except OSError:
+                # Another process may have created it concurrently.
+                if not os.path.isdir(dirname):
+                    raise
+
+    def __repr__(self):
+        fmt = '{}(entries={}, nbytes={}, max_bytes={}, dirname={!r})'
+        return fmt.format(type(self).__name__, len(self), self.nbytes,
+                          self.max_bytes, self.dirname)
+
+    @contextmanager
+    def _locked(self):
+        """Hold the exclusive lock of the shared directory."""
+        with open(os.path.join(self.dirname, '.lock'), 'a') as fh:
+            if fcntl is not None:
+                fcntl.flock(fh, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(fh, fcntl.LOCK_UN)
+
+    @staticmethod
+    def name(cube):
+        """
+        Returns the shared name of the lazy cube slice, derived from its
+        source file, file variable and index, or None when the cube is not
+        a biggus slice of a single file variable.
+
+        """
+        if not cube.has_lazy_data():
+            return None
+        sources = list(_sources(cube.lazy_data()))
+        if len(sources) != 1:
+            return None
+        proxy, keys = sources[0]
+        try:
+            stat = os.stat(proxy.path)
+        except (OSError, TypeError):
+            return None
+        identity = (os.path.abspath(proxy.path), stat.st_size,
+                    stat.st_mtime, proxy.variable_name,
+                    _normalise(keys or ()), tuple(cube.shape))
+        return hashlib.sha1(repr(identity).encode('utf-8')).hexdigest()
+
+    def _paths(self, name):
+        """The data file path of the plain and masked slice, and the mask."""
+        base = os.path.join(self.dirname, name)
+        return base + '.npy', base + '.masked.npy', base + '.mask.npy'
+
+    def _load(self, name):
+        """
+        Map the shared data of the named slice, marking it as most
+        recently used.
+
+        Returns the data, or None if the slice is not shared.
+
+        """
+        plain, masked, mask = self._paths(name)
+        try:
+            if os.path.exists(plain):
+                result = np.load(plain, mmap_mode='r')
+                os.utime(plain, None)
+            else:
+                data = np.load(masked, mmap_mode='r')
+                result = np.ma.masked_array(data, mask=np.load(mask),
+                                            copy=False)
+                os.utime(masked, None)
+        except (IOError, OSError, ValueError):
+            # Not shared, or evicted by another process meanwhile.
+            result = None
+        return result
+
+    def _save(self, path, array):
+        """Write the array to the path, atomically."""
+        temporary = '{}.{}.tmp'.format(path, os.getpid())
+        with open(temporary, 'wb') as fh:
+            np.save(fh, array)
+        os.rename(temporary, path)
+
+    def _store(self, name, data):
+        """Publish the data of the named slice to the shared directory."""
+        plain, masked, mask = self._paths(name)
+        with self._locked():
+            if os.path.exists(plain) or (os.path.exists(masked) and
+                                         os.path.exists(mask)):
+                return
+            if np.ma.getmask(data) is np.ma.nomask:
+                self._save(plain, np.ma.getdata(data))
+            else:
+                # The mask is published first, as the presence of the
+                # data file marks the slice as complete.
+                self._save(mask, np.ma.getmaskarray(data))
+                self._save(masked, np.ma.getdata(data))
+            self.shared_stores += 1
+            self._evict_shared()
+
+    def _evict_shared(self):
+        """
+        Discard least recently used slice files until within the shared
+        byte budget. Requires the lock of the shared directory.
+
+        """
+        entries = []
+        total = 0
+        for path in glob.glob(os.path.join(self.dirname, '*.npy')):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            total += stat.st_size
+            if not path.endswith('.mask.npy'):
+                entries.append((stat.st_mtime, path))
+        entries.sort()
+        for _, path in entries:
+            if total <= self.max_shared_bytes:
+                break
+            # Mapped files remain valid for the processes that map them.
+            paths = [path]
+            if path.endswith('.masked.npy'):
+                paths.append(path[:-len('.masked.npy')] + '.mask.npy')
+            for other in paths:
+                try:
+                    total -= os.path.getsize(other)
+                    os.remove(other)
+                except OSError:
+                    pass
+
+    def realise(self, cube):
+        """
+        Realise the data payload of the cube, mapping it from the shared
+        directory when another process has already realised it, otherwise
+        reading it and publishing it to the shared directory.
+
+        Returns the realised data.
+
+        """
+        name = self.name(cube)
+        if name is None:
+            return realise(cube)
+        data = self._load(name)
+        if data is None:
+            data = realise(cube)
+            self._store(name, data)
+            shared = self._load(name)
+        else:
+            shared = data
+            self.shared_hits += 1
+        if shared is not None:
+            # Replace the private data with the shared mapping.
+            cube.data = shared
+            data = shared
+        return data
+
+    def clear_shared(self):
+        """Discard all the slice files of the shared directory."""
+        with self._locked():
+            for path in glob.glob(os.path.join(self.dirname, '*.npy')):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    @property
+    def stats(self):
+        """
+        A dictionary summary of the cache counters and occupancy, including
+        the shared slice counters.
+
+        """
+        result = super(SharedSliceCache, self).stats
+        result.update(shared_hits=self.shared_hits,
+                      shared_stores=self.shared_stores)
+        return result
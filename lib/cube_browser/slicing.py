@@ -0,0 +1,360 @@
+"""Lazy, chunk-aware slicing of plot cubes."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+from collections import namedtuple
+from contextlib import closing
+import itertools
+import threading
+import warnings
+
+import numpy as np
+
+from cube_browser.cache import _IO_LOCK
+
+
+#: The default ratio of bytes decompressed from disk to bytes of slice
+#: payload, above which a :class:`LazySlicer` warns of a poor access pattern.
+DEFAULT_MAX_AMPLIFICATION = 64
+
+
+class SliceRead(namedtuple('SliceRead', 'index, nbytes, chunk_nbytes')):
+    """
+    The bytes of payload of a cube slice, and the bytes of on-disk chunks
+    that must be decompressed in order to read it.
+
+    """
+    @property
+    def amplification(self):
+        """The ratio of bytes decompressed to bytes of slice payload."""
+        return self.chunk_nbytes / self.nbytes if self.nbytes else 1.
+
+
+def _sources(array):
+    """
+    Generate the file data proxies that underlie the lazy array, by
+    walking the graph of the biggus array.
+
+    """
+    concrete = getattr(array, 'concrete', None)
+    if concrete is not None:
+        if hasattr(concrete, 'path') and hasattr(concrete, 'variable_name'):
+            yield concrete, getattr(array, '_keys', None)
+    tiles = getattr(array, '_tiles', None)
+    if tiles is None:
+        stack = getattr(array, '_stack', None)
+        if stack is not None:
+            tiles = stack.flat
+    for tile in tiles or []:
+        for source in _sources(tile):
+            yield source
+
+
+def _netcdf_chunks(path, variable_name):
+    """
+    Returns the on-disk chunk shape of the netCDF variable, or a unit
+    chunk shape for contiguous storage.
+
+    """
+    import netCDF4
+
+    with _IO_LOCK:
+        with closing(netCDF4.Dataset(path)) as dataset:
+            variable = dataset.variables[variable_name]
+            chunking = variable.chunking()
+            ndim = variable.ndim
+    if chunking == 'contiguous':
+        # A contiguous variable is read without decompressing anything
+        # other than the requested elements.
+        chunking = [1] * ndim
+    return tuple(chunking)
+
+
+def disk_chunks(cube):
+    """
+    Determine the on-disk chunk shape of the lazy data payload of the cube.
+
+    Returns the chunk shape, or None when the cube has no lazy data or
+    its chunking cannot be determined.
+
+    """
+    if not cube.has_lazy_data():
+        return None
+    array = cube.lazy_data()
+    chunks = getattr(array, 'chunks', None)
+    if chunks is not None:
+        # A dask array is chunked to match the file variable.
+        return tuple(max(sizes) for sizes in chunks)
+    result = set()
+    for proxy, keys in _sources(array):
+        if keys is not None and any(key != slice(None) for key in keys):
+            # The file variable has been indexed, so its chunks no longer
+            # correspond to the dimensions of the cube.
+            return None
+        try:
+            result.add(_netcdf_chunks(proxy.path, proxy.variable_name))
+        except Exception:
+            return None
+    if len(result) != 1:
+        return None
+    chunks = result.pop()
+    if len(chunks) != cube.ndim:
+        return None
+    return chunks
+
+
+def chunk_read(shape, chunks, dtype, index):
+    """
+    Determine the bytes of payload of the indexed slice of an array, and
+    the bytes of on-disk chunks that must be decompressed to read it.
+
+    Args:
+
+    * shape
+        The shape of the array.
+
+    * chunks
+        The on-disk chunk shape of the array, or None if unknown, in
+        which case only the slice payload is accounted for.
+
+    * dtype
+        The data type of the array.
+
+    * index
+        The tuple of integer or slice index of each array dimension.
+
+    Returns a :class:`SliceRead`.
+
+    """
+    itemsize = np.dtype(dtype).itemsize
+    nbytes = chunk_nbytes = itemsize
+    for dim, (size, key) in enumerate(zip(shape, index)):
+        if isinstance(key, slice):
+            points = np.arange(*key.indices(size))
+        else:
+            points = np.array([key % size])
+        nbytes *= points.size
+        if chunks is None:
+            chunk_nbytes *= points.size
+        else:
+            chunk = chunks[dim]
+            starts = np.unique(points // chunk) * chunk
+            chunk_nbytes *= np.minimum(chunk, size - starts).sum()
+    return SliceRead(index=index, nbytes=int(nbytes),
+                     chunk_nbytes=int(chunk_nbytes))
+
+
+def _as_ranges(shape, index):
+    """
+    The (start, stop) range of the index along every dimension, for an
+    index of integers and whole or unit step slices.
+
+    """
+    result = []
+    for size, key in zip(shape, index):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(size)
+            if step != 1:
+                emsg = 'Require unit step slices, got {!r}.'
+                raise ValueError(emsg.format(key))
+            result.append((start, stop))
+        else:
+            key %= size
+            result.append((key, key + 1))
+    return tuple(result)
+
+
+def _merge(first, second):
+    """
+    The union of the two blocks of ranges, when it is itself a block, that
+    is when they differ along at most one dimension, over adjacent or
+    overlapping ranges. Otherwise None.
+
+    """
+    differ = [dim for dim, (a, b) in enumerate(zip(first, second))
+              if a != b]
+    if len(differ) > 1:
+        return None
+    if not differ:
+        return first
+    dim, = differ
+    (a_start, a_stop), (b_start, b_stop) = first[dim], second[dim]
+    if a_stop < b_start or b_stop < a_start:
+        return None
+    result = list(first)
+    result[dim] = (min(a_start, b_start), max(a_stop, b_stop))
+    return tuple(result)
+
+
+def merge_indices(shape, indices):
+    """
+    Combine the cube indices into as few blocks as possible, removing
+    duplicates and merging indices that are contiguous along one
+    dimension, such that each block may be read at once. A block covers
+    exactly the union of the indices it merges.
+
+    Args:
+
+    * shape
+        The shape of the indexed cube.
+
+    * indices
+        The sequence of cube indices, of an integer or unit step slice for
+        every dimension.
+
+    Returns a list of the block index, of a slice for every dimension, and
+    the list of positions of the indices within it, for each block.
+
+    """
+    members_by_block = {}
+    for position, index in enumerate(indices):
+        block = _as_ranges(shape, index)
+        members_by_block.setdefault(block, []).append(position)
+    blocks = sorted(members_by_block.items())
+    merged = True
+    while merged:
+        merged = False
+        for i, j in itertools.combinations(range(len(blocks)), 2):
+            block = _merge(blocks[i][0], blocks[j][0])
+            if block is not None:
+                blocks[i] = (block, sorted(blocks[i][1] + blocks[j][1]))
+                del blocks[j]
+                merged = True
+                break
+    return [(tuple(slice(start, stop) for start, stop in block), members)
+            for block, members in blocks]
+
+
+class LazySlicer(object):
+    """
+    Slices a cube through its lazy data payload, so that only the
+    requested slice is ever realised, accounting for the bytes read from
+    disk for each slice.
+
+    The on-disk chunking of the cube file variable is determined on the
+    first read, and a warning is issued once when a slice decompresses
+    far more data than it contains.
+
+    """
+    def __init__(self, cube, max_amplification=None):
+        """
+        Args:
+
+        * cube
+            The :class:`~iris.cube.Cube` to slice.
+
+        Kwargs:
+
+        * max_amplification
+            The ratio of bytes decompressed from disk to bytes of slice
+            payload above which to warn. Defaults to
+            :data:`DEFAULT_MAX_AMPLIFICATION`.
+
+        """
+        self.cube = cube
+        if max_amplification is None:
+            max_amplification = DEFAULT_MAX_AMPLIFICATION
+        self.max_amplification = max_amplification
+        #: The number of slices read.
+        self.reads = 0
+        #: The total bytes of slice payload read.
+        self.nbytes = 0
+        #: The total bytes of on-disk chunks decompressed.
+        self.chunk_nbytes = 0
+        #: The :class:`SliceRead` of the latest slice read from disk.
+        self.last_read = None
+        self._chunks = None
+        self._chunks_known = False
+        self._warned = False
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        fmt = '{}({!r}, chunks={!r})'
+        return fmt.format(type(self).__name__, self.cube.name(),
+                          self._chunks)
+
+    @property
+    def chunks(self):
+        """
+        The on-disk chunk shape of the cube, or None when unknown.
+        See :func:`disk_chunks`.
+
+        """
+        if not self._chunks_known:
+            self._chunks = disk_chunks(self.cube)
+            self._chunks_known = True
+        return self._chunks
+
+    def read(self, index):
+        """
+        Returns the :class:`SliceRead` of the indexed slice of the cube,
+        without reading it.
+
+        """
+        dtype = self.cube.lazy_data().dtype
+        return chunk_read(self.cube.shape, self.chunks, dtype, index)
+
+    def chunk_index(self, index):
+        """
+        Determine the index of the block of whole on-disk chunks that
+        contains the indexed slice of the cube, retaining every cube
+        dimension.
+
+        Returns the block index, or None when the chunking is unknown or
+        the slice already spans whole chunks.
+
+        """
+        chunks = self.chunks
+        if chunks is None or not self.cube.has_lazy_data():
+            return None
+        result = []
+        extended = False
+        for size, chunk, key in zip(self.cube.shape, chunks, index):
+            if isinstance(key, slice):
+                result.append(key)
+            else:
+                start = (key % size) // chunk * chunk
+                stop = min(start + chunk, size)
+                extended = extended or stop - start > 1
+                result.append(slice(start, stop))
+        return tuple(result) if extended else None
+
+    def __getitem__(self, index):
+        """
+        Returns the lazy sub-cube of the given index.
+
+        Slicing a cube with in-memory data involves no disk access, and
+        is not accounted for.
+
+        """
+        lazy = self.cube.has_lazy_data()
+        subcube = self.cube[index]
+        if lazy:
+            if not subcube.has_lazy_data():
+                emsg = '{!r} sub-cube of {!r} was unexpectedly realised.'
+                raise RuntimeError(emsg.format(type(self).__name__,
+                                               self.cube.name()))
+            read = self.read(index)
+            with self._lock:
+                self.reads += 1
+                self.nbytes += read.nbytes
+                self.chunk_nbytes += read.chunk_nbytes
+                self.last_read = read
+                warn = (read.amplification > self.max_amplification and
+                        not self._warned)
+                self._warned = self._warned or warn
+            if warn:
+                wmsg = ('Reading a slice of {!r} of {} bytes decompresses '
+                        '{} bytes of on-disk chunks {}, consider rechunking '
+                        'the file along the plot dimensions.')
+                warnings.warn(wmsg.format(self.cube.name(), read.nbytes,
+                                          read.chunk_nbytes, self.chunks))
+        return subcube
+
+    @property
+    def stats(self):
+        """A dictionary summary of the bytes read from disk."""
+        with self._lock:
+            return dict(reads=self.reads, nbytes=self.nbytes,
+                        chunk_nbytes=self.chunk_nbytes)
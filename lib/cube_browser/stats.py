@@ -0,0 +1,158 @@
+"""Low overhead timing instrumentation of Browser interactions."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+from collections import deque, OrderedDict
+import json
+import threading
+from timeit import default_timer
+
+import numpy as np
+
+
+#: The percentiles reported for each timing span.
+PERCENTILES = (50, 90, 99)
+
+
+class _NullSpan(object):
+    """A timing span that records nothing."""
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span(object):
+    """A timing span that records its duration on exit."""
+    def __init__(self, stats, name):
+        self._stats = stats
+        self._name = name
+        self._start = None
+
+    def __enter__(self):
+        self._start = self._stats.clock()
+        return self
+
+    def __exit__(self, *args):
+        self._stats.record(self._name, self._stats.clock() - self._start)
+        return False
+
+
+def span(stats, name):
+    """
+    Returns a context manager that records the duration of its body as
+    the named span of the given :class:`Stats`, or does nothing when the
+    stats is None.
+
+    """
+    return _NULL_SPAN if stats is None else stats.span(name)
+
+
+class Stats(object):
+    """
+    A collection of timing samples, in seconds, by span name.
+
+    Spans recorded from a thread other than the one that created the
+    stats, such as a prefetch worker thread, have their name prefixed
+    with 'background.'.
+
+    """
+    def __init__(self, max_samples=1000, clock=None):
+        """
+        Kwargs:
+
+        * max_samples
+            The number of most recent samples retained for each span, from
+            which the summary statistics are calculated. Defaults to 1000.
+
+        * clock
+            Callable returning the current time in seconds. Defaults to
+            :func:`timeit.default_timer`, the most precise clock of the
+            platform.
+
+        """
+        if max_samples < 1:
+            emsg = '{} requires at least 1 sample, got {}.'
+            raise ValueError(emsg.format(type(self).__name__, max_samples))
+        self.max_samples = max_samples
+        self.clock = default_timer if clock is None else clock
+        # Mapping of span name to recent samples.
+        self._samples = OrderedDict()
+        # Mapping of span name to total number of samples recorded.
+        self._counts = {}
+        self._thread = threading.current_thread()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return '{}({})'.format(type(self).__name__, list(self.names))
+
+    @property
+    def names(self):
+        """The names of the recorded spans, in order of first record."""
+        return list(self._samples.keys())
+
+    def span(self, name):
+        """
+        Returns a context manager that records the duration of its body
+        as the named span.
+
+        """
+        return _Span(self, name)
+
+    def record(self, name, seconds):
+        """Record a duration, in seconds, for the named span."""
+        if threading.current_thread() is not self._thread:
+            name = 'background.{}'.format(name)
+        with self._lock:
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = deque(maxlen=self.max_samples)
+                self._samples[name] = samples
+                self._counts[name] = 0
+            samples.append(seconds)
+            self._counts[name] += 1
+
+    def samples(self, name):
+        """Returns the retained samples of the named span, oldest first."""
+        with self._lock:
+            return list(self._samples[name])
+
+    def summary(self, name):
+        """
+        Returns a dictionary of the total count, and the mean, minimum,
+        maximum and :data:`PERCENTILES` of the retained samples, in
+        seconds, of the named span.
+
+        """
+        with self._lock:
+            samples = np.array(self._samples[name])
+            count = self._counts[name]
+        items = [('count', count), ('mean', float(samples.mean())),
+                 ('min', float(samples.min())), ('max', float(samples.max()))]
+        for q, value in zip(PERCENTILES, np.percentile(samples, PERCENTILES)):
+            items.append(('p{}'.format(q), float(value)))
+        return OrderedDict(items)
+
+    def reset(self):
+        """Discard all the recorded samples."""
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
+
+    def to_dict(self):
+        """Returns a dictionary of the summary of each span, by name."""
+        return OrderedDict((name, self.summary(name)) for name in self.names)
+
+    def to_json(self, **kwargs):
+        """
+        Returns a JSON string of the summary of each span, by name.
+
+        Kwargs are passed through to :func:`json.dumps`.
+
+        """
+        return json.dumps(self.to_dict(), **kwargs)
@@ -0,0 +1,90 @@
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+"""Unit tests for the `cube_browser.blit.Blitter` class."""
+
+# Import iris.tests first so that some things can be initialised
+# before importing anything else.
+import iris.tests as tests
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from cube_browser.blit import Blitter
+
+
+class _Plot(object):
+    def __init__(self, axes):
+        self.axes = axes
+        [line] = axes.plot([0, 1], [0, 1])
+        self.artists = [line]
+
+
+class Test_update(tests.IrisTest):
+    def setUp(self):
+        self.figure = Figure()
+        self.canvas = FigureCanvasAgg(self.figure)
+        self.ax1 = self.figure.add_subplot(121)
+        self.ax2 = self.figure.add_subplot(122)
+        self.p1 = _Plot(self.ax1)
+        self.p2 = _Plot(self.ax1)
+        self.p3 = _Plot(self.ax2)
+        self.blitter = Blitter([self.p1, self.p2, self.p3])
+
+    def test_first_update_draws(self):
+        with tests.mock.patch.object(self.canvas, 'blit') as blit:
+            self.blitter.update([self.p1])
+        self.assertEqual(blit.call_count, 0)
+        for plot in [self.p1, self.p2, self.p3]:
+            self.assertTrue(plot.artists[0].get_animated())
+        self.assertEqual(set(self.blitter._background_by_axes_id),
+                         set([id(self.ax1), id(self.ax2)]))
+
+    def test_blit(self):
+        self.blitter.update([self.p1])
+        with tests.mock.patch.object(self.canvas, 'draw') as draw:
+            with tests.mock.patch.object(self.ax1, 'draw_artist') as artist:
+                self.blitter.update([self.p1])
+        self.assertEqual(draw.call_count, 0)
+        # Both plots sharing the axes are redrawn.
+        expected = [tests.mock.call(self.p1.artists[0]),
+                    tests.mock.call(self.p2.artists[0])]
+        self.assertEqual(artist.call_args_list, expected)
+
+    def test_resize_invalidates(self):
+        self.blitter.update([self.p1])
+        self.canvas.resize_event()
+        self.assertEqual(self.blitter._background_by_axes_id, {})
+        with tests.mock.patch.object(self.canvas, 'draw') as draw:
+            self.blitter.update([self.p3])
+        self.assertEqual(draw.call_count, 1)
+
+    def test_no_blit_support(self):
+        self.canvas.supports_blit = False
+        with tests.mock.patch.object(self.canvas, 'draw_idle') as draw_idle:
+            self.blitter.update([self.p3])
+        self.assertEqual(draw_idle.call_count, 1)
+        # The data artists are included in the full draw.
+        self.assertFalse(self.p3.artists[0].get_animated())
+
+    def test_no_blit_support_after_blit(self):
+        self.blitter.update([self.p3])
+        self.assertTrue(self.p3.artists[0].get_animated())
+        self.canvas.supports_blit = False
+        with tests.mock.patch.object(self.canvas, 'draw_idle'):
+            self.blitter.update([self.p3])
+        self.assertFalse(self.p3.artists[0].get_animated())
+
+    def test_canvas_without_regions(self):
+        canvas = tests.mock.Mock(spec=['draw_idle', 'mpl_connect'])
+        self.figure.canvas = canvas
+        self.blitter.update([self.p3])
+        canvas.draw_idle.assert_called_once_with()
+        self.assertEqual(canvas.mpl_connect.call_count, 0)
+        self.assertFalse(self.p3.artists[0].get_animated())
+        # A draw event of the canvas is ignored.
+        self.blitter._on_draw(tests.mock.Mock(canvas=canvas))
+        self.assertEqual(self.blitter._background_by_axes_id, {})
+
+
+if __name__ == '__main__':
+    tests.main()
@@ -0,0 +1,120 @@
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+"""Unit tests for the `cube_browser.cache.SliceCache` class."""
+
+# Import iris.tests first so that some things can be initialised
+# before importing anything else.
+import iris.tests as tests
+
+from iris.tests.stock import realistic_3d
+import numpy as np
+
+from cube_browser.cache import DEFAULT_MAX_BYTES, SliceCache
+
+
+class Test___init__(tests.IrisTest):
+    def test_default(self):
+        cache = SliceCache()
+        self.assertEqual(cache.max_bytes, DEFAULT_MAX_BYTES)
+        self.assertEqual(len(cache), 0)
+        expected = dict(entries=0, nbytes=0, max_bytes=DEFAULT_MAX_BYTES,
+                        hits=0, misses=0, evictions=0)
+        self.assertEqual(cache.stats, expected)
+
+    def test_bad_max_bytes(self):
+        emsg = 'requires a non-negative byte budget, got -1'
+        with self.assertRaisesRegexp(ValueError, emsg):
+            SliceCache(max_bytes=-1)
+
+
+class Test___setitem__(tests.IrisTest):
+    def setUp(self):
+        self.data = np.zeros((10, 10), dtype=np.float32)
+        self.nbytes = self.data.nbytes
+
+    def test_nbytes(self):
+        cache = SliceCache()
+        cache['a'] = self.data
+        self.assertEqual(cache.nbytes, self.nbytes)
+        self.assertIs(cache['a'], self.data)
+
+    def test_nbytes_masked(self):
+        cache = SliceCache()
+        data = np.ma.masked_less(self.data, 1)
+        cache['a'] = data
+        self.assertEqual(cache.nbytes, self.nbytes + data.mask.nbytes)
+
+    def test_nbytes_cube_realised(self):
+        cache = SliceCache()
+        cube = realistic_3d()[0]
+        cache['a'] = cube
+        self.assertFalse(cube.has_lazy_data())
+        self.assertEqual(cache.nbytes, cube.data.nbytes)
+
+    def test_nbytes_bytes(self):
+        cache = SliceCache()
+        cache['a'] = b'image'
+        self.assertEqual(cache.nbytes, 5)
+
+    def test_replace(self):
+        cache = SliceCache()
+        cache['a'] = self.data
+        cache['a'] = self.data[:5]
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.nbytes, self.nbytes // 2)
+
+    def test_evict_least_recently_used(self):
+        cache = SliceCache(max_bytes=self.nbytes * 2)
+        cache['a'] = self.data
+        cache['b'] = self.data.copy()
+        # Touch 'a' so that 'b' becomes the least recently used.
+        cache['a']
+        cache['c'] = self.data.copy()
+        self.assertEqual(cache.keys(), ['a', 'c'])
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(cache.nbytes, self.nbytes * 2)
+
+    def test_too_large(self):
+        cache = SliceCache(max_bytes=self.nbytes - 1)
+        cache['a'] = self.data
+        self.assertNotIn('a', cache)
+        self.assertEqual(cache.nbytes, 0)
+        self.assertEqual(cache.evictions, 1)
+
+
+class Test_get(tests.IrisTest):
+    def test_counters(self):
+        cache = SliceCache()
+        sentinel = tests.mock.sentinel.default
+        self.assertIs(cache.get('a', sentinel), sentinel)
+        cache['a'] = np.arange(3)
+        self.assertIsNotNone(cache.get('a'))
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+
+    def test_contains_not_counted(self):
+        cache = SliceCache()
+        self.assertNotIn('a', cache)
+        self.assertEqual(cache.misses, 0)
+
+
+class Test_resize(tests.IrisTest):
+    def test(self):
+        data = np.arange(10)
+        cache = SliceCache()
+        for key in range(4):
+            cache[key] = data.copy()
+        cache.resize(data.nbytes * 2)
+        self.assertEqual(cache.keys(), [2, 3])
+        self.assertEqual(cache.evictions, 2)
+
+    def test_clear(self):
+        cache = SliceCache()
+        cache['a'] = np.arange(10)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.nbytes, 0)
+
+
+if __name__ == '__main__':
+    tests.main()
@@ -0,0 +1,104 @@
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+"""Unit tests for the `cube_browser.catalogue.Catalogue` class."""
+
+# Import iris.tests first so that some things can be initialised
+# before importing anything else.
+import iris.tests as tests
+
+import os
+import shutil
+import tempfile
+import warnings
+
+import biggus
+from iris.tests.stock import realistic_3d
+
+from cube_browser.catalogue import Catalogue
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dirname)
+        self.path = os.path.join(self.dirname, 'cubes.nc')
+        with open(self.path, 'w') as fh:
+            fh.write('cubes')
+        self.catalogue = Catalogue(os.path.join(self.dirname, 'cat.sqlite'))
+        self.addCleanup(self.catalogue.close)
+        cube = realistic_3d()
+        cube.lazy_data(biggus.NumpyArrayAdapter(cube.data.copy()))
+        self.cubes = [cube]
+
+
+class Test___init__(Test):
+    def test_lazy(self):
+        filename = os.path.join(self.dirname, 'lazy.sqlite')
+        catalogue = Catalogue(filename)
+        self.addCleanup(catalogue.close)
+        self.assertFalse(os.path.exists(filename))
+        self.assertEqual(len(catalogue), 0)
+        self.assertTrue(os.path.exists(filename))
+
+    def test_unavailable(self):
+        filename = os.path.join(self.dirname, 'missing', 'cat.sqlite')
+        catalogue = Catalogue(filename)
+        self.addCleanup(catalogue.close)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            catalogue.put(self.path, self.cubes)
+        self.assertEqual(len(caught), 1)
+        self.assertIn('falling back to an in-memory database',
+                      str(caught[0].message))
+        self.assertEqual(catalogue.filename, ':memory:')
+        self.assertEqual(catalogue.get(self.path), self.cubes)
+        self.assertFalse(os.path.exists(filename))
+
+
+class Test_get(Test):
+    def test_miss(self):
+        self.assertIsNone(self.catalogue.get(self.path))
+        self.assertEqual(self.catalogue.misses, 1)
+
+    def test_hit(self):
+        self.catalogue.put(self.path, self.cubes)
+        cubes = self.catalogue.get(self.path)
+        self.assertEqual(cubes, self.cubes)
+        self.assertTrue(cubes[0].has_lazy_data())
+        self.assertEqual(self.catalogue.hits, 1)
+
+    def test_changed(self):
+        self.catalogue.put(self.path, self.cubes)
+        with open(self.path, 'a') as fh:
+            fh.write(' changed')
+        self.assertIsNone(self.catalogue.get(self.path))
+
+    def test_missing_file(self):
+        self.assertIsNone(self.catalogue.get(self.path + '.missing'))
+
+    def test_persistent(self):
+        self.catalogue.put(self.path, self.cubes)
+        other = Catalogue(self.catalogue.filename)
+        self.addCleanup(other.close)
+        self.assertEqual(other.get(self.path), self.cubes)
+
+
+class Test_put(Test):
+    def test_replace(self):
+        self.catalogue.put(self.path, self.cubes)
+        self.catalogue.put(self.path, [])
+        self.assertEqual(len(self.catalogue), 1)
+        self.assertEqual(self.catalogue.get(self.path), [])
+
+
+class Test_prune(Test):
+    def test(self):
+        self.catalogue.put(self.path, self.cubes)
+        self.assertEqual(self.catalogue.prune(), 0)
+        os.remove(self.path)
+        self.assertEqual(self.catalogue.prune(), 1)
+        self.assertEqual(len(self.catalogue), 0)
+
+
+if __name__ == '__main__':
+    tests.main()
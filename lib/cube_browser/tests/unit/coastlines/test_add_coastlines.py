@@ -0,0 +1,63 @@
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+"""Unit tests for the `cube_browser.coastlines.add_coastlines` function."""
+
+# Import iris.tests first so that some things can be initialised
+# before importing anything else.
+import iris.tests as tests
+
+import cartopy.crs as ccrs
+import matplotlib.pyplot as plt
+from matplotlib.path import Path
+
+from cube_browser.coastlines import CoastlineCollection, add_coastlines
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.axes = plt.axes(projection=ccrs.PlateCarree())
+        self.addCleanup(plt.close, self.axes.figure)
+        self.path = Path([(0, 0), (1, 1)])
+        self.coastline_path = self.patch(
+            'cube_browser.coastlines.coastline_path',
+            return_value=self.path)
+
+    def test_extent(self):
+        extent = (-10, 10, 0, 10)
+        collection = add_coastlines(self.axes, '10m', extent)
+        self.assertIsInstance(collection, CoastlineCollection)
+        self.assertIn(collection, self.axes.collections)
+        self.assertEqual(collection.get_paths(), [self.path])
+        self.coastline_path.assert_called_once_with(self.axes.projection,
+                                                    extent, '10m')
+        self.assertEqual(collection.resolution, '10m')
+        self.assertEqual(collection.extent, extent)
+
+    def test_default_extent(self):
+        self.axes.set_xlim(-10, 10)
+        self.axes.set_ylim(0, 10)
+        collection = add_coastlines(self.axes)
+        self.assertEqual(collection.extent, (-10, 10, 0, 10))
+        self.assertEqual(collection.resolution, '110m')
+
+    def test_pan(self):
+        collection = add_coastlines(self.axes, '10m', (-10, 10, 0, 10))
+        path = Path([(30, 0), (50, 10)])
+        self.coastline_path.return_value = path
+        self.axes.set_xlim(30, 50)
+        self.axes.set_ylim(0, 10)
+        self.axes.figure.canvas.draw()
+        view = tuple(self.axes.get_xlim()) + tuple(self.axes.get_ylim())
+        self.coastline_path.assert_called_with(self.axes.projection, view,
+                                               '10m')
+        self.assertEqual(collection.get_paths(), [path])
+        self.assertEqual(collection.extent, view)
+
+    def test_kwargs(self):
+        collection = add_coastlines(self.axes, edgecolor='red')
+        self.assertEqual(collection.kwargs,
+                         dict(edgecolor='red', facecolor='none', zorder=2))
+
+
+if __name__ == '__main__':
+    tests.main()
@@ -0,0 +1,74 @@
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+"""Unit tests for the `cube_browser.coastlines.coastline_path` function."""
+
+# Import iris.tests first so that some things can be initialised
+# before importing anything else.
+import iris.tests as tests
+
+from collections import OrderedDict
+
+import cartopy.crs as ccrs
+from matplotlib.path import Path
+import shapely.geometry as sgeom
+
+from cube_browser.coastlines import coastline_path
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.patch('cube_browser.coastlines._PATHS', OrderedDict())
+        self.feature = self.patch('cartopy.feature.NaturalEarthFeature')
+        line = sgeom.LineString([(-20, 5), (20, 5)])
+        self.feature.return_value.intersecting_geometries.return_value = [
+            line]
+        self.projection = ccrs.PlateCarree()
+        self.extent = (-10, 10, 0, 10)
+
+    def test_path(self):
+        path = coastline_path(self.projection, self.extent, '50m')
+        self.assertIsInstance(path, Path)
+        self.feature.assert_called_once_with('physical', 'coastline', '50m')
+        # Clipped to the padded extent.
+        self.assertArrayAlmostEqual(path.vertices[:, 0].min(), -12)
+        self.assertArrayAlmostEqual(path.vertices[:, 0].max(), 12)
+
+    def test_cached(self):
+        path = coastline_path(self.projection, self.extent)
+        self.assertIs(coastline_path(self.projection, self.extent), path)
+        self.assertEqual(self.feature.call_count, 1)
+
+    def test_resolution(self):
+        coastline_path(self.projection, self.extent, '10m')
+        coastline_path(self.projection, self.extent, '50m')
+        self.assertEqual(self.feature.call_count, 2)
+
+    def test_extent(self):
+        coastline_path(self.projection, self.extent)
+        coastline_path(self.projection, (-5, 5, 0, 10))
+        self.assertEqual(self.feature.call_count, 2)
+
+    def test_max_paths(self):
+        self.patch('cube_browser.coastlines.MAX_PATHS', 1)
+        coastline_path(self.projection, self.extent)
+        coastline_path(self.projection, (-5, 5, 0, 10))
+        coastline_path(self.projection, self.extent)
+        self.assertEqual(self.feature.call_count, 3)
+
+    def test_pole(self):
+        projection = ccrs.NorthPolarStereo()
+        coastline_path(projection, (-1e6, 1e6, -1e6, 1e6))
+        intersecting = self.feature.return_value.intersecting_geometries
+        lon0, lon1, lat0, lat1 = intersecting.call_args[0][0]
+        self.assertEqual((lon0, lon1, lat1), (-180, 180, 90))
+        self.assertGreater(lat0, 70)
+
+    def test_empty(self):
+        extent = (-10, 10, 20, 30)
+        self.assertIsNone(coastline_path(self.projection, extent))
+        self.assertIsNone(coastline_path(self.projection, extent))
+        self.assertEqual(self.feature.call_count, 1)
+
+
+if __name__ == '__main__':
+    tests.main()
@@ -0,0 +1,47 @@
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+"""Unit tests for the `cube_browser.contour.ContourGeometry` class."""
+
+# Import iris.tests first so that some things can be initialised
+# before importing anything else.
+import iris.tests as tests
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from cube_browser.contour import ContourGeometry
+
+
+class Test_from_contour_set(tests.IrisTest):
+    def test(self):
+        data = np.arange(16, dtype=np.float64).reshape(4, 4)
+        contour_set = plt.contourf(data, levels=[2, 6, 10])
+        geometry = ContourGeometry.from_contour_set(contour_set)
+        self.assertArrayEqual(geometry.levels, [2, 6, 10])
+        self.assertEqual(geometry.zmin, contour_set.zmin)
+        self.assertEqual(geometry.zmax, contour_set.zmax)
+        self.assertIs(geometry.allsegs, contour_set.allsegs)
+        self.assertIs(geometry.allkinds, contour_set.allkinds)
+        plt.close('all')
+
+
+class Test_nbytes(tests.IrisTest):
+    def test_lines(self):
+        segs = [[np.zeros((3, 2))], [np.zeros((4, 2)), np.zeros((2, 2))]]
+        geometry = ContourGeometry(np.arange(2), 0, 1, segs, None)
+        self.assertEqual(geometry.nbytes, 9 * 2 * 8)
+
+    def test_polygons(self):
+        segs = [[np.zeros((3, 2))]]
+        kinds = [[np.zeros(3, dtype=np.uint8)]]
+        geometry = ContourGeometry(np.arange(2), 0, 1, segs, kinds)
+        self.assertEqual(geometry.nbytes, 3 * 2 * 8 + 3)
+
+    def test_missing_kinds(self):
+        segs = [[np.zeros((3, 2))]]
+        geometry = ContourGeometry(np.arange(2), 0, 1, segs, [None])
+        self.assertEqual(geometry.nbytes, 3 * 2 * 8)
+
+
+if __name__ == '__main__':
+    tests.main()
@@ -0,0 +1,74 @@
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+"""Unit tests for the `cube_browser.export.figure_definition` function."""
+
+# Import iris.tests first so that some things can be initialised
+# before importing anything else.
+import iris.tests as tests
+
+import pickle
+
+import iris.plot as iplt
+from iris.tests.stock import realistic_3d
+import matplotlib.pyplot as plt
+
+from cube_browser import Contour, Pcolormesh
+from cube_browser.export import figure_definition
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.cube = realistic_3d()
+        self.projection = iplt.default_projection(self.cube)
+        self.figure = plt.figure(figsize=(8, 4), dpi=50)
+        self.ax = self.figure.add_subplot(111, projection=self.projection)
+        self.ax.set_title('title')
+
+    def tearDown(self):
+        plt.close(self.figure)
+
+    def test_shared_axes(self):
+        pcolormesh = Pcolormesh(self.cube, self.ax, lod='max')
+        contour = Contour(self.cube, self.ax, levels=[280, 290])
+        contour.alias(step=0)
+        result = figure_definition([pcolormesh, contour],
+                                   [['time'], ['step']])
+        self.assertEqual(result.size, (8, 4))
+        self.assertEqual(result.dpi, 50)
+        [axes] = result.axes
+        self.assertEqual(axes.projection, self.projection)
+        self.assertEqual(axes.title, 'title')
+        first, second = result.plots
+        self.assertIs(first.plot_type, Pcolormesh)
+        self.assertIs(first.cube, self.cube)
+        self.assertEqual(first.lod, 'max')
+        self.assertEqual(first.names, ['time'])
+        self.assertEqual(first.axes, 0)
+        self.assertIs(second.plot_type, Contour)
+        self.assertEqual(second.kwargs, dict(levels=[280, 290]))
+        self.assertEqual(second.aliases, dict(step=0))
+        self.assertEqual(second.axes, 0)
+
+    def test_dpi(self):
+        plot = Pcolormesh(self.cube, self.ax)
+        result = figure_definition([plot], [['time']], dpi=200)
+        self.assertEqual(result.dpi, 200)
+
+    def test_picklable(self):
+        plot = Pcolormesh(self.cube, self.ax)
+        result = figure_definition([plot], [['time']])
+        self.assertEqual(pickle.loads(pickle.dumps(result)).token,
+                         result.token)
+
+    def test_many_figures(self):
+        figure = plt.figure()
+        ax = figure.add_subplot(111, projection=self.projection)
+        plots = [Pcolormesh(self.cube, self.ax), Pcolormesh(self.cube, ax)]
+        emsg = 'Require plots on exactly one figure, got 2'
+        with self.assertRaisesRegexp(ValueError, emsg):
+            figure_definition(plots, [['time'], ['time']])
+        plt.close(figure)
+
+
+if __name__ == '__main__':
+    tests.main()
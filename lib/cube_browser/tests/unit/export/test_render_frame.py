@@ -0,0 +1,51 @@
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+"""Unit tests for the `cube_browser.export.render_frame` function."""
+
+# Import iris.tests first so that some things can be initialised
+# before importing anything else.
+import iris.tests as tests
+
+import iris.plot as iplt
+from iris.tests.stock import realistic_3d
+import matplotlib.pyplot as plt
+
+from cube_browser import Pcolormesh
+from cube_browser.export import _FIGURES, figure_definition, render_frame
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.cube = realistic_3d()
+        projection = iplt.default_projection(self.cube)
+        self.figure = plt.figure()
+        ax = self.figure.add_subplot(111, projection=projection)
+        self.plot = Pcolormesh(self.cube, ax, coords=('grid_longitude',
+                                                      'grid_latitude'))
+        self.plot(time=0)
+        self.definition = figure_definition([self.plot], [['time']],
+                                            legend=False)
+
+    def tearDown(self):
+        plt.close(self.figure)
+        for figure, _, _ in _FIGURES.values():
+            plt.close(figure)
+        _FIGURES.clear()
+
+    def test_png(self):
+        result = render_frame(self.definition, dict(time=1))
+        self.assertEqual(result[:4], b'\x89PNG')
+
+    def test_figure_reused(self):
+        render_frame(self.definition, dict(time=1))
+        figure, _, [plot] = _FIGURES[self.definition.token]
+        self.assertEqual(plot.subcube, self.cube[1])
+        render_frame(self.definition, dict(time=2))
+        self.assertIs(_FIGURES[self.definition.token][0], figure)
+        self.assertEqual(plot.subcube, self.cube[2])
+        # The colour limits of the original plot are retained.
+        self.assertEqual(plot.element.get_clim(), self.plot.kwargs['clim'])
+
+
+if __name__ == '__main__':
+    tests.main()
@@ -0,0 +1,56 @@
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+"""Unit tests for the `cube_browser.export.render_frames` function."""
+
+# Import iris.tests first so that some things can be initialised
+# before importing anything else.
+import iris.tests as tests
+
+import multiprocessing.dummy
+import threading
+
+from cube_browser.export import render_frames
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        # Render the frames on worker threads, in place of processes.
+        self.patch('cube_browser.export.process_context',
+                   return_value=multiprocessing.dummy)
+        self.definition = tests.mock.sentinel.definition
+        self.calls = []
+        self.lock = threading.Lock()
+
+        def render_frame(definition, frame, format='png'):
+            with self.lock:
+                self.calls.append((definition, format))
+            return 'frame {}'.format(frame['time'])
+
+        self.patch('cube_browser.export.render_frame',
+                   side_effect=render_frame)
+
+    def test_order(self):
+        frames = [dict(time=index) for index in range(10)]
+        result = list(render_frames(self.definition, frames, processes=3))
+        expected = ['frame {}'.format(index) for index in range(10)]
+        self.assertEqual(result, expected)
+
+    def test_definition_per_worker(self):
+        initialise = []
+        pool = multiprocessing.dummy.Pool
+
+        def make_pool(processes, initializer, initargs):
+            initialise.append(initargs)
+            return pool(processes, initializer, initargs)
+
+        self.patch('multiprocessing.dummy.Pool', side_effect=make_pool)
+        frames = [dict(time=index) for index in range(4)]
+        list(render_frames(self.definition, frames, processes=2,
+                           format='webp'))
+        # The definition is sent to the workers once, not per frame.
+        self.assertEqual(initialise, [(self.definition,)])
+        self.assertEqual(self.calls, [(self.definition, 'webp')] * 4)
+
+
+if __name__ == '__main__':
+    tests.main()
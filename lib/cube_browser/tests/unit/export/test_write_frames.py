@@ -0,0 +1,58 @@
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+"""Unit tests for the `cube_browser.export.write_frames` function."""
+
+# Import iris.tests first so that some things can be initialised
+# before importing anything else.
+import iris.tests as tests
+
+import os
+import shutil
+import tempfile
+
+from cube_browser.export import write_frames
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.images = [b'zero', b'one', b'two']
+
+    def test_sequence(self):
+        dirname = tempfile.mkdtemp()
+        try:
+            filename = os.path.join(dirname, 'frame_{:03d}.png')
+            result = write_frames(iter(self.images), filename)
+            self.assertEqual(result, 3)
+            self.assertEqual(sorted(os.listdir(dirname)),
+                             ['frame_000.png', 'frame_001.png',
+                              'frame_002.png'])
+            with open(filename.format(1), 'rb') as fh:
+                self.assertEqual(fh.read(), b'one')
+        finally:
+            shutil.rmtree(dirname)
+
+    def test_video(self):
+        patch = 'cube_browser.export.subprocess.Popen'
+        with tests.mock.patch(patch) as popen:
+            popen.return_value.wait.return_value = 0
+            result = write_frames(self.images, 'movie.mp4', fps=24)
+        self.assertEqual(result, 3)
+        (command,), _ = popen.call_args
+        self.assertEqual(command[-1], 'movie.mp4')
+        self.assertIn('24', command)
+        stdin = popen.return_value.stdin
+        self.assertEqual(stdin.write.call_args_list,
+                         [tests.mock.call(image) for image in self.images])
+        stdin.close.assert_called_once_with()
+
+    def test_video_failure(self):
+        patch = 'cube_browser.export.subprocess.Popen'
+        with tests.mock.patch(patch) as popen:
+            popen.return_value.wait.return_value = 1
+            emsg = "Failed to encode 'movie.mp4', ffmpeg exited"
+            with self.assertRaisesRegexp(RuntimeError, emsg):
+                write_frames(self.images, 'movie.mp4')
+
+
+if __name__ == '__main__':
+    tests.main()
@@ -0,0 +1,56 @@
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+"""Unit tests for the `cube_browser.grids.grid_key` function."""
+
+# Import iris.tests first so that some things can be initialised
+# before importing anything else.
+import iris.tests as tests
+
+import cartopy.crs as ccrs
+from iris.tests.stock import realistic_3d
+
+from cube_browser.grids import grid_key
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.cube = realistic_3d()[0]
+        self.coords = ('grid_longitude', 'grid_latitude')
+        self.projection = ccrs.PlateCarree()
+
+    def key(self, cube, corners=False):
+        return grid_key(cube, self.coords, self.projection, corners)
+
+    def test_same(self):
+        self.assertEqual(self.key(self.cube), self.key(self.cube.copy()))
+
+    def test_projection_first(self):
+        key = grid_key(self.cube, self.coords, ccrs.Robinson(), False)
+        self.assertNotEqual(key[0], self.key(self.cube)[0])
+        self.assertEqual(key[1:], self.key(self.cube)[1:])
+
+    def test_irregular(self):
+        # Same first and last points, and size, but different spacing.
+        other = self.cube.copy()
+        coord = other.coord('grid_longitude')
+        points = coord.points.copy()
+        points[1:-1] += (points[1] - points[0]) / 2
+        coord.points = points
+        self.assertNotEqual(self.key(self.cube), self.key(other))
+
+    def test_bounds(self):
+        other = self.cube.copy()
+        coord = other.coord('grid_longitude')
+        if coord.bounds is None:
+            coord.guess_bounds()
+        coord.bounds = coord.bounds + 0.01
+        self.assertNotEqual(self.key(self.cube, corners=True),
+                            self.key(other, corners=True))
+
+    def test_dim(self):
+        key = grid_key(self.cube, (1, 0), self.projection, False)
+        self.assertEqual(key[1], (11, 9))
+
+
+if __name__ == '__main__':
+    tests.main()
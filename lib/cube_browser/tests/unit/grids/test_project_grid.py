@@ -0,0 +1,56 @@
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+"""Unit tests for the `cube_browser.grids.project_grid` function."""
+
+# Import iris.tests first so that some things can be initialised
+# before importing anything else.
+import iris.tests as tests
+
+import cartopy.crs as ccrs
+import iris.plot as iplt
+from iris.tests.stock import realistic_3d
+import numpy as np
+
+from cube_browser.grids import Grid, project_grid
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.cube = realistic_3d()[0]
+        self.coords = ('grid_longitude', 'grid_latitude')
+        self.projection = ccrs.PlateCarree()
+
+    def test_points(self):
+        grid = project_grid(self.cube, self.coords, self.projection)
+        self.assertIsInstance(grid, Grid)
+        self.assertEqual(grid.x.shape, (9, 11))
+        self.assertEqual(grid.y.shape, (9, 11))
+        crs = iplt.default_projection(self.cube)
+        x, y = np.meshgrid(self.cube.coord('grid_longitude').points,
+                           self.cube.coord('grid_latitude').points)
+        expected = self.projection.transform_points(crs, x, y)
+        self.assertArrayAlmostEqual(grid.x, expected[..., 0])
+        self.assertArrayAlmostEqual(grid.y, expected[..., 1])
+
+    def test_corners(self):
+        grid = project_grid(self.cube, self.coords, self.projection,
+                            corners=True)
+        self.assertEqual(grid.x.shape, (10, 12))
+        self.assertEqual(grid.y.shape, (10, 12))
+
+    def test_native(self):
+        projection = iplt.default_projection(self.cube)
+        self.assertIsNone(project_grid(self.cube, self.coords, projection))
+
+    def test_anonymous(self):
+        self.assertIsNone(project_grid(self.cube, (1, 0), self.projection))
+
+    def test_no_coord_system(self):
+        for name in self.coords:
+            self.cube.coord(name).coord_system = None
+        self.assertIsNone(project_grid(self.cube, self.coords,
+                                       self.projection))
+
+
+if __name__ == '__main__':
+    tests.main()
@@ -0,0 +1,56 @@
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+"""Unit tests for the `cube_browser.limits.Limits` class."""
+
+# Import iris.tests first so that some things can be initialised
+# before importing anything else.
+import iris.tests as tests
+
+import numpy as np
+
+from cube_browser.limits import Limits
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        # A uniform distribution over [0, 100].
+        edges = np.linspace(0, 100, 101)
+        counts = np.ones(100, dtype=np.int64)
+        self.limits = Limits(0., 100., counts, edges)
+
+    def test_percentile(self):
+        self.assertEqual(self.limits.percentile(25), 25)
+        self.assertArrayEqual(self.limits.percentile([0, 50, 100]),
+                              [0, 50, 100])
+
+    def test_range_minmax(self):
+        self.assertEqual(self.limits.range(), (0, 100))
+
+    def test_range_robust(self):
+        result = self.limits.range('robust')
+        self.assertArrayAlmostEqual(result, (2, 98))
+        result = self.limits.range('robust', percentiles=(10, 90))
+        self.assertArrayAlmostEqual(result, (10, 90))
+
+    def test_bad_mode(self):
+        emsg = "Require a limits mode of 'minmax', 'robust', 'histogram'"
+        with self.assertRaisesRegexp(ValueError, emsg):
+            self.limits.range('median')
+
+    def test_levels_minmax(self):
+        result = self.limits.levels(5)
+        self.assertArrayEqual(result, [0, 25, 50, 75, 100])
+
+    def test_levels_histogram(self):
+        # Most of the values lie within the lowest bin.
+        self.limits.counts[0] = 1000
+        result = self.limits.levels(3, mode='histogram',
+                                    percentiles=(0, 100))
+        self.assertEqual(len(result), 3)
+        self.assertEqual(result[0], 0)
+        self.assertLess(result[1], 1)
+        self.assertEqual(result[2], 100)
+
+
+if __name__ == '__main__':
+    tests.main()
@@ -0,0 +1,79 @@
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+"""Unit tests for the `cube_browser.limits.cube_limits` function."""
+
+# Import iris.tests first so that some things can be initialised
+# before importing anything else.
+import iris.tests as tests
+
+import biggus
+from iris.tests.stock import realistic_3d
+import numpy as np
+
+from cube_browser.limits import cube_limits, reduce_cube
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.cube = realistic_3d()
+        self.data = self.cube.data.copy()
+        self.cube.lazy_data(biggus.NumpyArrayAdapter(self.data))
+        self.plot_dims = (1, 2)
+
+    def test_minmax(self):
+        result = cube_limits(self.cube, self.plot_dims)
+        self.assertEqual(result.vmin, self.data.min())
+        self.assertEqual(result.vmax, self.data.max())
+        self.assertEqual(result.counts.sum(), self.data.size)
+        self.assertTrue(self.cube.has_lazy_data())
+
+    def test_percentiles(self):
+        result = cube_limits(self.cube, self.plot_dims)
+        expected = np.percentile(self.data, (2, 98))
+        span = self.data.max() - self.data.min()
+        self.assertArrayAllClose(result.range('robust'), expected,
+                                 atol=span * 0.01)
+
+    def test_masked(self):
+        data = np.ma.masked_greater(self.data, self.data.mean())
+        self.cube.data = data
+        result = cube_limits(self.cube, self.plot_dims)
+        self.assertEqual(result.vmax, data.max())
+        self.assertEqual(result.counts.sum(), data.count())
+
+    def test_bool(self):
+        self.cube.data = self.data > self.data.mean()
+        result = cube_limits(self.cube, self.plot_dims)
+        self.assertEqual((result.vmin, result.vmax), (0, 1))
+        self.assertEqual(result.counts.sum(), self.data.size)
+        self.assertEqual(result.counts[-1], self.cube.data.sum())
+
+    def test_integer(self):
+        data = np.arange(self.data.size) % 256 - 128
+        data = data.astype(np.int8).reshape(self.data.shape)
+        self.cube.data = data
+        result = cube_limits(self.cube, self.plot_dims)
+        self.assertEqual((result.vmin, result.vmax), (data.min(), data.max()))
+        self.assertEqual(result.counts.sum(), data.size)
+
+    def test_bounded_blocks(self):
+        nbytes = self.data[0].nbytes
+        patch = 'cube_browser.limits.realise'
+        with tests.mock.patch(patch, side_effect=lambda cube: cube.data) \
+                as realise:
+            reduce_cube(self.cube, self.plot_dims, chunks=(4, 9, 11),
+                        max_bytes=3 * nbytes)
+        shapes = [args[0].shape for args, _ in realise.call_args_list]
+        self.assertEqual(shapes, [(3, 9, 11), (3, 9, 11), (1, 9, 11)])
+
+    def test_cached(self):
+        result = cube_limits(self.cube, self.plot_dims)
+        with tests.mock.patch('cube_browser.limits.reduce_cube') as reduce:
+            self.assertIs(cube_limits(self.cube, self.plot_dims), result)
+            self.assertEqual(reduce.call_count, 0)
+            cube_limits(self.cube.copy(), self.plot_dims)
+            self.assertEqual(reduce.call_count, 1)
+
+
+if __name__ == '__main__':
+    tests.main()
@@ -0,0 +1,38 @@
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+"""Unit tests for the `cube_browser.listing.filter_paths` function."""
+
+# Import iris.tests first so that some things can be initialised
+# before importing anything else.
+import iris.tests as tests
+
+from cube_browser.listing import filter_paths
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.paths = ['/data/t_2015.nc', '/data/t_2016.nc', '/data/t_2016.pp',
+                      '/nc/readme']
+
+    def test_empty(self):
+        self.assertIs(filter_paths(self.paths, ''), self.paths)
+
+    def test_glob(self):
+        self.assertEqual(filter_paths(self.paths, '*.nc'),
+                         ['/data/t_2015.nc', '/data/t_2016.nc'])
+
+    def test_glob_basename(self):
+        self.assertEqual(filter_paths(self.paths, '*nc*'),
+                         ['/data/t_2015.nc', '/data/t_2016.nc'])
+
+    def test_regex(self):
+        self.assertEqual(filter_paths(self.paths, 're:2016'),
+                         ['/data/t_2016.nc', '/data/t_2016.pp'])
+
+    def test_bad_regex(self):
+        with self.assertRaisesRegexp(ValueError, 'Invalid filter pattern'):
+            filter_paths(self.paths, 're:(')
+
+
+if __name__ == '__main__':
+    tests.main()
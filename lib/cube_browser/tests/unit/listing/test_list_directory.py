@@ -0,0 +1,63 @@
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+"""Unit tests for the `cube_browser.listing.list_directory` function."""
+
+# Import iris.tests first so that some things can be initialised
+# before importing anything else.
+import iris.tests as tests
+
+import os
+import shutil
+import tempfile
+
+from cube_browser.listing import list_directory
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dirname)
+        for name in ['b.nc', 'a.nc', '.hidden', 'c.pp']:
+            self.touch(name)
+
+    def touch(self, name):
+        with open(os.path.join(self.dirname, name), 'w'):
+            pass
+
+    def test_sorted(self):
+        expected = [os.path.join(self.dirname, name)
+                    for name in ['a.nc', 'b.nc', 'c.pp']]
+        self.assertEqual(list_directory(self.dirname), expected)
+
+    def test_relative(self):
+        parent, basename = os.path.split(self.dirname)
+        cwd = os.getcwd()
+        os.chdir(parent)
+        self.addCleanup(os.chdir, cwd)
+        expected = [os.path.join(basename, name)
+                    for name in ['a.nc', 'b.nc', 'c.pp']]
+        self.assertEqual(list_directory(basename), expected)
+
+    def test_cached(self):
+        first = list_directory(self.dirname)
+        patch = 'cube_browser.listing._scan'
+        with tests.mock.patch(patch) as scan:
+            self.assertIs(list_directory(self.dirname), first)
+        scan.assert_not_called()
+
+    def test_invalidated(self):
+        list_directory(self.dirname)
+        self.touch('d.nc')
+        # Ensure the directory modification time changes.
+        stat = os.stat(self.dirname)
+        os.utime(self.dirname, (stat.st_atime, stat.st_mtime + 1))
+        result = list_directory(self.dirname)
+        self.assertEqual(result[-1], os.path.join(self.dirname, 'd.nc'))
+
+    def test_missing(self):
+        with self.assertRaises(OSError):
+            list_directory(os.path.join(self.dirname, 'missing'))
+
+
+if __name__ == '__main__':
+    tests.main()
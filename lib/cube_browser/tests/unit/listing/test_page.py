@@ -0,0 +1,29 @@
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+"""Unit tests for the `cube_browser.listing.page` function."""
+
+# Import iris.tests first so that some things can be initialised
+# before importing anything else.
+import iris.tests as tests
+
+from cube_browser.listing import npages, page
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.paths = list('abcdefg')
+
+    def test_first(self):
+        self.assertEqual(page(self.paths, 0, 3), ['a', 'b', 'c'])
+
+    def test_last(self):
+        self.assertEqual(page(self.paths, 2, 3), ['g'])
+
+    def test_npages(self):
+        self.assertEqual(npages(self.paths, 3), 3)
+        self.assertEqual(npages(self.paths, 7), 1)
+        self.assertEqual(npages([], 3), 1)
+
+
+if __name__ == '__main__':
+    tests.main()
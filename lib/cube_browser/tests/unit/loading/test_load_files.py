@@ -0,0 +1,82 @@
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+"""Unit tests for the `cube_browser.loading.load_files` function."""
+
+# Import iris.tests first so that some things can be initialised
+# before importing anything else.
+import iris.tests as tests
+
+from concurrent.futures import ThreadPoolExecutor
+
+from iris.tests.stock import realistic_3d
+
+from cube_browser.loading import load_files
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.cube = realistic_3d()
+        self.filenames = ['file_{}.nc'.format(i) for i in range(7)]
+        cubes_by_filename = {filename: [self.cube[i]] for i, filename in
+                             enumerate(self.filenames)}
+        self.patch('cube_browser.loading._load_file',
+                   side_effect=lambda filename: cubes_by_filename[filename])
+
+    def test_serial(self):
+        cubes = load_files(self.filenames, processes=1)
+        self.assertEqual(len(cubes), 1)
+        self.assertEqual(cubes[0], self.cube)
+
+    def test_parallel(self):
+        self.patch('cube_browser.loading.process_executor',
+                   ThreadPoolExecutor)
+        cubes = load_files(self.filenames, processes=3)
+        self.assertEqual(len(cubes), 1)
+        self.assertEqual(cubes[0], self.cube)
+
+    def test_order(self):
+        # The result does not depend on the order of completion.
+        self.patch('cube_browser.loading.process_executor',
+                   ThreadPoolExecutor)
+        expected = load_files(self.filenames, processes=1)
+        for _ in range(5):
+            self.assertEqual(load_files(self.filenames, processes=4),
+                             expected)
+
+    def test_progress(self):
+        progress = tests.mock.Mock()
+        load_files(self.filenames, processes=1, progress=progress)
+        expected = [tests.mock.call(count, 7) for count in range(1, 8)]
+        self.assertEqual(progress.call_args_list, expected)
+
+    def test_catalogue(self):
+        catalogue = tests.mock.Mock()
+        catalogue.get.side_effect = lambda filename: (
+            [self.cube[0]] if filename == 'file_0.nc' else None)
+        load_file = self.patch('cube_browser.loading._load_file',
+                               side_effect=lambda filename: [
+                                   self.cube[self.filenames.index(filename)]])
+        progress = tests.mock.Mock()
+        cubes = load_files(self.filenames, processes=1, progress=progress,
+                           catalogue=catalogue)
+        self.assertEqual(cubes[0], self.cube)
+        self.assertEqual(load_file.call_count, 6)
+        self.assertEqual(catalogue.put.call_count, 6)
+        self.assertEqual(progress.call_args_list[0], tests.mock.call(1, 7))
+
+    def test_duplicates(self):
+        self.patch('cube_browser.loading._load_file',
+                   side_effect=lambda filename: [self.cube[0]])
+        cubes = load_files(self.filenames[:2], processes=1)
+        # The duplicate cubes are loaded, as by iris.load.
+        self.assertEqual(len(cubes), 2)
+        for cube in cubes:
+            self.assertEqual(cube, self.cube[0])
+
+    def test_no_files(self):
+        cubes = load_files([], progress=tests.mock.Mock())
+        self.assertEqual(len(cubes), 0)
+
+
+if __name__ == '__main__':
+    tests.main()
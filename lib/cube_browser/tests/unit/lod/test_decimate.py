@@ -0,0 +1,91 @@
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+"""Unit tests for the `cube_browser.lod.decimate` function."""
+
+# Import iris.tests first so that some things can be initialised
+# before importing anything else.
+import iris.tests as tests
+
+from iris.tests.stock import realistic_3d
+import numpy as np
+
+from cube_browser.lod import decimate
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.cube = realistic_3d()[0]
+        self.cube.data = np.arange(99, dtype=np.float32).reshape(9, 11)
+        self.coords = ('grid_longitude', 'grid_latitude')
+
+    def test_bad_method(self):
+        emsg = "Require a decimation method of 'mean', 'max', 'nearest'"
+        with self.assertRaisesRegexp(ValueError, emsg):
+            decimate(self.cube, self.coords, (2, 2), method='median')
+
+    def test_unit_factors(self):
+        result = decimate(self.cube, self.coords, (1, 1))
+        self.assertIs(result, self.cube)
+
+    def test_mean(self):
+        result = decimate(self.cube, self.coords, (4, 3))
+        self.assertEqual(result.shape, (3, 3))
+        data = self.cube.data
+        self.assertEqual(result.data[0, 0], data[:3, :4].mean())
+        # The last block along the x-axis is partial.
+        self.assertEqual(result.data[2, 2], data[6:, 8:].mean())
+
+    def test_max(self):
+        result = decimate(self.cube, self.coords, (4, 3), method='max')
+        self.assertEqual(result.data[0, 0], self.cube.data[2, 3])
+        self.assertEqual(result.data[2, 2], self.cube.data[8, 10])
+
+    def test_bool(self):
+        self.cube.data = self.cube.data % 50 == 0
+        for method in ('mean', 'max'):
+            result = decimate(self.cube, self.coords, (4, 3), method=method)
+            self.assertEqual(result.shape, (3, 3))
+        self.assertEqual(result.data[0, 0], 1)
+        self.assertEqual(result.data[0, 1], 0)
+
+    def test_nearest(self):
+        result = decimate(self.cube, self.coords, (4, 3), method='nearest')
+        expected = self.cube.data[[1, 4, 7]][:, [1, 5, 9]]
+        self.assertArrayEqual(result.data, expected)
+        glon = self.cube.coord('grid_longitude')
+        self.assertArrayEqual(result.coord('grid_longitude').points,
+                              glon.points[[1, 5, 9]])
+
+    def test_coords(self):
+        result = decimate(self.cube, self.coords, (4, 1))
+        self.assertEqual(result.shape, (9, 3))
+        self.assertEqual(result.coord('grid_latitude'),
+                         self.cube.coord('grid_latitude'))
+        glon = self.cube.coord('grid_longitude').copy()
+        if not glon.has_bounds():
+            glon.guess_bounds()
+        coord = result.coord('grid_longitude')
+        expected = [[glon.bounds[0, 0], glon.bounds[3, 1]],
+                    [glon.bounds[4, 0], glon.bounds[7, 1]],
+                    [glon.bounds[8, 0], glon.bounds[10, 1]]]
+        self.assertArrayAlmostEqual(coord.bounds, expected)
+        expected = [glon.points[:4].mean(), glon.points[4:8].mean(),
+                    glon.points[8:].mean()]
+        self.assertArrayAlmostEqual(coord.points, expected)
+
+    def test_masked(self):
+        data = np.ma.masked_less(self.cube.data, 3)
+        data[0, 4:8] = np.ma.masked
+        self.cube.data = data
+        result = decimate(self.cube, self.coords, (4, 1))
+        self.assertEqual(result.data[0, 0], 3)
+        self.assertIs(result.data[0, 1], np.ma.masked)
+
+    def test_anonymous_dims(self):
+        result = decimate(self.cube, (1, 0), (4, 3))
+        self.assertEqual(result.shape, (3, 3))
+        self.assertEqual(result.data[0, 0], self.cube.data[:3, :4].mean())
+
+
+if __name__ == '__main__':
+    tests.main()
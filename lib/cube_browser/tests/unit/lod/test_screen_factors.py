@@ -0,0 +1,46 @@
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+"""Unit tests for the `cube_browser.lod.screen_factors` function."""
+
+# Import iris.tests first so that some things can be initialised
+# before importing anything else.
+import iris.tests as tests
+
+from matplotlib.transforms import Bbox
+
+from cube_browser.lod import screen_factors
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.axes = tests.mock.Mock()
+        window = Bbox.from_bounds(0, 0, 800, 400)
+        self.axes.get_window_extent.return_value = window
+        self.axes.dataLim = Bbox.from_bounds(0, 0, 360, 180)
+        self.axes.viewLim = Bbox.from_bounds(0, 0, 360, 180)
+
+    def test_full_view(self):
+        result = screen_factors(self.axes, (8640, 4320))
+        self.assertEqual(result, (10, 10))
+
+    def test_small_slice(self):
+        result = screen_factors(self.axes, (100, 50))
+        self.assertEqual(result, (1, 1))
+
+    def test_zoomed(self):
+        self.axes.viewLim = Bbox.from_bounds(0, 0, 36, 18)
+        result = screen_factors(self.axes, (8640, 4320))
+        self.assertEqual(result, (1, 1))
+
+    def test_no_data(self):
+        self.axes.dataLim = Bbox.null()
+        result = screen_factors(self.axes, (8640, 4320))
+        self.assertEqual(result, (10, 10))
+
+    def test_oversample(self):
+        result = screen_factors(self.axes, (8640, 4320), oversample=2)
+        self.assertEqual(result, (5, 5))
+
+
+if __name__ == '__main__':
+    tests.main()
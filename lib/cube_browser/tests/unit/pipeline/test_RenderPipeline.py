@@ -0,0 +1,168 @@
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+"""Unit tests for the `cube_browser.pipeline.RenderPipeline` class."""
+
+# Import iris.tests first so that some things can be initialised
+# before importing anything else.
+import iris.tests as tests
+
+import threading
+import warnings
+
+from cube_browser.pipeline import RenderPipeline
+
+
+class Test___init__(tests.IrisTest):
+    def test_bad_workers(self):
+        emsg = 'requires at least 1 worker, got 0'
+        with self.assertRaisesRegexp(ValueError, emsg):
+            RenderPipeline(workers=0)
+
+
+class Test_submit(tests.IrisTest):
+    def setUp(self):
+        # The callbacks scheduled on the event loop.
+        self.callbacks = []
+        self.pipeline = RenderPipeline(call_soon=self.call_soon)
+        self.p, self.q, self.r = object(), object(), object()
+        self.commit = tests.mock.Mock()
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def tearDown(self):
+        self.release.set()
+        self.pipeline.shutdown()
+
+    def call_soon(self, callback, *args):
+        self.callbacks.append((callback, args))
+
+    def fetch(self, plots):
+        return [id(plot) for plot in plots]
+
+    def blocked(self, plots):
+        self.started.set()
+        self.release.wait()
+        return self.fetch(plots)
+
+    def run_loop(self):
+        """Wait for all the renders, then run the event loop callbacks."""
+        self.release.set()
+        self.pipeline._executor.shutdown(wait=True)
+        for callback, args in self.callbacks:
+            callback(*args)
+
+    def test_commit(self):
+        future = self.pipeline.submit([self.p, self.q], self.fetch,
+                                      self.commit)
+        self.assertEqual(self.pipeline.pending, 1)
+        self.run_loop()
+        expected = ([self.p, self.q], [id(self.p), id(self.q)])
+        self.commit.assert_called_once_with(*expected)
+        self.assertEqual(future.result(), expected)
+        self.assertEqual(self.pipeline.pending, 0)
+        self.assertEqual(self.pipeline.committed, 1)
+
+    def test_cancel_queued(self):
+        self.pipeline.submit([self.q], self.blocked, self.commit)
+        self.started.wait()
+        first = self.pipeline.submit([self.p], self.fetch, self.commit)
+        self.pipeline.submit([self.p], self.fetch, self.commit)
+        self.assertTrue(first.cancelled())
+        self.assertEqual(self.pipeline.cancelled, 1)
+        self.run_loop()
+        expected = [tests.mock.call([self.q], [id(self.q)]),
+                    tests.mock.call([self.p], [id(self.p)])]
+        self.assertEqual(self.commit.call_args_list, expected)
+
+    def test_discard_started(self):
+        self.pipeline.submit([self.p], self.blocked, self.commit)
+        self.started.wait()
+        self.pipeline.submit([self.p], self.fetch, self.commit)
+        self.assertEqual(self.pipeline.cancelled, 0)
+        self.run_loop()
+        # Only the newest frame is committed.
+        self.commit.assert_called_once_with([self.p], [id(self.p)])
+        self.assertEqual(self.pipeline.discarded, 1)
+
+    def test_partially_superseded(self):
+        self.pipeline.submit([self.p, self.q], self.blocked, self.commit)
+        self.started.wait()
+        self.pipeline.submit([self.p], self.fetch, self.commit)
+        self.run_loop()
+        expected = [tests.mock.call([self.q], [id(self.p), id(self.q)]),
+                    tests.mock.call([self.p], [id(self.p)])]
+        self.assertEqual(self.commit.call_args_list, expected)
+
+    def test_fetch_current_plots(self):
+        self.pipeline.submit([self.q], self.blocked, self.commit)
+        self.started.wait()
+        fetch = tests.mock.Mock(return_value=None)
+        self.pipeline.submit([self.p, self.r], fetch, self.commit)
+        self.pipeline.submit([self.p], self.fetch, self.commit)
+        self.run_loop()
+        # The queued render only fetches the plot it is newest for.
+        fetch.assert_called_once_with([self.r])
+
+    def test_supersede(self):
+        self.pipeline.submit([self.p], self.blocked, self.commit)
+        self.started.wait()
+        self.pipeline.supersede([self.p])
+        self.run_loop()
+        self.assertEqual(self.commit.call_count, 0)
+        self.assertEqual(self.pipeline.discarded, 1)
+
+    def test_cancel(self):
+        self.pipeline.submit([self.q], self.blocked, self.commit)
+        self.started.wait()
+        self.pipeline.submit([self.p], self.fetch, self.commit)
+        self.pipeline.cancel()
+        self.assertEqual(self.pipeline.cancelled, 1)
+        self.run_loop()
+        self.assertEqual(self.commit.call_count, 0)
+
+    def test_fetch_error(self):
+        def fetch(plots):
+            raise IOError('read failed')
+
+        self.pipeline.submit([self.p], fetch, self.commit)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            self.run_loop()
+        self.assertEqual(self.commit.call_count, 0)
+        self.assertEqual(len(caught), 1)
+        self.assertIn('failed to render: read failed',
+                      str(caught[0].message))
+
+    def test_fallback(self):
+        def fetch(plots):
+            raise IOError('read failed')
+
+        fallback = tests.mock.Mock()
+        self.pipeline.submit([self.p, self.q], fetch, self.commit,
+                             fallback=fallback)
+        with warnings.catch_warnings(record=True):
+            warnings.simplefilter('always')
+            self.run_loop()
+        fallback.assert_called_once_with([self.p, self.q])
+        self.assertEqual(self.pipeline.fallbacks, 1)
+
+    def test_fallback_superseded(self):
+        def fetch(plots):
+            self.started.set()
+            self.release.wait()
+            raise IOError('read failed')
+
+        fallback = tests.mock.Mock()
+        self.pipeline.submit([self.p, self.q], fetch, self.commit,
+                             fallback=fallback)
+        self.started.wait()
+        self.pipeline.supersede([self.p])
+        with warnings.catch_warnings(record=True):
+            warnings.simplefilter('always')
+            self.run_loop()
+        # Only the plots yet to be superseded are rendered directly.
+        fallback.assert_called_once_with([self.q])
+
+
+if __name__ == '__main__':
+    tests.main()
@@ -0,0 +1,169 @@
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+"""Unit tests for the `cube_browser.player.Player` class."""
+
+# Import iris.tests first so that some things can be initialised
+# before importing anything else.
+import iris.tests as tests
+
+from cube_browser.player import Player
+
+
+class _EventLoop(object):
+    """A manually driven event loop and clock."""
+    def __init__(self):
+        self.now = 0.
+        self.callbacks = []
+
+    def clock(self):
+        return self.now
+
+    def call_later(self, delay, callback):
+        self.callbacks.append((self.now + delay, callback))
+
+    def run(self, count=None):
+        while self.callbacks and count != 0:
+            self.callbacks.sort(key=lambda item: item[0])
+            when, callback = self.callbacks.pop(0)
+            self.now = max(self.now, when)
+            callback()
+            if count is not None:
+                count -= 1
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.loop = _EventLoop()
+        # The cost in seconds of a frame, by coarsening factor.
+        self.costs = {1: 0.02, 2: 0.02, 4: 0.02, 8: 0.02}
+        self.calls = []
+        self.starts = []
+        self.player = Player(self.render, fps=10,
+                             call_later=self.loop.call_later,
+                             clock=self.loop.clock)
+
+    def render(self, step, coarsen):
+        self.calls.append((step, coarsen))
+        self.starts.append(self.loop.now)
+        self.loop.now += self.costs[coarsen]
+
+    def test_bad_fps(self):
+        emsg = 'requires a positive frame rate, got 0'
+        with self.assertRaisesRegexp(ValueError, emsg):
+            Player(self.render, fps=0)
+
+    def test_bad_max_coarsen(self):
+        emsg = 'requires a maximum coarsening of at least 1, got 0'
+        with self.assertRaisesRegexp(ValueError, emsg):
+            Player(self.render, max_coarsen=0)
+
+    def test_target_rate(self):
+        self.player.play()
+        self.assertTrue(self.player.playing)
+        self.assertEqual(self.calls, [])
+        self.loop.run(3)
+        self.assertEqual(self.calls, [(1, 1)] * 3)
+        self.assertArrayAlmostEqual(self.starts, [0, 0.1, 0.2])
+        self.assertEqual(self.player.rendered, 3)
+        self.assertEqual(self.player.skipped, 0)
+        self.assertAlmostEqual(self.player.cost, 0.02)
+
+    def test_play_twice(self):
+        self.player.play()
+        self.player.play()
+        self.assertEqual(len(self.loop.callbacks), 1)
+
+    def test_coarsen(self):
+        self.costs.update({1: 0.3, 2: 0.15, 4: 0.05})
+        self.player.play()
+        self.loop.run(4)
+        expected = [(1, 1), (1, 2), (1, 4), (1, 4)]
+        self.assertEqual(self.calls, expected)
+        self.assertEqual(self.player.coarsen, 4)
+        self.assertEqual(self.player.stride, 1)
+
+    def test_skip(self):
+        self.costs.update({1: 0.25, 2: 0.25})
+        player = Player(self.render, fps=10, max_coarsen=2,
+                        call_later=self.loop.call_later,
+                        clock=self.loop.clock)
+        player.play()
+        self.loop.run(3)
+        self.assertEqual(self.calls, [(1, 1), (1, 2), (3, 2)])
+        self.assertEqual(player.skipped, 2)
+        # Each frame follows the last without delay.
+        self.assertArrayAlmostEqual(self.starts, [0, 0.25, 0.5])
+
+    def test_refine(self):
+        self.player.coarsen = 4
+        self.costs.update({4: 0.01, 2: 0.01, 1: 0.01})
+        self.player.play()
+        self.loop.run(4)
+        expected = [(1, 4), (1, 2), (1, 1), (1, 1)]
+        self.assertEqual(self.calls, expected)
+        self.assertEqual(self.player.coarsen, 1)
+
+    def test_pause(self):
+        self.costs[1] = 0.3
+        self.player.play()
+        self.loop.run(1)
+        self.assertEqual(self.player.coarsen, 2)
+        self.player.pause()
+        self.assertFalse(self.player.playing)
+        # The current frame is rendered at full quality.
+        self.assertEqual(self.calls, [(1, 1), (0, 1)])
+        # The adapted quality is retained for playback.
+        self.assertEqual(self.player.coarsen, 2)
+        self.loop.run()
+        self.assertEqual(len(self.calls), 2)
+
+    def test_pause_full_quality(self):
+        self.player.play()
+        self.loop.run(1)
+        self.player.pause()
+        self.assertEqual(self.calls, [(1, 1)])
+
+    def test_resume(self):
+        self.player.play()
+        self.player.pause()
+        self.player.play()
+        self.loop.run(2)
+        # Only the frame of the latest play is rendered.
+        self.assertEqual(self.calls, [(1, 1)])
+        self.assertEqual(len(self.loop.callbacks), 1)
+
+    def test_render_error(self):
+        def render(step, coarsen):
+            raise RuntimeError('render failed')
+
+        player = Player(render, call_later=self.loop.call_later,
+                        clock=self.loop.clock)
+        player.play()
+        with self.assertRaisesRegexp(RuntimeError, 'render failed'):
+            self.loop.run()
+        self.assertFalse(player.playing)
+
+    def test_render_error_full_quality(self):
+        calls = []
+        errors = []
+
+        def render(step, coarsen):
+            calls.append((step, coarsen))
+            if step:
+                raise RuntimeError('render failed')
+
+        player = Player(render, call_later=self.loop.call_later,
+                        clock=self.loop.clock,
+                        on_error=lambda: errors.append(player.playing))
+        player.coarsen = 4
+        player.play()
+        with self.assertRaisesRegexp(RuntimeError, 'render failed'):
+            self.loop.run()
+        # The failed frame is rendered again at full quality.
+        self.assertEqual(calls, [(1, 4), (0, 1)])
+        self.assertEqual(errors, [False])
+        self.assertEqual(self.loop.callbacks, [])
+
+
+if __name__ == '__main__':
+    tests.main()
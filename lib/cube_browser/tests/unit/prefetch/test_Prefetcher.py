@@ -0,0 +1,73 @@
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+"""Unit tests for the `cube_browser.prefetch.Prefetcher` class."""
+
+# Import iris.tests first so that some things can be initialised
+# before importing anything else.
+import iris.tests as tests
+
+import threading
+
+from iris.tests.stock import realistic_3d
+
+from cube_browser import Contour
+from cube_browser.prefetch import Prefetcher
+
+
+class Test___init__(tests.IrisTest):
+    def test_bad_workers(self):
+        emsg = 'requires at least 1 worker, got 0'
+        with self.assertRaisesRegexp(ValueError, emsg):
+            Prefetcher(workers=0)
+
+
+class Test_schedule(tests.IrisTest):
+    def setUp(self):
+        self.cube = realistic_3d()
+        self.axes = tests.mock.sentinel.axes
+        self.plot = Contour(self.cube, self.axes)
+        self.prefetcher = Prefetcher()
+
+    def tearDown(self):
+        self.prefetcher.shutdown()
+
+    def test_fetch_into_cache(self):
+        requests = [(self.plot, dict(time=1)), (self.plot, dict(time=2))]
+        futures = self.prefetcher.schedule(requests)
+        self.assertEqual(len(futures), 2)
+        for future in futures:
+            future.result()
+        cache = self.plot.cache
+        self.assertEqual(cache.keys(), [(('time', 1),), (('time', 2),)])
+        self.assertEqual(cache[(('time', 2),)], self.cube[2])
+        self.assertEqual(cache.stats['misses'], 2)
+
+    def test_skip_cached(self):
+        self.plot.fetch(time=1)
+        futures = self.prefetcher.schedule([(self.plot, dict(time=1))])
+        self.assertEqual(futures, [])
+
+    def test_skip_duplicate_shared_cache(self):
+        other = Contour(self.cube, self.axes)
+        other.cache = self.plot.cache
+        requests = [(self.plot, dict(time=1)), (other, dict(time=1))]
+        futures = self.prefetcher.schedule(requests)
+        self.assertEqual(len(futures), 1)
+
+    def test_cancel_pending(self):
+        event = threading.Event()
+        self.patch('cube_browser.Plot2D.fetch',
+                   side_effect=lambda **kwargs: event.wait())
+        first = self.prefetcher.schedule([(self.plot, dict(time=1)),
+                                          (self.plot, dict(time=2))])
+        second = self.prefetcher.schedule([(self.plot, dict(time=5))])
+        event.set()
+        second[0].result()
+        # The single worker was busy with the first request, so the
+        # second request of the superseded schedule never started.
+        self.assertTrue(first[1].cancelled())
+        self.assertFalse(second[0].cancelled())
+
+
+if __name__ == '__main__':
+    tests.main()
@@ -0,0 +1,54 @@
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+"""Unit tests for the `cube_browser.scheduler.Debouncer` class."""
+
+# Import iris.tests first so that some things can be initialised
+# before importing anything else.
+import iris.tests as tests
+
+from cube_browser.scheduler import Debouncer
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.callbacks = []
+        self.callback = tests.mock.Mock()
+        self.debouncer = Debouncer(self.callback, delay=0.5,
+                                   call_later=self.call_later)
+
+    def call_later(self, delay, callback):
+        self.callbacks.append((delay, callback))
+
+    def run(self):
+        callbacks, self.callbacks = self.callbacks, []
+        for _, callback in callbacks:
+            callback()
+
+    def test_bad_delay(self):
+        with self.assertRaisesRegexp(ValueError, 'non-negative delay'):
+            Debouncer(self.callback, delay=-1)
+
+    def test_single(self):
+        self.debouncer.submit('a', key=1)
+        self.assertEqual(self.callbacks[0][0], 0.5)
+        self.callback.assert_not_called()
+        self.run()
+        self.callback.assert_called_once_with('a', key=1)
+
+    def test_burst(self):
+        for value in 'abc':
+            self.debouncer.submit(value)
+        self.run()
+        self.callback.assert_called_once_with('c')
+
+    def test_bursts(self):
+        self.debouncer.submit('a')
+        self.run()
+        self.debouncer.submit('b')
+        self.run()
+        self.assertEqual(self.callback.call_args_list,
+                         [tests.mock.call('a'), tests.mock.call('b')])
+
+
+if __name__ == '__main__':
+    tests.main()
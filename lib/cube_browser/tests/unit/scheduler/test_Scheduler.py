@@ -0,0 +1,86 @@
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+"""Unit tests for the `cube_browser.scheduler.Scheduler` class."""
+
+# Import iris.tests first so that some things can be initialised
+# before importing anything else.
+import iris.tests as tests
+
+from cube_browser.scheduler import Scheduler
+
+
+class _EventLoop(object):
+    """A manually driven event loop and clock."""
+    def __init__(self):
+        self.now = 0.
+        self.callbacks = []
+
+    def clock(self):
+        return self.now
+
+    def call_later(self, delay, callback):
+        self.callbacks.append((self.now + delay, callback))
+
+    def run(self):
+        while self.callbacks:
+            self.callbacks.sort(key=lambda item: item[0])
+            when, callback = self.callbacks.pop(0)
+            self.now = max(self.now, when)
+            callback()
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.loop = _EventLoop()
+        self.render = tests.mock.Mock()
+        self.scheduler = Scheduler(self.render, max_fps=4,
+                                   call_later=self.loop.call_later,
+                                   clock=self.loop.clock)
+
+    def test_bad_max_fps(self):
+        emsg = 'requires a positive maximum frame rate, got 0'
+        with self.assertRaisesRegexp(ValueError, emsg):
+            Scheduler(self.render, max_fps=0)
+
+    def test_deferred(self):
+        self.scheduler.submit('time')
+        self.assertEqual(self.render.call_count, 0)
+        self.assertEqual(self.scheduler.pending, ['time'])
+        self.loop.run()
+        self.render.assert_called_once_with(['time'])
+        self.assertEqual(self.scheduler.pending, [])
+
+    def test_coalesce(self):
+        for name in ['time', 'level', 'time', 'time']:
+            self.scheduler.submit(name)
+        self.assertEqual(len(self.loop.callbacks), 1)
+        self.loop.run()
+        self.render.assert_called_once_with(['level', 'time'])
+        self.assertEqual(self.scheduler.received, 4)
+        self.assertEqual(self.scheduler.rendered, 1)
+
+    def test_rate_limit(self):
+        self.scheduler.submit('time')
+        self.loop.run()
+        self.loop.now += 0.1
+        self.scheduler.submit('time')
+        # The next render is delayed until the interval has elapsed.
+        when, _ = self.loop.callbacks[0]
+        self.assertAlmostEqual(when, 0.25)
+        self.loop.run()
+        self.assertEqual(self.render.call_count, 2)
+
+    def test_final_state_rendered(self):
+        def render(names):
+            # Simulate a change arriving during the render.
+            if self.render.call_count == 1:
+                self.scheduler.submit('level')
+        self.render.side_effect = render
+        self.scheduler.submit('time')
+        self.loop.run()
+        expected = [tests.mock.call(['time']), tests.mock.call(['level'])]
+        self.assertEqual(self.render.call_args_list, expected)
+
+
+if __name__ == '__main__':
+    tests.main()
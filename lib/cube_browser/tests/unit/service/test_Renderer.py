@@ -0,0 +1,114 @@
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+"""Unit tests for the `cube_browser.service.Renderer` class."""
+
+# Import iris.tests first so that some things can be initialised
+# before importing anything else.
+import iris.tests as tests
+
+import iris.plot as iplt
+from iris.tests.stock import realistic_3d
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from cube_browser import Contour, Pcolormesh
+from cube_browser.service import Renderer
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.cube = realistic_3d()
+        self.figure = Figure(figsize=(4, 3), dpi=50)
+        FigureCanvasAgg(self.figure)
+        projection = iplt.default_projection(self.cube)
+        ax = self.figure.add_subplot(111, projection=projection)
+        coords = ('grid_longitude', 'grid_latitude')
+        self.pcolormesh = Pcolormesh(self.cube, ax, coords=coords)
+        self.contour = Contour(self.cube, ax, coords=coords)
+        self.renderer = Renderer([self.pcolormesh, self.contour])
+
+    def test_shared_cache(self):
+        self.assertIs(self.pcolormesh.cache, self.contour.cache)
+
+    def test_sliders(self):
+        self.assertEqual(self.renderer.sliders, dict(time=7))
+
+    def test_many_figures(self):
+        other = Figure()
+        plot = Pcolormesh(self.cube, other.add_subplot(111))
+        emsg = 'requires plots on exactly one figure, got 2'
+        with self.assertRaisesRegexp(ValueError, emsg):
+            Renderer([self.pcolormesh, plot])
+
+    def test_render(self):
+        result = self.renderer.render(time=3)
+        self.assertEqual(result[:4], b'\x89PNG')
+        self.assertEqual(self.pcolormesh.subcube, self.cube[3])
+        self.assertEqual(self.contour.subcube, self.cube[3])
+
+    def test_cached(self):
+        first = self.renderer.render(time=3)
+        with tests.mock.patch('cube_browser.Pcolormesh.__call__') as call:
+            self.assertIs(self.renderer.render(time=3), first)
+        self.assertEqual(call.call_count, 0)
+        stats = self.renderer.cache.stats
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['nbytes'], len(first))
+
+    def test_size(self):
+        self.renderer.render(time=3, width=100, height='80')
+        key = self.renderer.cache.keys()[0]
+        self.assertEqual(key[:2], ('png', (100, 80)))
+        # The figure size is restored for later requests.
+        self.assertArrayEqual(self.figure.get_size_inches(), (4, 3))
+        self.renderer.render(time=3)
+        key = self.renderer.cache.keys()[-1]
+        self.assertEqual(key[:2], ('png', (200, 150)))
+
+    def test_size_too_large(self):
+        renderer = Renderer([self.pcolormesh, self.contour], max_size=500)
+        emsg = 'image width out of range \\[1, 500\\], got 501'
+        with self.assertRaisesRegexp(ValueError, emsg):
+            renderer.render(time=3, width=501)
+        self.assertEqual(len(renderer.cache), 0)
+
+    def test_size_too_small(self):
+        emsg = 'image height out of range \\[1, 4096\\], got 0'
+        with self.assertRaisesRegexp(ValueError, emsg):
+            self.renderer.render(time=3, height=0)
+
+    def test_size_restored_on_error(self):
+        with tests.mock.patch('cube_browser.Pcolormesh.__call__',
+                              side_effect=RuntimeError('draw failed')):
+            with self.assertRaisesRegexp(RuntimeError, 'draw failed'):
+                self.renderer.render(time=3, width=100)
+        self.assertArrayEqual(self.figure.get_size_inches(), (4, 3))
+
+    def test_cached_while_rendering(self):
+        first = self.renderer.render(time=3)
+        with self.renderer._lock:
+            # A cached image is served while another render is drawing.
+            self.assertIs(self.renderer.render(time=3), first)
+
+    def test_default_state(self):
+        self.renderer.render()
+        self.assertEqual(self.pcolormesh.subcube, self.cube[0])
+
+    def test_bad_format(self):
+        emsg = "requires an image format of png, webp, got 'gif'"
+        with self.assertRaisesRegexp(ValueError, emsg):
+            self.renderer.render(format='gif')
+
+    def test_bad_name(self):
+        emsg = "got unknown slider names \\['height_level'\\]"
+        with self.assertRaisesRegexp(ValueError, emsg):
+            self.renderer.render(height_level=1)
+
+    def test_bad_value(self):
+        emsg = "slider 'time' value out of range \\[0, 7\\), got 7"
+        with self.assertRaisesRegexp(ValueError, emsg):
+            self.renderer.render(time=7)
+
+
+if __name__ == '__main__':
+    tests.main()
@@ -0,0 +1,84 @@
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+"""Unit tests for the `cube_browser.service.make_server` function."""
+
+# Import iris.tests first so that some things can be initialised
+# before importing anything else.
+import iris.tests as tests
+
+import json
+import threading
+
+from six.moves.urllib.error import HTTPError
+from six.moves.urllib.request import urlopen
+
+from cube_browser.service import make_server
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.renderer = tests.mock.Mock(sliders=dict(time=7))
+        self.renderer.cache.stats = dict(hits=1)
+        self.renderer.render.return_value = b'image'
+        self.server = make_server(self.renderer, port=0)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+        host, port = self.server.server_address
+        self.url = 'http://{}:{}'.format(host, port)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+    def _get(self, path):
+        response = urlopen(self.url + path)
+        try:
+            return response.info()['Content-Type'], response.read()
+        finally:
+            response.close()
+
+    def test_render(self):
+        content_type, body = self._get('/render.png?time=3&width=200')
+        self.assertEqual(content_type, 'image/png')
+        self.assertEqual(body, b'image')
+        self.renderer.render.assert_called_once_with(format='png', time='3',
+                                                     width='200')
+
+    def test_render_webp(self):
+        content_type, _ = self._get('/render.webp')
+        self.assertEqual(content_type, 'image/webp')
+
+    def test_bad_request(self):
+        self.renderer.render.side_effect = ValueError('bad slider')
+        with self.assertRaises(HTTPError) as context:
+            self._get('/render.png?time=99')
+        self.assertEqual(context.exception.code, 400)
+        body = json.loads(context.exception.read().decode('utf-8'))
+        self.assertEqual(body, dict(error='bad slider'))
+
+    def test_render_error(self):
+        self.renderer.render.side_effect = RuntimeError('draw failed')
+        with self.assertRaises(HTTPError) as context:
+            self._get('/render.png')
+        self.assertEqual(context.exception.code, 500)
+        body = json.loads(context.exception.read().decode('utf-8'))
+        self.assertEqual(body, dict(error='Failed to render.'))
+
+    def test_sliders(self):
+        content_type, body = self._get('/sliders')
+        self.assertEqual(content_type, 'application/json')
+        self.assertEqual(json.loads(body.decode('utf-8')), dict(time=7))
+
+    def test_stats(self):
+        _, body = self._get('/stats')
+        self.assertEqual(json.loads(body.decode('utf-8')), dict(hits=1))
+
+    def test_not_found(self):
+        with self.assertRaises(HTTPError) as context:
+            self._get('/missing')
+        self.assertEqual(context.exception.code, 404)
+
+
+if __name__ == '__main__':
+    tests.main()
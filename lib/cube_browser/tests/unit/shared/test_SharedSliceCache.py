@@ -0,0 +1,158 @@
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+"""Unit tests for the `cube_browser.shared.SharedSliceCache` class."""
+
+# Import iris.tests first so that some things can be initialised
+# before importing anything else.
+import iris.tests as tests
+
+import glob
+import os
+import shutil
+import tempfile
+
+import biggus
+from iris.tests.stock import realistic_3d
+import numpy as np
+
+from cube_browser.shared import SharedSliceCache
+
+
+class _Proxy(object):
+    def __init__(self, path):
+        self.path = path
+        self.variable_name = 'air_potential_temperature'
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dirname)
+        self.source = os.path.join(self.dirname, 'source.nc')
+        with open(self.source, 'w') as fh:
+            fh.write('source')
+        self.shared = os.path.join(self.dirname, 'shared')
+        cube = realistic_3d()
+        self.data = cube.data.copy()
+        self.proxy = _Proxy(self.source)
+        self.sources = self.patch('cube_browser.shared._sources',
+                                  return_value=[(self.proxy, (2,))])
+
+    def _subcube(self, data=None):
+        cube = realistic_3d()[2]
+        if data is None:
+            data = self.data[2]
+        cube.lazy_data(biggus.NumpyArrayAdapter(data))
+        return cube
+
+    def _files(self):
+        return sorted(os.path.basename(path) for path in
+                      glob.glob(os.path.join(self.shared, '*.npy')))
+
+
+class Test___init__(Test):
+    def test_dirname(self):
+        cache = SharedSliceCache(dirname=self.shared)
+        self.assertTrue(os.path.isdir(self.shared))
+        self.assertEqual(cache.dirname, self.shared)
+
+    def test_bad_max_shared_bytes(self):
+        emsg = 'non-negative shared byte budget'
+        with self.assertRaisesRegexp(ValueError, emsg):
+            SharedSliceCache(dirname=self.shared, max_shared_bytes=-1)
+
+
+class Test_name(Test):
+    def test_lazy(self):
+        name = SharedSliceCache.name(self._subcube())
+        self.assertEqual(len(name), 40)
+        self.assertEqual(name, SharedSliceCache.name(self._subcube()))
+
+    def test_index(self):
+        name = SharedSliceCache.name(self._subcube())
+        self.sources.return_value = [(self.proxy, (3,))]
+        self.assertNotEqual(SharedSliceCache.name(self._subcube()), name)
+
+    def test_realised(self):
+        cube = self._subcube()
+        cube.data
+        self.assertIsNone(SharedSliceCache.name(cube))
+
+    def test_many_sources(self):
+        self.sources.return_value = [(self.proxy, (2,)), (self.proxy, (3,))]
+        self.assertIsNone(SharedSliceCache.name(self._subcube()))
+
+
+class Test_realise(Test):
+    def test_store(self):
+        cache = SharedSliceCache(dirname=self.shared)
+        cube = self._subcube()
+        data = cache.realise(cube)
+        self.assertArrayEqual(data, self.data[2])
+        self.assertIsInstance(data, np.memmap)
+        self.assertIs(cube.data, data)
+        self.assertEqual(len(self._files()), 1)
+        self.assertEqual(cache.stats['shared_stores'], 1)
+        self.assertEqual(cache.stats['shared_hits'], 0)
+
+    def test_shared(self):
+        SharedSliceCache(dirname=self.shared).realise(self._subcube())
+        cache = SharedSliceCache(dirname=self.shared)
+        # The data is mapped from the shared directory, not read.
+        cube = self._subcube(np.zeros_like(self.data[2]))
+        data = cache.realise(cube)
+        self.assertArrayEqual(data, self.data[2])
+        self.assertEqual(cache.stats['shared_stores'], 0)
+        self.assertEqual(cache.stats['shared_hits'], 1)
+
+    def test_masked(self):
+        cache = SharedSliceCache(dirname=self.shared)
+        masked = np.ma.masked_less(self.data[2], self.data[2].mean())
+        data = cache.realise(self._subcube(masked))
+        self.assertIsInstance(data, np.ma.MaskedArray)
+        self.assertMaskedArrayEqual(data, masked)
+        self.assertEqual(len(self._files()), 2)
+
+    def test_masked_incomplete(self):
+        cache = SharedSliceCache(dirname=self.shared)
+        masked = np.ma.masked_less(self.data[2], self.data[2].mean())
+        cache.realise(self._subcube(masked))
+        for path in glob.glob(os.path.join(self.shared, '*.mask.npy')):
+            os.remove(path)
+        data = SharedSliceCache(dirname=self.shared).realise(
+            self._subcube(masked))
+        self.assertMaskedArrayEqual(data, masked)
+
+    def test_not_shared(self):
+        self.sources.return_value = []
+        cache = SharedSliceCache(dirname=self.shared)
+        data = cache.realise(self._subcube())
+        self.assertArrayEqual(data, self.data[2])
+        self.assertNotIsInstance(data, np.memmap)
+        self.assertEqual(self._files(), [])
+
+    def test_evict(self):
+        nbytes = self.data[2].nbytes
+        cache = SharedSliceCache(dirname=self.shared,
+                                 max_shared_bytes=int(1.5 * nbytes) + 256)
+        cache.realise(self._subcube())
+        first = self._files()
+        # Make the first slice the least recently used.
+        os.utime(os.path.join(self.shared, first[0]), (0, 0))
+        self.sources.return_value = [(self.proxy, (3,))]
+        cache.realise(self._subcube(self.data[3]))
+        files = self._files()
+        self.assertEqual(len(files), 1)
+        self.assertNotEqual(files, first)
+
+
+class Test_clear_shared(Test):
+    def test(self):
+        cache = SharedSliceCache(dirname=self.shared)
+        cache.realise(self._subcube())
+        cache.clear_shared()
+        self.assertEqual(self._files(), [])
+
+
+if __name__ == '__main__':
+    tests.main()
@@ -0,0 +1,44 @@
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+"""Unit tests for the `cube_browser.shared.mapped` function."""
+
+# Import iris.tests first so that some things can be initialised
+# before importing anything else.
+import iris.tests as tests
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from cube_browser.shared import mapped
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        dirname = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, dirname)
+        filename = os.path.join(dirname, 'data.npy')
+        np.save(filename, np.arange(12.).reshape(3, 4))
+        self.data = np.load(filename, mmap_mode='r')
+
+    def test_mapped(self):
+        self.assertTrue(mapped(self.data))
+
+    def test_view(self):
+        self.assertTrue(mapped(self.data[1]))
+
+    def test_masked_view(self):
+        data = np.ma.masked_array(self.data, mask=self.data > 5, copy=False)
+        self.assertTrue(mapped(data[1]))
+
+    def test_copy(self):
+        self.assertFalse(mapped(self.data[1].copy()))
+
+    def test_private(self):
+        self.assertFalse(mapped(np.arange(3)))
+
+
+if __name__ == '__main__':
+    tests.main()
@@ -0,0 +1,109 @@
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+"""Unit tests for the `cube_browser.slicing.LazySlicer` class."""
+
+# Import iris.tests first so that some things can be initialised
+# before importing anything else.
+import iris.tests as tests
+
+import warnings
+
+import biggus
+from iris.tests.stock import realistic_3d
+
+from cube_browser.slicing import LazySlicer
+
+
+class Test___getitem__(tests.IrisTest):
+    def setUp(self):
+        self.cube = realistic_3d()
+        self.data = self.cube.data.copy()
+        self.cube.lazy_data(biggus.NumpyArrayAdapter(self.data))
+        self.index = (2, slice(None), slice(None))
+        self.nbytes = self.data[2].nbytes
+        self.patch('cube_browser.slicing.disk_chunks',
+                   return_value=(7, 9, 11))
+
+    def test_lazy(self):
+        slicer = LazySlicer(self.cube)
+        subcube = slicer[self.index]
+        self.assertTrue(self.cube.has_lazy_data())
+        self.assertTrue(subcube.has_lazy_data())
+        self.assertArrayEqual(subcube.data, self.data[2])
+        self.assertTrue(self.cube.has_lazy_data())
+
+    def test_accounting(self):
+        slicer = LazySlicer(self.cube)
+        slicer[self.index]
+        slicer[self.index]
+        expected = dict(reads=2, nbytes=2 * self.nbytes,
+                        chunk_nbytes=2 * 7 * self.nbytes)
+        self.assertEqual(slicer.stats, expected)
+        self.assertEqual(slicer.last_read.index, self.index)
+        self.assertEqual(slicer.last_read.amplification, 7)
+
+    def test_realised_cube(self):
+        self.cube.data
+        slicer = LazySlicer(self.cube)
+        subcube = slicer[self.index]
+        self.assertArrayEqual(subcube.data, self.data[2])
+        self.assertEqual(slicer.stats['reads'], 0)
+        self.assertIsNone(slicer.last_read)
+
+    def test_warn_once(self):
+        slicer = LazySlicer(self.cube, max_amplification=4)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            slicer[self.index]
+            slicer[self.index]
+        self.assertEqual(len(caught), 1)
+        self.assertIn('decompresses', str(caught[0].message))
+
+    def test_no_warn(self):
+        slicer = LazySlicer(self.cube)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            slicer[self.index]
+        self.assertEqual(len(caught), 0)
+
+
+class Test_chunk_index(tests.IrisTest):
+    def setUp(self):
+        self.cube = realistic_3d()
+        self.cube.lazy_data(biggus.NumpyArrayAdapter(self.cube.data))
+        self.patcher = self.patch('cube_browser.slicing.disk_chunks',
+                                  return_value=(3, 9, 11))
+
+    def test_block(self):
+        slicer = LazySlicer(self.cube)
+        result = slicer.chunk_index((4, slice(None), slice(None)))
+        expected = (slice(3, 6), slice(None), slice(None))
+        self.assertEqual(result, expected)
+
+    def test_partial_block(self):
+        slicer = LazySlicer(self.cube)
+        # The last chunk along time holds a single step.
+        result = slicer.chunk_index((-1, slice(None), slice(None)))
+        self.assertIsNone(result)
+        result = slicer.chunk_index((5, 2, slice(None)))
+        expected = (slice(3, 6), slice(0, 9), slice(None))
+        self.assertEqual(result, expected)
+
+    def test_unit_chunks(self):
+        self.patcher.return_value = (1, 9, 11)
+        slicer = LazySlicer(self.cube)
+        self.assertIsNone(slicer.chunk_index((4, slice(None), slice(None))))
+
+    def test_unknown_chunks(self):
+        self.patcher.return_value = None
+        slicer = LazySlicer(self.cube)
+        self.assertIsNone(slicer.chunk_index((4, slice(None), slice(None))))
+
+    def test_realised_cube(self):
+        self.cube.data
+        slicer = LazySlicer(self.cube)
+        self.assertIsNone(slicer.chunk_index((4, slice(None), slice(None))))
+
+
+if __name__ == '__main__':
+    tests.main()
@@ -0,0 +1,51 @@
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+"""Unit tests for the `cube_browser.slicing.chunk_read` function."""
+
+# Import iris.tests first so that some things can be initialised
+# before importing anything else.
+import iris.tests as tests
+
+import numpy as np
+
+from cube_browser.slicing import chunk_read
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.shape = (48, 10, 20)
+        self.dtype = np.float32
+        self.index = (5, slice(None), slice(None))
+        self.nbytes = 10 * 20 * 4
+
+    def test_unknown_chunks(self):
+        read = chunk_read(self.shape, None, self.dtype, self.index)
+        self.assertEqual(read.index, self.index)
+        self.assertEqual(read.nbytes, self.nbytes)
+        self.assertEqual(read.chunk_nbytes, self.nbytes)
+        self.assertEqual(read.amplification, 1)
+
+    def test_aligned_chunks(self):
+        read = chunk_read(self.shape, (1, 10, 20), self.dtype, self.index)
+        self.assertEqual(read.chunk_nbytes, self.nbytes)
+
+    def test_time_chunks(self):
+        read = chunk_read(self.shape, (24, 5, 20), self.dtype, self.index)
+        self.assertEqual(read.nbytes, self.nbytes)
+        self.assertEqual(read.chunk_nbytes, 24 * self.nbytes)
+        self.assertEqual(read.amplification, 24)
+
+    def test_partial_last_chunk(self):
+        index = (47, slice(None), slice(None))
+        read = chunk_read(self.shape, (20, 10, 20), self.dtype, index)
+        # The last chunk along time only holds 8 of its 20 steps.
+        self.assertEqual(read.chunk_nbytes, 8 * self.nbytes)
+
+    def test_negative_index(self):
+        index = (-1, slice(None), slice(None))
+        read = chunk_read(self.shape, (20, 10, 20), self.dtype, index)
+        self.assertEqual(read.chunk_nbytes, 8 * self.nbytes)
+
+
+if __name__ == '__main__':
+    tests.main()
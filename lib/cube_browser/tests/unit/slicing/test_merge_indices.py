@@ -0,0 +1,61 @@
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+"""Unit tests for the `cube_browser.slicing.merge_indices` function."""
+
+# Import iris.tests first so that some things can be initialised
+# before importing anything else.
+import iris.tests as tests
+
+from cube_browser.slicing import merge_indices
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.shape = (7, 5, 9, 11)
+        self.plane = (slice(None), slice(None))
+
+    def _index(self, t, z):
+        return (t, z) + self.plane
+
+    def _block(self, t, z):
+        return (slice(*t), slice(*z), slice(0, 9), slice(0, 11))
+
+    def test_duplicates(self):
+        indices = [self._index(2, 1), self._index(2, 1)]
+        result = merge_indices(self.shape, indices)
+        self.assertEqual(result, [(self._block((2, 3), (1, 2)), [0, 1])])
+
+    def test_contiguous(self):
+        indices = [self._index(3, 1), self._index(2, 1), self._index(2, 1),
+                   self._index(5, 1)]
+        result = merge_indices(self.shape, indices)
+        expected = [(self._block((2, 4), (1, 2)), [0, 1, 2]),
+                    (self._block((5, 6), (1, 2)), [3])]
+        self.assertEqual(result, expected)
+
+    def test_box(self):
+        indices = [self._index(t, z) for t in (2, 3) for z in (0, 1)]
+        result = merge_indices(self.shape, indices)
+        self.assertEqual(result, [(self._block((2, 4), (0, 2)),
+                                   [0, 1, 2, 3])])
+
+    def test_diagonal(self):
+        indices = [self._index(2, 0), self._index(3, 1)]
+        result = merge_indices(self.shape, indices)
+        expected = [(self._block((2, 3), (0, 1)), [0]),
+                    (self._block((3, 4), (1, 2)), [1])]
+        self.assertEqual(result, expected)
+
+    def test_negative(self):
+        indices = [self._index(-1, 0), self._index(5, 0)]
+        result = merge_indices(self.shape, indices)
+        self.assertEqual(result, [(self._block((5, 7), (0, 1)), [0, 1])])
+
+    def test_step(self):
+        index = (slice(0, 7, 2), 0) + self.plane
+        with self.assertRaisesRegexp(ValueError, 'unit step'):
+            merge_indices(self.shape, [index])
+
+
+if __name__ == '__main__':
+    tests.main()
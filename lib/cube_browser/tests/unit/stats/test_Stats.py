@@ -0,0 +1,92 @@
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+"""Unit tests for the `cube_browser.stats.Stats` class."""
+
+# Import iris.tests first so that some things can be initialised
+# before importing anything else.
+import iris.tests as tests
+
+import json
+import threading
+
+from cube_browser.stats import Stats, span
+
+
+class _Clock(object):
+    def __init__(self):
+        self.now = 0.
+
+    def __call__(self):
+        return self.now
+
+
+class Test_span(tests.IrisTest):
+    def test(self):
+        clock = _Clock()
+        stats = Stats(clock=clock)
+        with stats.span('draw'):
+            clock.now += 0.5
+        self.assertEqual(stats.names, ['draw'])
+        self.assertEqual(stats.samples('draw'), [0.5])
+
+    def test_exception(self):
+        stats = Stats()
+        with self.assertRaises(ZeroDivisionError):
+            with stats.span('draw'):
+                1 / 0
+        self.assertEqual(len(stats.samples('draw')), 1)
+
+    def test_no_stats(self):
+        with span(None, 'draw'):
+            pass
+
+    def test_background_thread(self):
+        stats = Stats()
+        thread = threading.Thread(target=stats.record, args=('slice', 1.))
+        thread.start()
+        thread.join()
+        self.assertEqual(stats.names, ['background.slice'])
+
+
+class Test_summary(tests.IrisTest):
+    def setUp(self):
+        self.stats = Stats(max_samples=100)
+        for value in range(101):
+            self.stats.record('draw', float(value))
+
+    def test(self):
+        summary = self.stats.summary('draw')
+        self.assertEqual(summary['count'], 101)
+        # Only the latest 100 samples are retained.
+        self.assertEqual(summary['min'], 1.)
+        self.assertEqual(summary['max'], 100.)
+        self.assertEqual(summary['mean'], 50.5)
+        self.assertAlmostEqual(summary['p50'], 50.5)
+        self.assertAlmostEqual(summary['p90'], 90.1)
+        self.assertAlmostEqual(summary['p99'], 99.01)
+
+    def test_order(self):
+        summary = self.stats.summary('draw')
+        expected = ['count', 'mean', 'min', 'max', 'p50', 'p90', 'p99']
+        self.assertEqual(list(summary.keys()), expected)
+
+    def test_to_json(self):
+        self.stats.record('event', 0.25)
+        result = json.loads(self.stats.to_json())
+        self.assertEqual(sorted(result.keys()), ['draw', 'event'])
+        self.assertEqual(result['event']['count'], 1)
+        self.assertEqual(result['event']['p50'], 0.25)
+
+    def test_reset(self):
+        self.stats.reset()
+        self.assertEqual(self.stats.names, [])
+        self.assertEqual(self.stats.to_dict(), {})
+
+    def test_bad_max_samples(self):
+        emsg = 'requires at least 1 sample, got 0'
+        with self.assertRaisesRegexp(ValueError, emsg):
+            Stats(max_samples=0)
+
+
+if __name__ == '__main__':
+    tests.main()
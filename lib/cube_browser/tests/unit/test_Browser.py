@@ -6,12 +6,16 @@ from six.moves import (filter, input, map, range, zip)  # noqa
 # before importing anything else.
 import iris.tests as tests
 
+import warnings
+
+import biggus
 from iris.coords import DimCoord
 from iris.cube import CubeList
 from iris.tests import mock
 from iris.tests.stock import realistic_3d
 
 from cube_browser import Browser, Contour, _AxisAlias, _AxisDefn
+from cube_browser.pipeline import RenderPipeline
 
 
 def _add_levels(cube, levels=13):
@@ -460,5 +464,583 @@ class Test_on_change(tests.IrisTest):
             func.assert_has_calls(expected)
 
 
+class Test__prefetch_requests(tests.IrisTest):
+    def setUp(self):
+        self.cube = realistic_3d()
+        self.axes = mock.sentinel.axes
+        self.patch('IPython.display.display')
+        mockers = [mock.Mock(value=0) for i in range(20)]
+        self.patch('ipywidgets.SelectionSlider', side_effect=mockers)
+        self.patch('ipywidgets.VBox')
+        self.patch('ipywidgets.HBox')
+        self.patch('ipywidgets.Label')
+        self.patch('cube_browser.Plot2D.legend')
+
+    def test_bad_prefetch(self):
+        plot = Contour(self.cube, self.axes)
+        emsg = 'requires a non-negative prefetch, got -1'
+        with self.assertRaisesRegexp(ValueError, emsg):
+            Browser(plot, prefetch=-1)
+
+    def test_disabled(self):
+        plot = Contour(self.cube, self.axes)
+        browser = Browser(plot)
+        self.assertIsNone(browser.prefetcher)
+
+    def test_neighbours(self):
+        plot = Contour(self.cube, self.axes)
+        browser = Browser(plot, prefetch=2)
+        browser._slider_by_name['time'].value = 3
+        requests = browser._prefetch_requests()
+        expected = [(plot, dict(time=4)), (plot, dict(time=2)),
+                    (plot, dict(time=5)), (plot, dict(time=1))]
+        self.assertEqual(requests, expected)
+        browser.prefetcher.shutdown()
+
+    def test_neighbours_clipped(self):
+        plot = Contour(self.cube, self.axes)
+        browser = Browser(plot, prefetch=2)
+        browser._slider_by_name['time'].value = 6
+        requests = browser._prefetch_requests()
+        expected = [(plot, dict(time=5)), (plot, dict(time=4))]
+        self.assertEqual(requests, expected)
+        browser.prefetcher.shutdown()
+
+    def test_first(self):
+        c1 = Contour(self.cube, self.axes)
+        other = _add_levels(self.cube, 5)
+        c2 = Contour(other, self.axes)
+        browser = Browser([c1, c2], prefetch=1)
+        requests = browser._prefetch_requests(first='time')
+        expected = [(c1, dict(time=1)),
+                    (c2, dict(time=1, model_level_number=0)),
+                    (c2, dict(time=0, model_level_number=1))]
+        self.assertEqual(requests, expected)
+        browser.prefetcher.shutdown()
+
+    def test_on_change_schedules(self):
+        plot = Contour(self.cube, self.axes)
+        browser = Browser(plot, prefetch=1)
+        browser.prefetcher.shutdown()
+        browser.prefetcher = mock.Mock()
+        with mock.patch('cube_browser.Contour.__call__'):
+            browser.on_change(None)
+        expected = [(plot, dict(time=1))]
+        browser.prefetcher.schedule.assert_called_once_with(expected)
+
+
+class Test_on_change__autoscale(tests.IrisTest):
+    def setUp(self):
+        self.cube = realistic_3d()
+        self.axes = mock.sentinel.axes
+        self.patch('IPython.display.display')
+        mockers = [mock.Mock(value=0) for i in range(20)]
+        self.patch('ipywidgets.SelectionSlider', side_effect=mockers)
+        self.patch('ipywidgets.VBox')
+        self.patch('ipywidgets.HBox')
+        self.patch('ipywidgets.Label')
+        self.patch('cube_browser.Plot2D.legend')
+        self.patch('cube_browser.Contour.__call__')
+        self.autoscale = self.patch('cube_browser.Plot2D.autoscale')
+
+    def test_bad_autoscale(self):
+        plot = Contour(self.cube, self.axes)
+        emsg = "requires an autoscale mode of .*, got 'median'"
+        with self.assertRaisesRegexp(ValueError, emsg):
+            Browser(plot, autoscale='median')
+
+    def test_disabled(self):
+        plot = Contour(self.cube, self.axes)
+        browser = Browser(plot)
+        browser.on_change(None)
+        self.assertEqual(self.autoscale.call_count, 0)
+
+    def test_initial_render(self):
+        plots = [Contour(self.cube, self.axes), Contour(self.cube, self.axes)]
+        browser = Browser(plots, autoscale='histogram')
+        browser.on_change(None)
+        self.assertEqual(self.autoscale.call_args_list,
+                         [mock.call(mode='histogram')] * 2)
+        # Only the initial render triggers autoscaling.
+        slider = browser._slider_by_name['time']
+        browser.on_change(dict(owner=slider))
+        self.assertEqual(self.autoscale.call_count, 2)
+
+
+class Test__batch_fetch(tests.IrisTest):
+    def setUp(self):
+        cube = _add_levels(realistic_3d(), 5)
+        self.data = cube.data.copy()
+        cube.lazy_data(biggus.NumpyArrayAdapter(self.data))
+        self.cube = cube
+        self.axes = mock.sentinel.axes
+        self.patch('IPython.display.display')
+        mockers = [mock.Mock(value=0) for i in range(20)]
+        self.patch('ipywidgets.SelectionSlider', side_effect=mockers)
+        self.patch('ipywidgets.VBox')
+        self.patch('ipywidgets.HBox')
+        self.patch('ipywidgets.Label')
+        self.patch('cube_browser.slicing.disk_chunks', return_value=None)
+
+    def test_levels(self):
+        upper = Contour(self.cube, self.axes)
+        upper.alias(upper=0)
+        lower = Contour(self.cube, self.axes)
+        lower.alias(lower=0)
+        browser = Browser([upper, lower])
+        browser._slider_by_name['time'].value = 2
+        browser._slider_by_name['upper'].value = 1
+        browser._slider_by_name['lower'].value = 2
+        browser._batch_fetch(browser._requests([upper, lower]))
+        # A single read of the contiguous block of both levels.
+        self.assertEqual(upper.slicer.stats['reads'], 1)
+        self.assertEqual(lower.slicer.stats['reads'], 0)
+        subcube = upper.cache[upper._key(time=2, upper=1)]
+        self.assertArrayEqual(subcube.data, self.data[1, 2])
+        subcube = lower.cache[lower._key(time=2, lower=2)]
+        self.assertArrayEqual(subcube.data, self.data[2, 2])
+
+    def test_same_slice(self):
+        c1 = Contour(self.cube, self.axes)
+        c2 = Contour(self.cube, self.axes)
+        browser = Browser([c1, c2])
+        browser._batch_fetch(browser._requests([c1, c2]))
+        # The plots share a cache, so fetch the slice as usual.
+        self.assertEqual(c1.slicer.stats['reads'], 0)
+        self.assertEqual(len(c1.cache), 0)
+
+    def test_disjoint(self):
+        upper = Contour(self.cube, self.axes)
+        upper.alias(upper=0)
+        lower = Contour(self.cube, self.axes)
+        lower.alias(lower=0)
+        browser = Browser([upper, lower])
+        browser._slider_by_name['upper'].value = 0
+        browser._slider_by_name['lower'].value = 4
+        browser._batch_fetch(browser._requests([upper, lower]))
+        self.assertEqual(upper.slicer.stats['reads'], 0)
+
+    def test_not_integer(self):
+        upper = Contour(self.cube, self.axes)
+        upper.alias(upper=0)
+        lower = Contour(self.cube, self.axes)
+        lower.alias(lower=0)
+        browser = Browser([upper, lower])
+        browser._slider_by_name['upper'].value = mock.sentinel.upper
+        browser._slider_by_name['lower'].value = mock.sentinel.lower
+        read_block = self.patch('cube_browser.Plot2D._read_block')
+        browser._batch_fetch(browser._requests([upper, lower]))
+        # Left for the plots to fetch their own.
+        self.assertEqual(read_block.call_count, 0)
+        self.assertEqual(len(upper.cache), 0)
+
+
+class Test_export_frames(tests.IrisTest):
+    def setUp(self):
+        self.cube = realistic_3d()
+        self.axes = mock.sentinel.axes
+        self.patch('IPython.display.display')
+        mockers = [mock.Mock(value=2) for i in range(20)]
+        self.patch('ipywidgets.SelectionSlider', side_effect=mockers)
+        self.patch('ipywidgets.VBox')
+        self.patch('ipywidgets.HBox')
+        self.patch('ipywidgets.Label')
+        self.definition = mock.sentinel.definition
+        self.define = self.patch('cube_browser.figure_definition',
+                                 return_value=self.definition)
+        self.states = []
+
+        def render_frames(definition, states, processes=None):
+            for state in states:
+                self.states.append(state)
+                yield state
+
+        self.render = self.patch('cube_browser.render_frames',
+                                 side_effect=render_frames)
+        self.write = self.patch('cube_browser.write_frames',
+                                side_effect=lambda images, filename, fps:
+                                len(list(images)))
+
+    def test_slider_name(self):
+        other = _add_levels(self.cube, 3)
+        c1 = Contour(self.cube, self.axes)
+        c2 = Contour(other, self.axes)
+        browser = Browser([c1, c2])
+        result = browser.export_frames('movie.mp4', name='time',
+                                       processes=4, fps=5)
+        self.assertEqual(result, 7)
+        expected = [dict(time=time, model_level_number=2)
+                    for time in range(7)]
+        self.assertEqual(self.states, expected)
+        self.define.assert_called_once_with(
+            [c1, c2], [['time'], ['model_level_number', 'time']], dpi=None)
+        _, kwargs = self.render.call_args
+        self.assertEqual(kwargs, dict(processes=4))
+        args, kwargs = self.write.call_args
+        self.assertEqual(args[1], 'movie.mp4')
+        self.assertEqual(kwargs, dict(fps=5))
+
+    def test_frames(self):
+        plot = Contour(self.cube, self.axes)
+        browser = Browser(plot)
+        frames = [dict(time=5), dict(time=0), dict()]
+        result = browser.export_frames('{:02d}.png', frames=frames)
+        self.assertEqual(result, 3)
+        self.assertEqual(self.states, [dict(time=5), dict(time=0),
+                                       dict(time=2)])
+
+    def test_bad_name(self):
+        plot = Contour(self.cube, self.axes)
+        browser = Browser(plot)
+        emsg = "requires frames, or the name of a slider, got 'height'"
+        with self.assertRaisesRegexp(ValueError, emsg):
+            browser.export_frames('movie.mp4', name='height')
+
+    def test_bad_frame(self):
+        plot = Contour(self.cube, self.axes)
+        browser = Browser(plot)
+        emsg = "frame has unknown slider names \\['height'\\]"
+        with self.assertRaisesRegexp(ValueError, emsg):
+            browser.export_frames('movie.mp4', frames=[dict(height=1)])
+
+
+class Test___init____sliders(tests.IrisTest):
+    def setUp(self):
+        self.cube = realistic_3d()
+        self.axes = mock.sentinel.axes
+        self.selection = self.patch('ipywidgets.SelectionSlider')
+        self.int_slider = self.patch('ipywidgets.IntSlider',
+                                     return_value=mock.Mock(value=0))
+        self.patch('ipywidgets.VBox')
+        self.patch('ipywidgets.HBox')
+        self.label = self.patch('ipywidgets.Label')
+
+    def test_selection_slider(self):
+        plot = Contour(self.cube, self.axes)
+        Browser(plot)
+        self.assertEqual(self.int_slider.call_count, 0)
+        _, kwargs = self.selection.call_args
+        coord = self.cube.coord('time')
+        dates = coord.units.num2date(coord.points)
+        expected = list(zip(dates, range(7)))
+        self.assertEqual(list(kwargs['options'].items()), expected)
+
+    def test_selection_slider_vectorised(self):
+        plot = Contour(self.cube, self.axes)
+        patch = 'cf_units.Unit.num2date'
+        with mock.patch(patch, return_value=range(7)) as num2date:
+            Browser(plot)
+        self.assertEqual(num2date.call_count, 1)
+
+    def test_int_slider(self):
+        plot = Contour(self.cube, self.axes)
+        browser = Browser(plot, max_options=6)
+        self.assertEqual(self.selection.call_count, 0)
+        self.int_slider.assert_called_once_with(min=0, max=6, readout=False)
+        coord = self.cube.coord('time')
+        expected = u'{}'.format(coord.units.num2date(coord.points[0]))
+        self.assertIn(mock.call(expected), self.label.call_args_list)
+        self.assertEqual(list(browser._readout_by_name.keys()), ['time'])
+
+    def test_int_slider_readout(self):
+        plot = Contour(self.cube, self.axes)
+        browser = Browser(plot, max_options=6)
+        slider = browser._slider_by_name['time']
+        browser._handle_readout(dict(owner=slider, new=3))
+        coord = self.cube.coord('time')
+        expected = u'{}'.format(coord.units.num2date(coord.points[3]))
+        self.assertEqual(browser._readout_by_name['time'].value, expected)
+
+    def test_int_slider_alias(self):
+        plot = Contour(self.cube, self.axes)
+        plot.alias(wibble=0)
+        browser = Browser(plot, max_options=6)
+        slider = browser._slider_by_name['wibble']
+        browser._handle_readout(dict(owner=slider, new=4))
+        self.assertEqual(browser._readout_by_name['wibble'].value, u'4')
+
+
+class Test_on_change__scheduler(tests.IrisTest):
+    def setUp(self):
+        self.cube = realistic_3d()
+        self.axes = mock.sentinel.axes
+        self.patch('IPython.display.display')
+        mockers = [mock.Mock(value=0) for i in range(20)]
+        self.patch('ipywidgets.SelectionSlider', side_effect=mockers)
+        self.patch('ipywidgets.VBox')
+        self.patch('ipywidgets.HBox')
+        self.patch('ipywidgets.Label')
+        self.patch('cube_browser.Plot2D.legend')
+
+    def test_disabled(self):
+        plot = Contour(self.cube, self.axes)
+        browser = Browser(plot)
+        self.assertIsNone(browser.scheduler)
+
+    def test_coalesced(self):
+        c1 = Contour(self.cube, self.axes)
+        other = _add_levels(self.cube, 5)
+        c2 = Contour(other, self.axes)
+        browser = Browser([c1, c2], max_fps=5)
+        callbacks = []
+        browser.scheduler._call_later = lambda delay, callback: \
+            callbacks.append(callback)
+        with mock.patch('cube_browser.Contour.__call__') as func:
+            time = browser._slider_by_name['time']
+            level = browser._slider_by_name['model_level_number']
+            for slider, value in [(time, 1), (level, 2), (time, 3)]:
+                slider.value = value
+                browser.on_change(dict(owner=slider))
+            self.assertEqual(func.call_count, 0)
+            self.assertEqual(len(callbacks), 1)
+            callbacks[0]()
+            # Each plot is rendered once with the latest slider state.
+            expected = [mock.call(model_level_number=2, time=3),
+                        mock.call(time=3)]
+            self.assertEqual(func.call_args_list, expected)
+
+
+class Test_play(tests.IrisTest):
+    def setUp(self):
+        self.cube = realistic_3d()
+        self.axes = mock.sentinel.axes
+        self.patch('IPython.display.display')
+        mockers = [mock.Mock(value=0) for i in range(20)]
+        self.patch('ipywidgets.SelectionSlider', side_effect=mockers)
+        buttons = [mock.Mock(value=False) for i in range(20)]
+        self.patch('ipywidgets.ToggleButton', side_effect=buttons)
+        self.patch('ipywidgets.VBox')
+        self.patch('ipywidgets.HBox')
+        self.patch('ipywidgets.Label')
+        self.patch('cube_browser.Plot2D.legend')
+        self.c1 = Contour(self.cube, self.axes)
+        self.c2 = Contour(_add_levels(self.cube, 5), self.axes)
+        self.browser = Browser([self.c1, self.c2], play_fps=5)
+        self.callbacks = []
+        self.browser.player._call_later = lambda delay, callback: \
+            self.callbacks.append(callback)
+
+    def test_disabled(self):
+        browser = Browser(self.c1)
+        self.assertIsNone(browser.player)
+        with self.assertRaisesRegexp(ValueError, 'requires a play_fps'):
+            browser.play('time')
+
+    def test_unknown_slider(self):
+        with self.assertRaisesRegexp(ValueError, "has no slider 'wibble'"):
+            self.browser.play('wibble')
+
+    def test_linked_plots(self):
+        buttons = self.browser._play_button_by_name
+        with mock.patch('cube_browser.Contour.__call__') as func:
+            self.browser.play('time')
+            self.assertTrue(buttons['time'].value)
+            self.assertFalse(buttons['model_level_number'].value)
+            self.callbacks.pop(0)()
+            self.assertEqual(self.browser._slider_by_name['time'].value, 1)
+            # Both plots of the slider render the frame.
+            expected = [mock.call(time=1),
+                        mock.call(model_level_number=0, time=1)]
+            self.assertEqual(func.call_args_list, expected)
+        self.assertEqual(self.browser.player.rendered, 1)
+        self.assertEqual(len(self.callbacks), 1)
+
+    def test_wrap_around(self):
+        self.browser._slider_by_name['time'].value = 6
+        with mock.patch('cube_browser.Contour.__call__'):
+            self.browser.play('time')
+            self.callbacks.pop(0)()
+        self.assertEqual(self.browser._slider_by_name['time'].value, 0)
+
+    def test_pause(self):
+        player = self.browser.player
+        with mock.patch('cube_browser.Contour.__call__') as func:
+            self.browser.play('time')
+            player.coarsen = 4
+            self.callbacks.pop(0)()
+            self.assertEqual(self.c1.coarsen, 4)
+            self.assertEqual(self.c2.coarsen, 4)
+            self.browser.pause()
+            # The frame is rendered again at full quality.
+            self.assertEqual(func.call_count, 4)
+        self.assertEqual(self.c1.coarsen, 1)
+        self.assertEqual(self.c2.coarsen, 1)
+        self.assertFalse(player.playing)
+        self.assertFalse(self.browser._play_button_by_name['time'].value)
+        self.assertEqual(self.browser._slider_by_name['time'].value, 1)
+
+    def test_render_error(self):
+        player = self.browser.player
+        with mock.patch('cube_browser.Contour.__call__') as func:
+            self.browser.play('time')
+            player.coarsen = 4
+            func.side_effect = [RuntimeError('render failed'), None, None]
+            with self.assertRaisesRegexp(RuntimeError, 'render failed'):
+                self.callbacks.pop(0)()
+            # The frame is rendered again at full quality.
+            self.assertEqual(func.call_count, 3)
+        self.assertEqual(self.c1.coarsen, 1)
+        self.assertEqual(self.c2.coarsen, 1)
+        self.assertFalse(player.playing)
+        self.assertIsNone(self.browser._playing)
+        self.assertFalse(self.browser._play_button_by_name['time'].value)
+        self.assertEqual(self.callbacks, [])
+
+    def test_switch(self):
+        buttons = self.browser._play_button_by_name
+        self.browser.play('time')
+        self.browser.play('model_level_number')
+        self.assertFalse(buttons['time'].value)
+        self.assertTrue(buttons['model_level_number'].value)
+        self.assertTrue(self.browser.player.playing)
+
+    def test_play_button(self):
+        button = self.browser._play_button_by_name['time']
+        self.browser._handle_play(dict(owner=button, new=True))
+        self.assertTrue(self.browser.player.playing)
+        self.browser._handle_play(dict(owner=button, new=False))
+        self.assertFalse(self.browser.player.playing)
+
+
+class Test_on_change__background(tests.IrisTest):
+    def setUp(self):
+        self.cube = realistic_3d()
+        self.axes = mock.sentinel.axes
+        self.patch('IPython.display.display')
+        mockers = [mock.Mock(value=0) for i in range(20)]
+        self.patch('ipywidgets.SelectionSlider', side_effect=mockers)
+        self.patch('ipywidgets.VBox')
+        self.patch('ipywidgets.HBox')
+        self.patch('ipywidgets.Label')
+        self.patch('cube_browser.Plot2D.legend')
+        self.draw = self.patch('cube_browser.Contour.draw')
+        self.c1 = Contour(self.cube, self.axes)
+        self.c2 = Contour(_add_levels(self.cube, 5), self.axes)
+        self.browser = Browser([self.c1, self.c2], background=True)
+        self.callbacks = []
+        self.browser.pipeline.shutdown()
+        self.browser.pipeline = RenderPipeline(
+            call_soon=lambda callback, *args:
+            self.callbacks.append((callback, args)))
+
+    def tearDown(self):
+        self.browser.pipeline.shutdown()
+
+    def _change(self, name, value):
+        slider = self.browser._slider_by_name[name]
+        slider.value = value
+        self.browser.on_change(dict(owner=slider))
+
+    def _run_loop(self):
+        self.browser.pipeline._executor.shutdown(wait=True)
+        for callback, args in self.callbacks:
+            callback(*args)
+
+    def test_disabled(self):
+        browser = Browser(self.c1)
+        self.assertIsNone(browser.pipeline)
+
+    def test_deferred(self):
+        self._change('time', 1)
+        self._run_loop()
+        self.assertEqual(self.draw.call_count, 2)
+        self.assertEqual(self.c1.subcube, self.cube[1])
+        self.assertEqual(self.c2.subcube, self.c2.cube[0, 1])
+        self.assertEqual(self.browser.pipeline.committed, 1)
+
+    def test_latest_frame(self):
+        self._change('time', 1)
+        self._change('time', 2)
+        self._run_loop()
+        # Only the newest frame of each plot is drawn.
+        self.assertEqual(self.draw.call_count, 2)
+        self.assertEqual(self.c1.subcube, self.cube[2])
+        self.assertEqual(self.c2.subcube, self.c2.cube[0, 2])
+
+    def test_other_plots(self):
+        self._change('time', 1)
+        self._change('model_level_number', 3)
+        self._run_loop()
+        # The level change only supersedes the render of its own plot.
+        self.assertEqual(self.draw.call_count, 2)
+        self.assertEqual(self.c1.subcube, self.cube[1])
+        self.assertEqual(self.c2.subcube, self.c2.cube[3, 1])
+
+    def test_fetch_error(self):
+        fetch = self.patch('cube_browser.Browser._batch_fetch',
+                           side_effect=[IOError('read failed'), None])
+        self._change('time', 1)
+        with warnings.catch_warnings(record=True):
+            warnings.simplefilter('always')
+            self._run_loop()
+        # The plots are redrawn directly instead.
+        self.assertEqual(fetch.call_count, 2)
+        self.assertEqual(self.draw.call_count, 2)
+        self.assertEqual(self.c1.subcube, self.cube[1])
+        self.assertEqual(self.c2.subcube, self.c2.cube[0, 1])
+        self.assertEqual(self.browser.pipeline.fallbacks, 1)
+
+    def test_close(self):
+        shutdown = self.patch('cube_browser.pipeline.RenderPipeline.shutdown')
+        self.browser.close()
+        shutdown.assert_called_once_with(wait=False)
+
+
+class Test_stats(tests.IrisTest):
+    def setUp(self):
+        self.cube = realistic_3d()
+        self.axes = mock.sentinel.axes
+        self.patch('IPython.display.display')
+        mockers = [mock.Mock(value=0) for i in range(20)]
+        self.patch('ipywidgets.SelectionSlider', side_effect=mockers)
+        self.patch('ipywidgets.VBox')
+        self.patch('ipywidgets.HBox')
+        self.patch('ipywidgets.Label')
+        self.patch('cube_browser.Plot2D.legend')
+        self.patch('cube_browser.Contour.draw')
+
+    def test_plot_names(self):
+        c1 = Contour(self.cube, self.axes)
+        c2 = Contour(self.cube, self.axes)
+        browser = Browser([c1, c2])
+        self.assertIs(c1.stats, browser.stats)
+        self.assertIs(c2.stats, browser.stats)
+        self.assertEqual(c1.stats_name, 'Contour[0]')
+        self.assertEqual(c2.stats_name, 'Contour[1]')
+
+    def test_spans(self):
+        plot = Contour(self.cube, self.axes)
+        browser = Browser(plot)
+        browser.on_change(None)
+        slider = browser._slider_by_name['time']
+        slider.value = 1
+        browser.on_change(dict(owner=slider))
+        # Revisit a cached slice.
+        slider.value = 0
+        browser.on_change(dict(owner=slider))
+        expected = ['initial', 'Contour[0].slice', 'Contour[0].realise',
+                    'Contour[0].draw', 'event']
+        self.assertEqual(sorted(browser.stats.names), sorted(expected))
+        stats = browser.stats.to_dict()
+        self.assertEqual(stats['event']['count'], 2)
+        self.assertEqual(stats['Contour[0].slice']['count'], 2)
+        self.assertEqual(stats['Contour[0].draw']['count'], 3)
+
+    def test_canvas_latency(self):
+        canvas = mock.Mock()
+        axes = mock.Mock(figure=mock.Mock(canvas=canvas))
+        plot = Contour(self.cube, axes)
+        browser = Browser(plot)
+        slider = browser._slider_by_name['time']
+        browser.on_change(dict(owner=slider))
+        canvas.mpl_connect.assert_called_once_with('draw_event',
+                                                   browser._handle_draw)
+        browser._handle_draw(mock.Mock(canvas=canvas))
+        self.assertEqual(browser.stats.summary('canvas')['count'], 1)
+        # Only the first draw after a change is recorded.
+        browser._handle_draw(mock.Mock(canvas=canvas))
+        self.assertEqual(browser.stats.summary('canvas')['count'], 1)
+
+
 if __name__ == '__main__':
     tests.main()
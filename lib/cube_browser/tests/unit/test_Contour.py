@@ -6,13 +6,20 @@ from six.moves import (filter, input, map, range, zip)  # noqa
 # before importing anything else.
 import iris.tests as tests
 
+from concurrent.futures import ThreadPoolExecutor
+
+import cartopy.crs as ccrs
 from cartopy.mpl.geoaxes import GeoAxesSubplot
 import iris.plot as iplt
 from iris.tests.stock import realistic_3d
 from matplotlib.contour import QuadContourSet
 import matplotlib.pyplot as plt
+import numpy as np
 
 from cube_browser import Contour
+from cube_browser.contour import CachedContourSet
+from cube_browser.grids import project_grid
+from cube_browser.limits import Limits
 
 
 class Test___call__(tests.IrisTest):
@@ -33,5 +40,141 @@ class Test___call__(tests.IrisTest):
             self.assertEqual(self.cube[index], plot.subcube)
 
 
+class Test_draw__geometry_cache(tests.IrisTest):
+    def setUp(self):
+        self.cube = realistic_3d()
+        self.coords = ('grid_longitude', 'grid_latitude')
+        projection = iplt.default_projection(self.cube)
+        self.ax = plt.subplot(111, projection=projection)
+
+    def test_revisit(self):
+        plot = Contour(self.cube, self.ax, coords=self.coords)
+        first = plot(time=0)
+        expected = [seg.copy() for segs in first.allsegs for seg in segs]
+        plot.clear()
+        plot(time=1)
+        plot.clear()
+        with tests.mock.patch('iris.plot.contour') as func:
+            element = plot(time=0)
+        self.assertEqual(func.call_count, 0)
+        self.assertIsInstance(element, CachedContourSet)
+        self.assertIs(element, plot.element)
+        self.assertArrayEqual(element.levels, first.levels)
+        segs = [seg for segs in element.allsegs for seg in segs]
+        self.assertEqual(len(segs), len(expected))
+        for seg, other in zip(segs, expected):
+            self.assertArrayEqual(seg, other)
+        self.assertEqual(len(plot.geometry_cache), 2)
+        self.assertEqual(len(element.collections), len(first.collections))
+
+    def test_levels_change(self):
+        plot = Contour(self.cube, self.ax, coords=self.coords)
+        plot(time=0)
+        plot.clear()
+        plot.kwargs['levels'] = [280, 290, 300]
+        element = plot(time=0)
+        self.assertNotIsInstance(element, CachedContourSet)
+        self.assertEqual(len(plot.geometry_cache), 2)
+
+    def test_unsupported(self):
+        self.patch('cube_browser.GEOMETRY_REUSE', False)
+        plot = Contour(self.cube, self.ax, coords=self.coords)
+        plot(time=0)
+        plot.clear()
+        element = plot(time=0)
+        # Every slice is contoured, and no geometry is cached.
+        self.assertIsInstance(element, QuadContourSet)
+        self.assertNotIsInstance(element, CachedContourSet)
+        self.assertEqual(len(plot.geometry_cache), 0)
+
+
+class Test_draw__projected_grid(tests.IrisTest):
+    def setUp(self):
+        self.cube = realistic_3d()
+        self.coords = ('grid_longitude', 'grid_latitude')
+        self.ax = plt.subplot(111, projection=ccrs.PlateCarree())
+
+    def test_projected_once(self):
+        plot = Contour(self.cube, self.ax, coords=self.coords)
+        with tests.mock.patch('cube_browser.project_grid',
+                              wraps=project_grid) as func:
+            with tests.mock.patch('iris.plot.contour') as contour:
+                for index in range(3):
+                    element = plot(time=index)
+                    self.assertIsInstance(element, QuadContourSet)
+                    plot.clear()
+        self.assertEqual(func.call_count, 1)
+        self.assertEqual(contour.call_count, 0)
+        self.assertIs(element.get_transform(), self.ax.transData)
+
+
+class Test_precompute(tests.IrisTest):
+    def setUp(self):
+        self.cube = realistic_3d()
+        self.coords = ('grid_longitude', 'grid_latitude')
+        projection = iplt.default_projection(self.cube)
+        self.ax = plt.subplot(111, projection=projection)
+        # Run the workers in-process.
+        self.patch('cube_browser.process_executor', ThreadPoolExecutor)
+
+    def test_no_levels(self):
+        plot = Contour(self.cube, self.ax, coords=self.coords)
+        emsg = 'requires contour levels to precompute'
+        with self.assertRaisesRegexp(ValueError, emsg):
+            plot.precompute(time=range(3))
+
+    def test_range(self):
+        plot = Contour(self.cube, self.ax, coords=self.coords)
+        plot(time=0)
+        plot.clear()
+        result = plot.precompute(processes=2, time=range(4))
+        self.assertEqual(result, 3)
+        self.assertEqual(len(plot.geometry_cache), 4)
+        with tests.mock.patch('iris.plot.contour') as func:
+            for index in range(4):
+                element = plot(time=index)
+                self.assertIsInstance(element, CachedContourSet)
+                plot.clear()
+        self.assertEqual(func.call_count, 0)
+
+    def test_unsupported(self):
+        self.patch('cube_browser.GEOMETRY_REUSE', False)
+        plot = Contour(self.cube, self.ax, coords=self.coords)
+        plot(time=0)
+        self.assertEqual(plot.precompute(time=range(4)), 0)
+        self.assertEqual(len(plot.geometry_cache), 0)
+
+
+class Test_apply_limits(tests.IrisTest):
+    def setUp(self):
+        self.cube = realistic_3d()
+        self.coords = ('grid_longitude', 'grid_latitude')
+        projection = iplt.default_projection(self.cube)
+        self.ax = plt.subplot(111, projection=projection)
+        self.limits = Limits(0., 100., np.ones(100, dtype=np.int64),
+                             np.linspace(0, 100, 101))
+
+    def test_before_render(self):
+        plot = Contour(self.cube, self.ax, coords=self.coords)
+        plot.apply_limits(self.limits, mode='minmax')
+        self.assertArrayEqual(plot.kwargs['levels'], np.linspace(0, 100, 10))
+
+    def test_number_of_levels(self):
+        plot = Contour(self.cube, self.ax, coords=self.coords, levels=5)
+        plot.apply_limits(self.limits, mode='minmax')
+        self.assertArrayEqual(plot.kwargs['levels'], [0, 25, 50, 75, 100])
+
+    def test_after_render(self):
+        plot = Contour(self.cube, self.ax, coords=self.coords,
+                       levels=[1, 2, 3])
+        plot(time=0)
+        with tests.mock.patch('iris.plot.contour') as func:
+            plot.apply_limits(self.limits, mode='minmax')
+        # The latest slice is re-rendered with the new levels.
+        self.assertEqual(func.call_count, 1)
+        _, kwargs = func.call_args
+        self.assertArrayEqual(kwargs['levels'], [0, 50, 100])
+
+
 if __name__ == '__main__':
     tests.main()
@@ -6,13 +6,17 @@ from six.moves import (filter, input, map, range, zip)  # noqa
 # before importing anything else.
 import iris.tests as tests
 
+import cartopy.crs as ccrs
 from cartopy.mpl.geoaxes import GeoAxesSubplot
 import iris.plot as iplt
 from iris.tests.stock import realistic_3d
 from matplotlib.collections import QuadMesh
 import matplotlib.pyplot as plt
+import numpy as np
 
 from cube_browser import Pcolormesh
+from cube_browser.grids import project_grid
+from cube_browser.limits import Limits
 
 
 class Test__call__(tests.IrisTest):
@@ -58,5 +62,153 @@ class Test__call__(tests.IrisTest):
             self.assertEqual(self.cube[index], plot.subcube)
 
 
+class Test_draw__in_place(tests.IrisTest):
+    def setUp(self):
+        self.cube = realistic_3d()
+        self.coords = ('grid_longitude', 'grid_latitude')
+        projection = iplt.default_projection(self.cube)
+        self.ax = plt.subplot(111, projection=projection)
+
+    def test_same_grid(self):
+        plot = Pcolormesh(self.cube, self.ax, coords=self.coords)
+        element = plot(time=0)
+        with tests.mock.patch('iris.plot.pcolormesh') as pcolormesh:
+            for index in range(1, self.cube.shape[0]):
+                plot.clear()
+                self.assertFalse(element.get_visible())
+                result = plot(time=index)
+                self.assertIs(result, element)
+                self.assertTrue(element.get_visible())
+                expected = self.cube[index].data.ravel()
+                self.assertArrayEqual(element.get_array(), expected)
+            self.assertEqual(pcolormesh.call_count, 0)
+        self.assertEqual(self.ax.collections, [element])
+
+    def test_transposed(self):
+        coords = ('grid_latitude', 'grid_longitude')
+        plot = Pcolormesh(self.cube, self.ax, coords=coords)
+        element = plot(time=0)
+        plot.clear()
+        self.assertIs(plot(time=1), element)
+        expected = self.cube[1].data.T.ravel()
+        self.assertArrayEqual(element.get_array(), expected)
+
+    def test_grid_change(self):
+        plot = Pcolormesh(self.cube, self.ax, coords=self.coords)
+        element = plot(time=0)
+        plot.clear()
+        # Cause the next slice to be on a different grid.
+        subcube = self.cube[1]
+        subcube.coord('grid_latitude').points = \
+            subcube.coord('grid_latitude').points + 1
+        plot.cache[plot._key(time=1)] = subcube
+        result = plot(time=1)
+        self.assertIsNot(result, element)
+        self.assertIsNone(element.axes)
+        self.assertEqual(self.ax.collections, [result])
+
+
+class Test_draw__projected_grid(tests.IrisTest):
+    def setUp(self):
+        self.cube = realistic_3d()
+        self.coords = ('grid_longitude', 'grid_latitude')
+        self.ax = plt.subplot(111, projection=ccrs.PlateCarree())
+
+    def test_projected_once(self):
+        plot = Pcolormesh(self.cube, self.ax, coords=self.coords)
+        with tests.mock.patch('cube_browser.project_grid',
+                              wraps=project_grid) as func:
+            for index in range(3):
+                plot._remove()
+                element = plot(time=index)
+                self.assertIsInstance(element, QuadMesh)
+        self.assertEqual(func.call_count, 1)
+        coords = element.get_coordinates()
+        self.assertEqual(coords.shape, (10, 12, 2))
+        expected = self.cube[2].data.ravel()
+        self.assertArrayEqual(element.get_array(), expected)
+
+    def test_projection_change(self):
+        plot = Pcolormesh(self.cube, self.ax, coords=self.coords)
+        plot(time=0)
+        grids = plot._grids
+        plot.axes = plt.subplot(111, projection=ccrs.Mercator())
+        plot._remove()
+        plot(time=0)
+        self.assertIsNot(plot._grids, grids)
+        self.assertEqual(len(plot._grids), 1)
+
+
+class Test_cell_bounds(tests.IrisTest):
+    def setUp(self):
+        self.cube = realistic_3d()
+        self.coords = ('grid_longitude', 'grid_latitude')
+        for coord in self.coords:
+            self.cube.coord(coord).bounds = None
+        self.axes = tests.mock.sentinel.axes
+
+    def test_guessed_once(self):
+        plot = Pcolormesh(self.cube, self.axes, coords=self.coords)
+        # Calculate the cell bounds up front.
+        plot.cell_bounds
+        patch = 'iris.coords.DimCoord.guess_bounds'
+        with tests.mock.patch(patch) as guess_bounds:
+            with tests.mock.patch('iris.plot.pcolormesh'):
+                for index in range(self.cube.shape[0]):
+                    plot.clear()
+                    plot(time=index)
+                    for coord in self.coords:
+                        coord = plot.subcube.coord(coord)
+                        self.assertTrue(coord.has_bounds())
+        self.assertEqual(guess_bounds.call_count, 0)
+        for coord in self.coords:
+            self.assertFalse(self.cube.coord(coord).has_bounds())
+
+    def test_guessed(self):
+        plot = Pcolormesh(self.cube, self.axes, coords=self.coords)
+        for coord, bounds in zip(self.coords, plot.cell_bounds):
+            coord = self.cube.coord(coord).copy()
+            coord.guess_bounds()
+            self.assertArrayEqual(bounds, coord.bounds)
+        self.assertIs(plot.cell_bounds, plot.cell_bounds)
+
+    def test_existing(self):
+        coord = self.cube.coord('grid_latitude')
+        bounds = np.stack([coord.points - 0.1, coord.points + 0.1], axis=-1)
+        coord.bounds = bounds
+        plot = Pcolormesh(self.cube, self.axes, coords=self.coords)
+        self.assertArrayEqual(plot.cell_bounds[1], bounds)
+
+    def test_anonymous(self):
+        coords = (2, 'grid_latitude')
+        self.cube.remove_coord('grid_longitude')
+        plot = Pcolormesh(self.cube, self.axes, coords=coords)
+        self.assertIsNone(plot.cell_bounds[0])
+
+
+class Test_apply_limits(tests.IrisTest):
+    def setUp(self):
+        self.cube = realistic_3d()
+        self.coords = ('grid_longitude', 'grid_latitude')
+        projection = iplt.default_projection(self.cube)
+        self.ax = plt.subplot(111, projection=projection)
+        self.limits = Limits(0., 100., np.ones(100, dtype=np.int64),
+                             np.linspace(0, 100, 101))
+
+    def test_before_render(self):
+        plot = Pcolormesh(self.cube, self.ax, coords=self.coords)
+        plot.apply_limits(self.limits, mode='minmax')
+        self.assertEqual(plot.kwargs['clim'], (0, 100))
+        element = plot(time=0)
+        self.assertEqual(element.get_clim(), (0, 100))
+
+    def test_after_render(self):
+        plot = Pcolormesh(self.cube, self.ax, coords=self.coords)
+        element = plot(time=0)
+        plot.apply_limits(self.limits, percentiles=(10, 90))
+        self.assertArrayAlmostEqual(element.get_clim(), (10, 90))
+        self.assertArrayAlmostEqual(plot.kwargs['clim'], (10, 90))
+
+
 if __name__ == '__main__':
     tests.main()
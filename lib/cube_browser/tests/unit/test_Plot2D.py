@@ -6,14 +6,19 @@ from six.moves import (filter, input, map, range, zip)  # noqa
 # before importing anything else.
 import iris.tests as tests
 
-from weakref import WeakValueDictionary
+import os
+import shutil
+import tempfile
+import threading
 import warnings
 
+import biggus
 from iris.coords import AuxCoord
 from iris.tests.stock import realistic_3d
 import numpy as np
 
 from cube_browser import Plot2D, _AxisAlias, _AxisDefn
+from cube_browser.cache import SliceCache
 
 
 class Test__default_coords(tests.IrisTest):
@@ -356,15 +361,19 @@ class Test_cache(tests.IrisTest):
     def test_cache_create(self):
         self.assertIsNone(self.plot._cache)
         cache = self.plot.cache
-        self.assertIsInstance(cache, WeakValueDictionary)
-        self.assertEqual(cache, {})
+        self.assertIsInstance(cache, SliceCache)
+        self.assertEqual(len(cache), 0)
 
     def test_bad_cache_setter(self):
-        emsg = ("Require cache to be a 'WeakValueDictionary', "
-                "got 'dict'")
+        emsg = "Require cache to be a 'SliceCache', got 'dict'"
         with self.assertRaisesRegexp(TypeError, emsg):
             self.plot.cache = dict()
 
+    def test_cache_setter(self):
+        cache = SliceCache(max_bytes=0)
+        self.plot.cache = cache
+        self.assertIs(self.plot.cache, cache)
+
     def test_cache_lookup(self):
         index = 0
         kwargs = dict(time=index)
@@ -380,6 +389,172 @@ class Test_cache(tests.IrisTest):
         self.assertIn(key, cache)
         self.assertEqual(cache[key], expected)
 
+    def test_cache_revisit(self):
+        kwargs = dict(time=0)
+        self.plot(**kwargs)
+        subcube = self.plot.subcube
+        self.plot(time=1)
+        self.plot(**kwargs)
+        # The revisited slice is served from the cache.
+        self.assertIs(self.plot.subcube, subcube)
+        stats = self.plot.cache.stats
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 2)
+
+
+class Test___init____lod(tests.IrisTest):
+    def setUp(self):
+        self.cube = realistic_3d()
+        self.axes = tests.mock.sentinel.axes
+
+    def test_default(self):
+        plot = Plot2D(self.cube, self.axes)
+        self.assertIsNone(plot.lod)
+        self.assertNotIn('lod', plot.kwargs)
+
+    def test_method(self):
+        plot = Plot2D(self.cube, self.axes, lod='max')
+        self.assertEqual(plot.lod, 'max')
+        self.assertNotIn('lod', plot.kwargs)
+
+    def test_bad_method(self):
+        emsg = ("requires a level-of-detail method of 'mean', 'max', "
+                "'nearest', got 'median'")
+        with self.assertRaisesRegexp(ValueError, emsg):
+            Plot2D(self.cube, self.axes, lod='median')
+
+
+class Test__decimate(tests.IrisTest):
+    def setUp(self):
+        self.cube = realistic_3d()
+        self.axes = tests.mock.Mock()
+        self.subcube = self.cube[0]
+        self.factors = self.patch('cube_browser.screen_factors',
+                                  return_value=(4, 3))
+
+    def test_disabled(self):
+        plot = Plot2D(self.cube, self.axes)
+        self.assertIs(plot._decimate(self.subcube), self.subcube)
+        self.assertEqual(self.factors.call_count, 0)
+        self.assertEqual(self.axes.callbacks.connect.call_count, 0)
+
+    def test_decimated(self):
+        plot = Plot2D(self.cube, self.axes, lod='mean')
+        result = plot._decimate(self.subcube)
+        self.assertEqual(result.shape, (3, 3))
+        self.assertEqual(plot._lod_factors, (4, 3))
+        self.factors.assert_called_once_with(self.axes, [11, 9])
+        # Zooming the axes is monitored once only.
+        plot._decimate(self.subcube)
+        self.assertEqual(self.axes.callbacks.connect.call_count, 2)
+
+    def test_full_resolution(self):
+        self.factors.return_value = (1, 1)
+        plot = Plot2D(self.cube, self.axes, lod='mean')
+        self.assertIs(plot._decimate(self.subcube), self.subcube)
+
+    def test_coarsen(self):
+        plot = Plot2D(self.cube, self.axes)
+        plot.coarsen = 2
+        result = plot._decimate(self.subcube)
+        self.assertEqual(result.shape, (5, 6))
+        self.assertEqual(plot._lod_factors, (2, 2))
+        # The nearest cells are taken without a level-of-detail method.
+        self.assertArrayEqual(result.data, self.subcube.data[::2, ::2])
+        self.assertEqual(self.factors.call_count, 0)
+
+    def test_coarsen_decimated(self):
+        plot = Plot2D(self.cube, self.axes, lod='mean')
+        plot.coarsen = 2
+        result = plot._decimate(self.subcube)
+        self.assertEqual(result.shape, (2, 2))
+        self.assertEqual(plot._lod_factors, (8, 6))
+
+
+class Test_fetch__read_ahead(tests.IrisTest):
+    def setUp(self):
+        self.cube = realistic_3d()
+        self.data = self.cube.data.copy()
+        self.cube.lazy_data(biggus.NumpyArrayAdapter(self.data))
+        self.axes = tests.mock.sentinel.axes
+        self.patcher = self.patch('cube_browser.slicing.disk_chunks',
+                                  return_value=(3, 9, 11))
+
+    def test_chunk_cached(self):
+        plot = Plot2D(self.cube, self.axes)
+        subcube = plot.fetch(time=4)
+        self.assertArrayEqual(subcube.data, self.data[4])
+        cache = plot.cache
+        expected = [(('time', 3),), (('time', 5),), (('time', 4),)]
+        self.assertEqual(cache.keys(), expected)
+        for index in range(3, 6):
+            subcube = cache[(('time', index),)]
+            self.assertEqual(subcube, self.cube[index])
+        # The whole chunk was read from disk once.
+        self.assertEqual(plot.slicer.stats['reads'], 1)
+
+    def test_chunk_copied(self):
+        plot = Plot2D(self.cube, self.axes)
+        plot.fetch(time=4)
+        cache = plot.cache
+        first = cache[(('time', 3),)].data
+        second = cache[(('time', 4),)].data
+        # Each cached sub-cube owns its data, and no view of the block
+        # outlives the bytes charged to the cache.
+        self.assertFalse(np.shares_memory(first, second))
+        self.assertEqual(cache.nbytes, 3 * first.nbytes)
+
+    def test_chunk_mapped(self):
+        dirname = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, dirname)
+        plot = Plot2D(self.cube, self.axes)
+        read_block = plot._read_block
+
+        def read_mapped(block):
+            # Map the block data, as from a shared slice cache.
+            cube = read_block(block)
+            filename = os.path.join(dirname, 'block.npy')
+            np.save(filename, cube.data)
+            cube.data = np.load(filename, mmap_mode='r')
+            return cube
+
+        with tests.mock.patch.object(plot, '_read_block',
+                                     side_effect=read_mapped):
+            plot.fetch(time=4)
+        cache = plot.cache
+        first = cache[(('time', 3),)].data
+        second = cache[(('time', 4),)].data
+        # The cached sub-cubes view the shared mapping of the block.
+        self.assertTrue(np.shares_memory(first, second))
+        self.assertArrayEqual(second, self.data[4])
+
+    def test_chunk_revisit(self):
+        plot = Plot2D(self.cube, self.axes)
+        plot.fetch(time=3)
+        plot.fetch(time=4)
+        plot.fetch(time=5)
+        self.assertEqual(plot.slicer.stats['reads'], 1)
+        self.assertEqual(plot.cache.stats['hits'], 2)
+
+    def test_disabled(self):
+        plot = Plot2D(self.cube, self.axes)
+        plot.read_ahead = False
+        plot.fetch(time=4)
+        self.assertEqual(plot.cache.keys(), [(('time', 4),)])
+
+    def test_exceeds_cache(self):
+        plot = Plot2D(self.cube, self.axes)
+        plot.cache = SliceCache(max_bytes=2 * self.data[0].nbytes)
+        subcube = plot.fetch(time=4)
+        self.assertArrayEqual(subcube.data, self.data[4])
+        self.assertEqual(plot.cache.keys(), [(('time', 4),)])
+
+    def test_unchunked(self):
+        self.patcher.return_value = None
+        plot = Plot2D(self.cube, self.axes)
+        plot.fetch(time=4)
+        self.assertEqual(plot.cache.keys(), [(('time', 4),)])
+
 
 class Test___init____plot_dims(tests.IrisTest):
     def setUp(self):
@@ -611,5 +786,55 @@ class Test_draw(tests.IrisTest):
             plot(time=0)
 
 
+class Test_autoscale(tests.IrisTest):
+    def setUp(self):
+        self.cube = realistic_3d()
+        self.axes = tests.mock.sentinel.axes
+        self.limits = tests.mock.sentinel.limits
+        self.apply = self.patch('cube_browser.Plot2D.apply_limits')
+
+    def test_bad_mode(self):
+        plot = Plot2D(self.cube, self.axes)
+        emsg = 'requires a limits mode of'
+        with self.assertRaisesRegexp(ValueError, emsg):
+            plot.autoscale(mode='median')
+
+    def test_foreground(self):
+        plot = Plot2D(self.cube, self.axes)
+        patch = 'cube_browser.cube_limits'
+        with tests.mock.patch(patch, return_value=self.limits) as limits:
+            result = plot.autoscale(mode='minmax', background=False)
+        self.assertIs(result, self.limits)
+        limits.assert_called_once_with(self.cube, [1, 2], chunks=None)
+        self.apply.assert_called_once_with(self.limits, 'minmax', None, None)
+
+    def _call_soon(self, func, *args):
+        func(*args)
+        self.done.set()
+
+    def test_background(self):
+        plot = Plot2D(self.cube, self.axes)
+        self.done = threading.Event()
+        patch = 'cube_browser.limits.cube_limits'
+        with tests.mock.patch(patch, return_value=self.limits):
+            future = plot.autoscale(nlevels=5, call_soon=self._call_soon)
+            self.done.wait(10)
+        self.assertIs(future.result(), self.limits)
+        self.apply.assert_called_once_with(self.limits, 'robust', None, 5)
+
+    def test_background_failure(self):
+        plot = Plot2D(self.cube, self.axes)
+        self.done = threading.Event()
+        patch = 'cube_browser.limits.cube_limits'
+        with tests.mock.patch(patch, side_effect=ValueError('oops')):
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter('always')
+                plot.autoscale(call_soon=self._call_soon)
+                self.done.wait(10)
+        self.assertEqual(self.apply.call_count, 0)
+        self.assertEqual(len(caught), 1)
+        self.assertIn('failed to autoscale', str(caught[0].message))
+
+
 if __name__ == '__main__':
     tests.main()
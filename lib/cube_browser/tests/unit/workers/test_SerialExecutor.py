@@ -0,0 +1,48 @@
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+"""Unit tests for the `cube_browser.workers.SerialExecutor` class."""
+
+# Import iris.tests first so that some things can be initialised
+# before importing anything else.
+import iris.tests as tests
+
+import threading
+
+from cube_browser.workers import SerialExecutor
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.executor = SerialExecutor()
+        self.addCleanup(self.executor.shutdown)
+
+    def test_lazy(self):
+        self.assertIsNone(self.executor._executor)
+        future = self.executor.submit(pow, 2, 3)
+        self.assertEqual(future.result(), 8)
+        self.assertIsNotNone(self.executor._executor)
+
+    def test_serial(self):
+        calls = []
+        threads = set()
+
+        def call(value):
+            calls.append(value)
+            threads.add(threading.current_thread())
+
+        futures = [self.executor.submit(call, value) for value in range(5)]
+        for future in futures:
+            future.result()
+        self.assertEqual(calls, list(range(5)))
+        self.assertEqual(len(threads), 1)
+
+    def test_shutdown(self):
+        self.executor.submit(pow, 2, 3).result()
+        self.executor.shutdown()
+        self.assertIsNone(self.executor._executor)
+        # The worker thread is started again on the next submission.
+        self.assertEqual(self.executor.submit(pow, 2, 4).result(), 16)
+
+
+if __name__ == '__main__':
+    tests.main()
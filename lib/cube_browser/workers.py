@@ -0,0 +1,83 @@
+"""Worker processes and threads of parallel and background work."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import multiprocessing
+import sys
+import threading
+
+
+def process_context():
+    """
+    Returns the multiprocessing context of worker processes.
+
+    Workers start from a fresh interpreter with the 'forkserver' or
+    'spawn' start method where available. Forking copies the locks of the
+    calling process, and a child forked while a background thread holds
+    a lock, such as the I/O lock of the prefetch or autoscale threads,
+    deadlocks. Python 2 only supports forking, so background threads
+    should be idle while worker processes start.
+
+    """
+    get_context = getattr(multiprocessing, 'get_context', None)
+    if get_context is None:
+        return multiprocessing
+    methods = multiprocessing.get_all_start_methods()
+    method = 'forkserver' if 'forkserver' in methods else 'spawn'
+    return get_context(method)
+
+
+def process_executor(processes=None):
+    """
+    Returns a :class:`concurrent.futures.ProcessPoolExecutor` of the given
+    number of worker processes, which defaults to the number of processors
+    on the machine.
+
+    The workers are started in the :func:`process_context`, where the
+    executor supports it, from Python 3.7.
+
+    """
+    kwargs = {}
+    if sys.version_info >= (3, 7):
+        kwargs['mp_context'] = process_context()
+    return ProcessPoolExecutor(max_workers=processes, **kwargs)
+
+
+class SerialExecutor(object):
+    """
+    Runs submitted calls in the background on a single worker thread, one
+    at a time and in order of submission.
+
+    The worker thread is only started on the first submission, so that
+    importing a module with a module level executor starts no threads.
+
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def submit(self, fn, *args, **kwargs):
+        """
+        Schedule the callable to be called as fn(*args, **kwargs) on the
+        worker thread.
+
+        Returns a :class:`concurrent.futures.Future` of the call.
+
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1)
+            return self._executor.submit(fn, *args, **kwargs)
+
+    def shutdown(self, wait=True):
+        """
+        Release the worker thread, which is started again on the next
+        submission.
+
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
@@ -3,6 +3,7 @@
 from __future__ import print_function
 
 import os
+import sys
 from setuptools import setup
 
 
@@ -43,6 +44,9 @@ def extract_description():
 
 
 install_requires = ['iris']
+if sys.version_info < (3, 2):
+    # Backport of concurrent.futures.
+    install_requires.append('futures')
 
 setup_args = dict(
     name             = NAME,